@@ -1,6 +1,20 @@
+import importlib.util
+import os
 import tkinter as tk
 from tkinter import messagebox
-import csv
+
+try:
+    from berkas_bersama import tambah_baris_csv
+except ImportError:
+    # berkas_bersama ada di folder induk repo: dimuat langsung dari file-nya,
+    # tanpa menambah folder induk ke sys.path (bisa menutupi modul lain)
+    _spec = importlib.util.spec_from_file_location(
+        "berkas_bersama",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "berkas_bersama.py"),
+    )
+    _berkas_bersama = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_berkas_bersama)
+    tambah_baris_csv = _berkas_bersama.tambah_baris_csv
 
 class AplikasiBiodata(tk.Tk):
     def __init__(self):
@@ -221,12 +235,10 @@ class AplikasiBiodata(tk.Tk):
         hasil = f"Nama: {nama}\nNIM: {nim}\nJurusan: {jurusan}\nAlamat: {alamat}\nJenis Kelamin: {jenis_kelamin}"
         messagebox.showinfo("Data Tersimpan", hasil)
 
-        with open("biodata_tersimpan.csv", "a", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
-            if file.tell() == 0:
-                writer.writerow(["Nama", "NIM", "Jurusan", "Alamat", "Jenis Kelamin"])
-            writer.writerow([nama, nim, jurusan, alamat, jenis_kelamin])
-            messagebox.showinfo("arbath@teknohole.com", "Data berhasil disimpan ke file 'biodata_tersimpan.csv'.")
+        # Append ber-lock: aman walau beberapa meja menulis ke file yang sama
+        tambah_baris_csv("biodata_tersimpan.csv", [nama, nim, jurusan, alamat, jenis_kelamin],
+                         header=["Nama", "NIM", "Jurusan", "Alamat", "Jenis Kelamin"])
+        messagebox.showinfo("arbath@teknohole.com", "Data berhasil disimpan ke file 'biodata_tersimpan.csv'.")
 
     def validate_form(self, *args):
         nama_valid = self.var_nama.get().strip() != ""
@@ -1,14 +1,116 @@
+# Hanya modul yang dibutuhkan layar login yang di-import di sini. Modul lain
+# (datetime, re, sqlite3 lewat penyimpanan, ttk lewat jendela_data) di-import
+# di dalam method yang memakainya agar cold start tetap cepat.
+import os
+import sys
+
+if __name__ == "__main__":
+    # Mode satu instance: jika aplikasi sudah berjalan, argumen diserahkan ke sana
+    # dan proses ini keluar sebelum tkinter di-import (lihat instans_tunggal)
+    from instans_tunggal import klaim_instans
+
+    kunci_instans = klaim_instans(os.path.dirname(os.path.abspath(__file__)), sys.argv[1:])
+    if kunci_instans is None:
+        sys.exit(0)
+
 import tkinter as tk
 from tkinter import messagebox
-import datetime
 import logging
-import re
-import os
+import time
+
+import instrumentasi
+from cache_widget import CacheWidget
+from diagnostik import (
+    PelacakMemori,
+    PemantauLag,
+    Profiler,
+    ambang_pemantau_lag,
+    direktori_diagnostik,
+    interval_pelacak_memori,
+)
+from instrumentasi import Laju, ukur
+from log_event import buat_log_event
+from notifikasi import Notifikasi
+
+# Pramuat warm start dimulai setelah layar login sempat tampil
+JEDA_PRAMUAT_MS = 300
+
+
+def hitung_objek_tk(root):
+    """Menghitung jumlah widget dan command Tcl yang hidup di interpreter root."""
+    jumlah_widget = 0
+    antrian = [root]
+    while antrian:
+        widget = antrian.pop()
+        jumlah_widget += 1
+        antrian.extend(widget.winfo_children())
+    jumlah_command = len(root.tk.splitlist(root.tk.call("info", "commands")))
+    return jumlah_widget, jumlah_command
+
+
+class ManajerMenu:
+    """Menu bar yang dibuat sekali lalu dipasang/dilepas per sesi login.
+
+    Sebelumnya setiap login membuat pohon tk.Menu baru dan setiap logout memasang
+    tk.Menu kosong baru, sehingga objek Tcl terus bertambah di kiosk bersama.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        # kunci -> (menu, index entry)
+        self.entry = {}
+        # Entry yang hanya boleh aktif saat ada user login
+        self.entry_sesi = ("simpan", "data", "logout")
+
+        self.menu_bar = tk.Menu(app)
+
+        # Menu File
+        file_menu = tk.Menu(self.menu_bar, tearoff=0)
+        self.menu_bar.add_cascade(label="File", menu=file_menu)
+        self._tambah(file_menu, "simpan", label="Simpan Hasil", command=app.simpan_hasil)
+        self._tambah(file_menu, "data", label="Data Tersimpan", command=app._buka_data_tersimpan)
+        file_menu.add_separator()
+        self._tambah(file_menu, "logout", label="Logout", command=app._logout)
+        file_menu.add_separator()
+        self._tambah(file_menu, "keluar", label="Keluar", command=app.keluar_aplikasi)
+
+        # Menu Help
+        help_menu = tk.Menu(self.menu_bar, tearoff=0)
+        self.menu_bar.add_cascade(label="Help", menu=help_menu)
+        self._tambah(help_menu, "about", label="About", command=app._show_about)
+        self._tambah(help_menu, "profiling", label=app._label_profiling(), command=app._toggle_profiling)
+        if instrumentasi.AKTIF:
+            self._tambah(help_menu, "statistik", label="Statistik Kinerja", command=app._show_statistik)
+
+    def _tambah(self, menu, kunci, **opsi):
+        menu.add_command(**opsi)
+        self.entry[kunci] = (menu, menu.index(tk.END))
+
+    def ubah(self, kunci, **opsi):
+        """Mengubah opsi (label, state, ...) sebuah entry menu tanpa membuat ulang menu."""
+        menu, index = self.entry[kunci]
+        menu.entryconfig(index, **opsi)
+
+    def tampilkan(self):
+        """Memasang menu bar dan mengaktifkan entry sesi."""
+        for kunci in self.entry_sesi:
+            self.ubah(kunci, state=tk.NORMAL)
+        self.app.config(menu=self.menu_bar)
+
+    def sembunyikan(self):
+        """Melepas menu bar dari window dan menonaktifkan entry sesi."""
+        for kunci in self.entry_sesi:
+            self.ubah(kunci, state=tk.DISABLED)
+        self.app.config(menu="")
+
 
 # Membuat kelas utama aplikasi yang mewarisi dari tk.Tk
 class AplikasiBiodata(tk.Tk):
     # Metode __init__ adalah constructor yang akan dijalankan saat objek dibuat
-    def __init__(self):
+    def __init__(self, prebuild_biodata=False, pramuat=False):
+        # Waktu mulai untuk mengukur durasi startup (termasuk pembuatan Tk)
+        mulai_startup = time.perf_counter()
+
         # Memanggil constructor dari kelas induk (tk.Tk)
         super().__init__()
 
@@ -27,6 +129,9 @@ class AplikasiBiodata(tk.Tk):
                             filename=log_file_path,
                             filemode='w')
 
+        # Log event terstruktur (opt-in lewat BIODATA_EVENT_LOG)
+        self.log_event = buat_log_event(self.script_dir)
+
         # Versi Aplikasi
         self.__version__ = "2.2.2" # Versi update bug fix dan background
 
@@ -38,40 +143,188 @@ class AplikasiBiodata(tk.Tk):
         # Mengatur warna background utama
         self.configure(bg="whitesmoke")
         
-        # Database user sederhana (dalam aplikasi nyata, ini akan di database)
-        self.users_db = {
-            "admin": "123",
-            "user1": "password1",
-            "mahasiswa": "123456",
-            "23106050061": "faisal123"
-        }
-
         # Status login
         self.current_user = None
-        self.menu_bar = None
+        self.manajer_menu = None
+        self.data_terakhir = None
+        # Logika bisnis (login, validasi, save, index) ada di BiodataService; lihat property layanan
+        self._layanan = None
+        self.autosave_draf = None
+        self._id_autosave = None
+        self.jendela_data = None
+        self._pipeline_simpan = None
+        self.profiler = None
         
+        # Notifikasi non-modal untuk pesan sukses dan laju intake (mahasiswa/menit)
+        self.notifikasi = Notifikasi(self)
+        self.laju_intake = Laju()
+
+        # Cache state widget: config() hanya dikirim ke Tcl jika nilainya berubah
+        self.cache_widget = CacheWidget()
+
         # Atribut untuk manajemen frame
         self.frame_aktif = None
+        # Frame biodata baru dibuat saat pertama kali dibutuhkan (lihat property frame_biodata)
+        self._frame_biodata = None
         
         # File untuk fitur "Remember Me" (dengan path lengkap)
         self.remember_file = os.path.join(self.script_dir, "remember_me.txt")
 
-        # Buat semua tampilan (views)
+        # Hanya tampilan login yang dibuat di awal; tampilan biodata dibuat
+        # saat login pertama berhasil, atau lebih awal saat idle jika diminta
         self._buat_tampilan_login()
-        self._buat_tampilan_biodata()
+        if prebuild_biodata:
+            self.after_idle(self._prebuild_tampilan_biodata)
+        # Warm start: selama layar login menunggu input, siapkan semua yang dibutuhkan setelah login
+        self._id_pramuat = None
+        if pramuat:
+            self._id_pramuat = self.after(JEDA_PRAMUAT_MS, self._mulai_pramuat)
 
         # Tampilkan frame login di awal
         self._pindah_ke(self.frame_login)
         
+        # Pemantau lag event loop (opt-in lewat BIODATA_PEMANTAU_LAG)
+        self.pemantau_lag = None
+        ambang_lag = ambang_pemantau_lag()
+        if ambang_lag is not None:
+            self.pemantau_lag = PemantauLag(self, direktori_diagnostik(self.script_dir), ambang=ambang_lag)
+            self.pemantau_lag.mulai()
+
+        # Pelacak memori tracemalloc (opt-in lewat BIODATA_PELACAK_MEMORI)
+        self.pelacak_memori = None
+        interval_memori = interval_pelacak_memori()
+        if interval_memori is not None:
+            self.pelacak_memori = PelacakMemori(self, direktori_diagnostik(self.script_dir), interval=interval_memori)
+            self.pelacak_memori.mulai()
+
         # Log aplikasi start
-        logging.info("Aplikasi dimulai")
+        durasi_startup = (time.perf_counter() - mulai_startup) * 1000
+        logging.info(f"Aplikasi dimulai (startup {durasi_startup:.1f} ms)")
+        self.log_event.catat("startup", None, None, mulai_startup, prebuild_biodata=prebuild_biodata, pramuat=pramuat)
+
+    @property
+    def layanan(self):
+        """BiodataService aplikasi, dibuat saat pertama kali dibutuhkan."""
+        if self._layanan is None:
+            from layanan_biodata import BiodataService
+
+            from outbox_registrar import url_registrar
+
+            self._layanan = BiodataService(self.script_dir)
+            # Sinkronisasi ke registrar pusat (opt-in lewat BIODATA_REGISTRAR_URL)
+            url = url_registrar()
+            if url is not None:
+                try:
+                    self._layanan.mulai_outbox(url)
+                except ValueError as e:
+                    logging.warning(f"Invalid BIODATA_REGISTRAR_URL={url!r} ({e}), registrar outbox disabled")
+        return self._layanan
+
+    @property
+    def frame_biodata(self):
+        """Frame biodata, dibuat saat pertama kali diakses."""
+        if self._frame_biodata is None:
+            mulai = time.perf_counter()
+            self._buat_tampilan_biodata()
+            logging.info(f"Biodata view built in {(time.perf_counter() - mulai) * 1000:.1f} ms")
+        return self._frame_biodata
+
+    def _prebuild_tampilan_biodata(self):
+        """Membuat tampilan biodata saat event loop idle, sebelum user login."""
+        if self._frame_biodata is None:
+            self.frame_biodata
+
+    def _diserahi_instans_lain(self, argv):
+        """Aplikasi diluncurkan lagi saat sudah berjalan: naikkan window ini."""
+        logging.info(f"Second launch handed off to running instance (args: {argv})")
+        self.deiconify()
+        self.lift()
+        # -topmost sesaat agar window benar-benar naik di atas window lain
+        self.attributes("-topmost", True)
+        self.after_idle(self.attributes, "-topmost", False)
+        self.focus_force()
+        self.notifikasi.tampilkan("Aplikasi Biodata sudah berjalan di window ini.")
+
+    def _mulai_pramuat(self):
+        """Menjalankan langkah pramuat satu per satu di sela event Tk.
+
+        Setiap langkah di thread Tk dibuat singkat dan dijadwalkan lewat after_idle,
+        sehingga ketikan di layar login tetap langsung diproses. Pekerjaan I/O (membuka
+        database, membaca frekuensi jurusan, memuat index pencarian) berjalan di thread
+        latar milik BiodataService.
+        """
+        mulai = time.perf_counter()
+        durasi = {}
+
+        def layanan():
+            # Import modul service, penyimpanan, dsb. sekaligus membuat service
+            self.layanan
+            import draf  # noqa: F401 - dipakai _mulai_autosave setelah login
+            return self.layanan.mulai_pramuat()
+
+        def trie():
+            self.layanan.pasang_pramuat()
+
+        def indeks():
+            # Perlu frame biodata (label status pencarian); index dipasang oleh polling _siapkan_indeks
+            return self._siapkan_indeks()
+
+        langkah = [
+            ("layanan", layanan),
+            ("trie", trie),
+            ("tampilan", self._prebuild_tampilan_biodata),
+            ("indeks", indeks),
+        ]
+
+        def jalankan():
+            self._id_pramuat = None
+            if not langkah:
+                total = (time.perf_counter() - mulai) * 1000
+                rincian = ", ".join(f"{nama} {ms:.1f} ms" for nama, ms in durasi.items())
+                logging.info(f"Warm-start preload finished in {total:.1f} ms ({rincian})")
+                self.log_event.catat("pramuat", None, None, mulai, **{f"{k}_ms": round(v, 3) for k, v in durasi.items()})
+                return
+            nama, fungsi = langkah.pop(0)
+            t0 = time.perf_counter()
+            try:
+                thread = fungsi()
+            except Exception as e:
+                # Pramuat hanya optimasi; jika gagal, semuanya tetap dimuat saat dibutuhkan
+                logging.error(f"Warm-start preload step '{nama}' failed: {e}")
+                return
+            tunggu(nama, t0, thread)
+
+        def tunggu(nama, t0, thread):
+            if thread is not None and thread.is_alive():
+                self._id_pramuat = self.after(50, tunggu, nama, t0, thread)
+                return
+            durasi[nama] = (time.perf_counter() - t0) * 1000
+            self._id_pramuat = self.after_idle(jalankan)
+
+        jalankan()
 
     def keluar_aplikasi(self):
         """Keluar dari aplikasi dengan konfirmasi"""
         if messagebox.askokcancel("Keluar", "Apakah Anda yakin ingin keluar dari aplikasi?"):
             logging.info(f"Application closed by user: {self.current_user}")
+            logging.info(self.cache_widget.ringkasan())
+            if self.profiler is not None and self.profiler.aktif:
+                self.profiler.berhenti()
+            if self.pemantau_lag is not None:
+                self.pemantau_lag.berhenti()
+            if self.pelacak_memori is not None:
+                self.pelacak_memori.berhenti()
+            self._hentikan_autosave()
+            if self._id_pramuat is not None:
+                self.after_cancel(self._id_pramuat)
+            # Tahap asinkron (audit) diselesaikan dulu sebelum service ditutup
+            if self._pipeline_simpan is not None:
+                self._pipeline_simpan.tutup()
+            if self._layanan is not None:
+                self._layanan.tutup()
             self.destroy()
 
+    @ukur()
     def _pindah_ke(self, frame_tujuan):
         """Menyembunyikan frame aktif dan menampilkan frame tujuan."""
         if self.frame_aktif is not None:
@@ -79,6 +332,9 @@ class AplikasiBiodata(tk.Tk):
         
         self.frame_aktif = frame_tujuan
         self.frame_aktif.pack(fill=tk.BOTH, expand=True) # Tampilkan frame tujuan
+        if self.notifikasi.aktif:
+            # Frame yang dibuat setelah toast berada di atasnya dalam urutan tumpukan
+            self.notifikasi.label.lift()
 
         # Auto-focus dan aksi tambahan berdasarkan frame yang ditampilkan
         if frame_tujuan == self.frame_login:
@@ -91,15 +347,18 @@ class AplikasiBiodata(tk.Tk):
                 self.entry_username.delete(0, tk.END)
                 self.entry_password.delete(0, tk.END)
 
-            self._reset_form_biodata()
+            if self._frame_biodata is not None:
+                self._reset_form_biodata()
             self.after(100, lambda: self.entry_username.focus_set())
         elif frame_tujuan == self.frame_biodata:
             # Update label selamat datang dan set focus
-            self.label_selamat_datang.config(text=f"Selamat Datang, {self.current_user}!")
+            self.cache_widget.atur(self.label_selamat_datang, text=f"Selamat Datang, {self.current_user}!")
             self.after(100, lambda: self.entry_nama.focus_set())
 
+    @ukur()
     def _coba_login(self):
         """Method untuk memproses attempt login dengan logging"""
+        mulai = time.perf_counter()
         username = self.entry_username.get().strip()
         password = self.entry_password.get()
 
@@ -119,43 +378,56 @@ class AplikasiBiodata(tk.Tk):
             if os.path.exists(self.remember_file):
                 os.remove(self.remember_file)
 
-        # Validasi input kosong
-        if not username or not password:
-            logging.warning(f"Empty credentials attempt for username: {username}")
-            messagebox.showwarning("Login Gagal", "Username dan Password tidak boleh kosong.")
-            self.entry_username.focus_set()
-            return
+        from layanan_biodata import GagalLogin, GagalValidasi
 
-        # Validasi panjang minimum
-        if len(username) < 3:
-            logging.warning(f"Username too short: {username}")
-            messagebox.showwarning("Login Gagal", "Username minimal 3 karakter.")
+        try:
+            self.layanan.login(username, password)
+        except GagalValidasi as e:
+            logging.warning(f"Invalid login input for username {username}: {e.pesan}")
+            messagebox.showwarning(e.judul, e.pesan)
             self.entry_username.focus_set()
             return
-
-        # Cek kredensial di database
-        if username in self.users_db and self.users_db[username] == password:
-            self.current_user = username
-            logging.info(f"Successful login for user: {username}")
-            messagebox.showinfo("Login Berhasil", f"Selamat Datang, {username}!")
-            self._reset_form_biodata()
-            self._update_title_with_user()
-            self._buat_menu()
-            self._pindah_ke(self.frame_biodata)
-            # Bersihkan field password setelah berhasil jika remember me tidak aktif
-            if self.var_remember_me.get() == 0:
-                self.entry_password.delete(0, tk.END)
-        else:
+        except GagalLogin as e:
             logging.warning(f"Failed login attempt for username: {username}")
-            messagebox.showerror("Login Gagal", "Username atau Password salah.")
+            self.log_event.catat("login", username, None, mulai, status="failed")
+            messagebox.showerror(e.judul, e.pesan)
             # Bersihkan password dan focus ke username
             self.entry_password.delete(0, tk.END)
             self.entry_username.focus_set()
+            return
+
+        self.current_user = username
+        logging.info(f"Successful login for user: {username}")
+        self.log_event.catat("login", username, None, mulai, status="ok")
+        if self.pelacak_memori is not None:
+            self.pelacak_memori.snapshot("login")
+        if self._frame_biodata is not None:
+            self._reset_form_biodata()
+        self._update_title_with_user()
+        self._buat_menu()
+        self._pindah_ke(self.frame_biodata)
+        # Setelah frame_biodata dibuat dan di-pack, agar toast tidak tertutup frame
+        self.notifikasi.tampilkan(f"Login berhasil. Selamat Datang, {username}!")
+        self._mulai_autosave()
+        self.riwayat_form.mulai_ulang(self._nilai_form())
+        # Bersihkan field password setelah berhasil jika remember me tidak aktif
+        if self.var_remember_me.get() == 0:
+            self.entry_password.delete(0, tk.END)
 
     def _logout(self):
         """Method untuk logout dengan logging"""
         if messagebox.askyesno("Logout", f"Apakah {self.current_user} yakin ingin logout?"):
             logging.info(f"User logout: {self.current_user}")
+            # Draf yang belum disimpan tetap ada dan dipulihkan saat login berikutnya
+            self._hentikan_autosave()
+            logging.info(self._ringkasan_intake())
+            logging.info(self.cache_widget.ringkasan())
+            if self._layanan is not None:
+                self._layanan.simpan_indeks()
+            self.cache_widget.reset_statistik()
+            self.log_event.catat("logout", self.current_user)
+            if self.pelacak_memori is not None:
+                self.pelacak_memori.snapshot("logout")
             # Reset status user
             self.current_user = None
             # Update title
@@ -171,29 +443,29 @@ class AplikasiBiodata(tk.Tk):
             self.entry_username.focus_set()
 
     def _buat_menu(self):
-        """Membuat menu bar untuk aplikasi"""
-        if self.menu_bar:
-            self.menu_bar.destroy()
-            
-        self.menu_bar = tk.Menu(self)
-        self.config(menu=self.menu_bar)
+        """Menampilkan menu bar (dibuat sekali saat login pertama)"""
+        if self.manajer_menu is None:
+            self.manajer_menu = ManajerMenu(self)
+        self.manajer_menu.tampilkan()
+        self._log_objek_tk("login")
 
-        # Menu File
-        file_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="Simpan Hasil", command=self.simpan_hasil)
-        file_menu.add_separator()
-        file_menu.add_command(label="Logout", command=self._logout)
-        file_menu.add_separator()
-        file_menu.add_command(label="Keluar", command=self.keluar_aplikasi)
-        
-        # Menu Help
-        help_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="About", command=self._show_about)
+    def _buka_data_tersimpan(self):
+        """Membuka jendela Data Tersimpan (atau memunculkannya jika sudah terbuka)"""
+        if self.jendela_data is not None and self.jendela_data.winfo_exists():
+            self.jendela_data.lift()
+            return
+        try:
+            from jendela_data import JendelaDataTersimpan
+
+            self.jendela_data = JendelaDataTersimpan(self, self.layanan.penyimpanan())
+        except Exception as e:
+            logging.error(f"Failed to open saved records window: {e}")
+            messagebox.showerror("Error", f"Gagal membuka data tersimpan:\n{str(e)}")
 
     def _show_about(self):
         """Menampilkan dialog 'About' aplikasi"""
+        import datetime
+
         about_message = (
             f"Aplikasi Biodata Mahasiswa v{self.__version__}\n\n"
             "Dibuat oleh:\n"
@@ -203,11 +475,43 @@ class AplikasiBiodata(tk.Tk):
         )
         messagebox.showinfo("Tentang Aplikasi", about_message)
         
+    def _label_profiling(self):
+        if self.profiler is not None and self.profiler.aktif:
+            return "Stop Profiling"
+        return "Start Profiling"
+
+    def _toggle_profiling(self):
+        """Menyalakan/mematikan profiler tanpa perlu restart aplikasi"""
+        if self.profiler is None:
+            self.profiler = Profiler(direktori_diagnostik(self.script_dir))
+        if self.profiler.aktif:
+            path = self.profiler.berhenti()
+            self.manajer_menu.ubah("profiling", label=self._label_profiling())
+            messagebox.showinfo("Profiling", f"Profil disimpan ke:\n{path}\n(beserta file .collapsed untuk flamegraph)")
+        else:
+            self.profiler.mulai()
+            self.manajer_menu.ubah("profiling", label=self._label_profiling())
+
+    def _ringkasan_intake(self):
+        return (f"Intake throughput: {self.laju_intake.jumlah} students saved, "
+                f"{self.laju_intake.per_menit():.1f} students/minute")
+
+    def _show_statistik(self):
+        """Menampilkan laporan instrumentasi (persentil latensi) saat ini"""
+        teks = f"{instrumentasi.laporan()}\n\n{self._ringkasan_intake()}"
+        logging.info(f"Laporan instrumentasi:\n{teks}")
+        messagebox.showinfo("Statistik Kinerja", teks)
+
     def _hapus_menu(self):
-        """Menghapus menu bar dari window."""
-        empty_menu = tk.Menu(self)
-        self.config(menu=empty_menu)
-        self.menu_bar = None
+        """Melepas menu bar dari window (menu tidak dihancurkan, dipakai lagi saat login)."""
+        if self.manajer_menu is not None:
+            self.manajer_menu.sembunyikan()
+            self._log_objek_tk("logout")
+
+    def _log_objek_tk(self, saat):
+        """Mencatat jumlah objek Tk agar kebocoran lintas siklus login terlihat."""
+        jumlah_widget, jumlah_command = hitung_objek_tk(self)
+        logging.info(f"Tk objects after {saat}: widgets={jumlah_widget} tcl_commands={jumlah_command}")
             
     def _reset_form_biodata(self):
         """Mereset semua field pada form biodata ke keadaan awal."""
@@ -220,10 +524,105 @@ class AplikasiBiodata(tk.Tk):
         self.text_alamat.delete("1.0", tk.END)
         self.var_jk.set("Pria")
         self.var_setuju.set(0)
-        self.label_hasil.config(text="")
+        self.cache_widget.atur(self.label_hasil, text="")
+        self.data_terakhir = None
+        self.var_cari.set("")
         # State tombol submit akan otomatis ter-update oleh trace
         self.validate_form()
 
+    def _reset_form_dengan_undo(self):
+        """Tombol Reset Form: reset yang masih bisa dibatalkan dengan Ctrl+Z."""
+        self._catat_snapshot()
+        self._reset_form_biodata()
+        if self._catat_snapshot():
+            self.notifikasi.tampilkan("Form direset. Tekan Ctrl+Z untuk mengembalikan.")
+
+    def _on_alamat_berubah(self, event=None):
+        self.text_alamat.edit_modified(False)
+        self._jadwalkan_snapshot()
+
+    def _jadwalkan_snapshot(self, *args):
+        """Debounce: snapshot undo dicatat 700 ms setelah perubahan terakhir."""
+        if self._id_snapshot is not None:
+            self.after_cancel(self._id_snapshot)
+        self._id_snapshot = self.after(700, self._catat_snapshot)
+
+    def _catat_snapshot(self):
+        if self._id_snapshot is not None:
+            self.after_cancel(self._id_snapshot)
+            self._id_snapshot = None
+        return self.riwayat_form.catat(self._nilai_form())
+
+    def _undo_form(self, event=None):
+        if self.frame_aktif is not self._frame_biodata:
+            return
+        # Perubahan yang belum tercatat dicatat dulu agar undo kembali ke state sebelumnya
+        self._catat_snapshot()
+        nilai = self.riwayat_form.undo()
+        if nilai is not None:
+            self._isi_form(nilai)
+        return "break"
+
+    def _redo_form(self, event=None):
+        if self.frame_aktif is not self._frame_biodata:
+            return
+        self._catat_snapshot()
+        nilai = self.riwayat_form.redo()
+        if nilai is not None:
+            self._isi_form(nilai)
+        return "break"
+
+    def _nilai_form(self):
+        """State field form biodata sebagai dict (kunci sama dengan kolom record)."""
+        return {
+            "nama": self.var_nama.get(),
+            "nim": self.var_nim.get(),
+            "jurusan": self.var_jurusan.get(),
+            "email": self.var_email.get(),
+            "telepon": self.var_telepon.get(),
+            "tgl_lahir": self.var_tgllahir.get(),
+            "alamat": self.text_alamat.get("1.0", "end-1c"),
+            "jenis_kelamin": self.var_jk.get(),
+        }
+
+    def _mulai_autosave(self):
+        """Memulihkan draf user yang login (jika ada) lalu menjalankan timer autosave."""
+        from draf import INTERVAL_MS, AutosaveDraf, muat_draf, path_draf
+
+        direktori = os.path.join(self.script_dir, "draf")
+        try:
+            os.makedirs(direktori, exist_ok=True)
+        except OSError as e:
+            logging.error(f"Failed to create draft directory: {e}")
+            return
+        path = path_draf(direktori, self.current_user)
+        draf, jumlah_baris = muat_draf(path)
+        if any(v for k, v in draf.items() if k != "jenis_kelamin"):
+            self._isi_form(draf)
+            logging.info(f"Draft restored for user {self.current_user} ({jumlah_baris} journal entries)")
+            self.notifikasi.tampilkan("Draf yang belum disimpan telah dipulihkan.")
+        self.autosave_draf = AutosaveDraf(path, awal=self._nilai_form(), jumlah_baris=jumlah_baris)
+        self._interval_autosave = INTERVAL_MS
+        self._id_autosave = self.after(self._interval_autosave, self._tick_autosave)
+
+    def _tick_autosave(self):
+        if self.autosave_draf is None:
+            return
+        self.autosave_draf.perbarui(self._nilai_form())
+        self._id_autosave = self.after(self._interval_autosave, self._tick_autosave)
+
+    def _hentikan_autosave(self):
+        """Menulis perubahan terakhir dan menghentikan autosave draf."""
+        if self.autosave_draf is None:
+            return
+        if self._id_autosave is not None:
+            self.after_cancel(self._id_autosave)
+            self._id_autosave = None
+        self.autosave_draf.perbarui(self._nilai_form())
+        self.autosave_draf.berhenti()
+        logging.info(f"Draft autosave stopped: {self.autosave_draf.jumlah_tulis} journal writes")
+        self.autosave_draf = None
+
     def _update_title_with_user(self):
         """Update judul window dengan nama user yang login"""
         if self.current_user:
@@ -233,12 +632,12 @@ class AplikasiBiodata(tk.Tk):
 
     def _toggle_password_visibility(self):
         """Mengubah visibilitas password pada entry field."""
-        if self.entry_password.cget('show') == '*':
-            self.entry_password.config(show='')
-            self.btn_show_hide.config(text='Hide')
+        if self.cache_widget.baca(self.entry_password, 'show') == '*':
+            self.cache_widget.atur(self.entry_password, show='')
+            self.cache_widget.atur(self.btn_show_hide, text='Hide')
         else:
-            self.entry_password.config(show='*')
-            self.btn_show_hide.config(text='Show')
+            self.cache_widget.atur(self.entry_password, show='*')
+            self.cache_widget.atur(self.btn_show_hide, text='Show')
 
     def _buat_tampilan_login(self):
         """Membuat semua widget untuk tampilan login."""
@@ -354,7 +753,7 @@ class AplikasiBiodata(tk.Tk):
         self.var_setuju = tk.IntVar()
 
         # --- Frame Biodata ---
-        self.frame_biodata = tk.Frame(master=self, padx=20, pady=20, bg="whitesmoke")
+        self._frame_biodata = tk.Frame(master=self, padx=20, pady=20, bg="whitesmoke")
         self.frame_biodata.columnconfigure(0, weight=1)
         self.frame_biodata.columnconfigure(1, weight=1)
 
@@ -383,6 +782,9 @@ class AplikasiBiodata(tk.Tk):
         )
         self.label_judul.grid(row=1, column=0, columnspan=2, pady=10)
 
+        # Pencarian mahasiswa tersimpan (search-as-you-type)
+        self._buat_kotak_cari()
+
         # Frame khusus untuk input dengan border
         self.frame_input = tk.Frame(
             master=self.frame_biodata, 
@@ -392,7 +794,7 @@ class AplikasiBiodata(tk.Tk):
             pady=10,
             bg="whitesmoke"
         )
-        self.frame_input.grid(row=2, column=0, columnspan=2, sticky="EW")
+        self.frame_input.grid(row=3, column=0, columnspan=2, sticky="EW")
         self.frame_input.columnconfigure(1, weight=1)
 
         # --- Input Fields ---
@@ -460,7 +862,7 @@ class AplikasiBiodata(tk.Tk):
         
         # Frame untuk tombol-tombol
         frame_tombol = tk.Frame(master=self.frame_biodata, bg="whitesmoke")
-        frame_tombol.grid(row=3, column=0, columnspan=2, pady=10, sticky="EW")
+        frame_tombol.grid(row=4, column=0, columnspan=2, pady=10, sticky="EW")
         frame_tombol.columnconfigure(0, weight=1)
         frame_tombol.columnconfigure(1, weight=1)
         frame_tombol.columnconfigure(2, weight=1)
@@ -468,9 +870,10 @@ class AplikasiBiodata(tk.Tk):
         # Tombol submit
         self.btn_submit = tk.Button(master=frame_tombol, text="Submit Biodata", font=("Arial", 12, "bold"), command=self.submit_data, state=tk.DISABLED)
         self.btn_submit.grid(row=0, column=0, padx=5, sticky="EW")
+        self.cache_widget.daftarkan(self.btn_submit, state=tk.DISABLED)
 
         # Tombol Reset
-        self.btn_reset = tk.Button(master=frame_tombol, text="Reset Form", font=("Arial", 12), command=self._reset_form_biodata)
+        self.btn_reset = tk.Button(master=frame_tombol, text="Reset Form", font=("Arial", 12), command=self._reset_form_dengan_undo)
         self.btn_reset.grid(row=0, column=1, padx=5, sticky="EW")
 
         # Tombol Simpan
@@ -480,110 +883,284 @@ class AplikasiBiodata(tk.Tk):
         # Event bindings
         self.btn_submit.bind("<Enter>", self.on_enter)
         self.btn_submit.bind("<Leave>", self.on_leave)
-        self.entry_jurusan.bind("<Return>", self.submit_shortcut)
+        self.entry_jurusan.bind("<Return>", self._jurusan_return)
+        from autocomplete import DropdownAutocomplete
+        self.autocomplete_jurusan = DropdownAutocomplete(self.entry_jurusan, self.var_jurusan, self._saran_jurusan)
+
+        # Field -> entry yang difokuskan jika validasi field tersebut gagal
+        self._entry_field = {
+            "nama": self.entry_nama, "nim": self.entry_nim, "jurusan": self.entry_jurusan,
+            "email": self.entry_email, "telepon": self.entry_telepon, "tgl_lahir": self.entry_tgllahir,
+        }
         
         # Label hasil
         self.label_hasil = tk.Label(master=self.frame_biodata, text="", font=("Arial", 12, "italic"), justify=tk.LEFT, wraplength=550, bg="whitesmoke")
-        self.label_hasil.grid(row=4, column=0, columnspan=2, sticky="W", padx=10, pady=10)
+        self.label_hasil.grid(row=5, column=0, columnspan=2, sticky="W", padx=10, pady=10)
+        self.cache_widget.daftarkan(self.label_hasil, text="")
         
-        tk.Button(master=self.frame_biodata, text="< Logout", command=self._logout).grid(row=5, column=0, columnspan=2, pady=10, sticky="EW")
+        tk.Button(master=self.frame_biodata, text="< Logout", command=self._logout).grid(row=6, column=0, columnspan=2, pady=10, sticky="EW")
+
+        # Undo/redo form: snapshot dicatat setelah user berhenti mengetik sebentar
+        from riwayat_form import RiwayatForm
+
+        self.riwayat_form = RiwayatForm(self._nilai_form(), self._nilai_form())
+        self._id_snapshot = None
+        for var in (self.var_nama, self.var_nim, self.var_jurusan, self.var_email,
+                    self.var_telepon, self.var_tgllahir, self.var_jk):
+            var.trace_add("write", self._jadwalkan_snapshot)
+        self.text_alamat.bind("<<Modified>>", self._on_alamat_berubah)
+        for urutan in ("<Control-z>", "<Control-Z>"):
+            self.bind(urutan, self._undo_form)
+        for urutan in ("<Control-y>", "<Control-Y>"):
+            self.bind(urutan, self._redo_form)
+
+    def _buat_kotak_cari(self):
+        """Membuat kotak pencarian mahasiswa tersimpan di atas form."""
+        self.var_cari = tk.StringVar()
+        frame_cari = tk.Frame(master=self.frame_biodata, bg="whitesmoke")
+        frame_cari.grid(row=2, column=0, columnspan=2, sticky="EW", pady=(0, 10))
+        frame_cari.columnconfigure(1, weight=1)
+
+        tk.Label(master=frame_cari, text="Cari Mahasiswa:", font=("Arial", 12), bg="whitesmoke").grid(row=0, column=0, sticky="W")
+        self.entry_cari = tk.Entry(master=frame_cari, font=("Arial", 12), textvariable=self.var_cari)
+        self.entry_cari.grid(row=0, column=1, sticky="EW", padx=(5, 0))
+        self.label_status_cari = tk.Label(master=frame_cari, text="", font=("Arial", 9), fg="gray", bg="whitesmoke")
+        self.label_status_cari.grid(row=1, column=1, sticky="W", padx=(5, 0))
+
+        # Daftar hasil hanya ditampilkan jika ada hasil
+        self.list_cari = tk.Listbox(master=frame_cari, height=6, font=("Arial", 11), activestyle="dotbox")
+        self.list_cari.grid(row=2, column=1, sticky="EW", padx=(5, 0))
+        self.list_cari.grid_remove()
+        self.hasil_cari = []
+
+        self.var_cari.trace_add("write", self._cari)
+        self.entry_cari.bind("<FocusIn>", lambda e: self._siapkan_indeks())
+        self.entry_cari.bind("<Down>", lambda e: self._fokus_hasil_cari())
+        self.entry_cari.bind("<Escape>", lambda e: self.var_cari.set(""))
+        self.list_cari.bind("<Double-Button-1>", lambda e: self._pilih_hasil_cari())
+        self.list_cari.bind("<Return>", lambda e: self._pilih_hasil_cari())
+
+    def _siapkan_indeks(self):
+        """Memuat (atau membangun) index pencarian di thread latar, sekali saja; mengembalikan thread-nya.
+
+        Jika pemuatan gagal, pemanggilan berikutnya (fokus atau ketikan di kotak cari) mencoba lagi.
+        """
+        layanan = self.layanan
+        if layanan.indeks_cari is not None or layanan.pemuatan_indeks_dimulai:
+            return None
+        thread = layanan.mulai_muat_indeks_cari()
+        self.cache_widget.atur(self.label_status_cari, text="Memuat index pencarian...")
+
+        def cek():
+            if thread.is_alive():
+                self.after(100, cek)
+                return
+            if layanan.pasang_indeks_cari() is None:
+                logging.error("Failed to load search index")
+                self.cache_widget.atur(self.label_status_cari, text="Index pencarian gagal dimuat")
+                return
+            self._cari()
 
+        self.after(100, cek)
+        return thread
+
+    def _saran_jurusan(self, teks):
+        return self.layanan.saran_jurusan(teks)
+
+    def _jurusan_return(self, event=None):
+        """Enter di field jurusan: pilih saran jika dropdown terbuka, jika tidak submit."""
+        if self.autocomplete_jurusan.terbuka:
+            self.autocomplete_jurusan.terima()
+            return "break"
+        self.submit_shortcut()
+
+    def _cari(self, *args):
+        """Menjalankan pencarian untuk setiap perubahan teks di kotak cari."""
+        query = self.var_cari.get()
+        if self.layanan.indeks_cari is None:
+            if query:
+                self._siapkan_indeks()
+            return
+        from indeks_pencarian import MIN_QUERY
+
+        if len(query.strip()) < MIN_QUERY:
+            self.hasil_cari = []
+            self.list_cari.grid_remove()
+            teks = f"Ketik minimal {MIN_QUERY} karakter" if query.strip() else ""
+            self.cache_widget.atur(self.label_status_cari, text=teks)
+            return
+        mulai = time.perf_counter()
+        self.hasil_cari = self.layanan.cari(query, batas=20)
+        durasi_ms = (time.perf_counter() - mulai) * 1000
+        self.list_cari.delete(0, tk.END)
+        for nim, nama, jurusan in self.hasil_cari:
+            self.list_cari.insert(tk.END, f"{nim} - {nama} ({jurusan})")
+        if self.hasil_cari:
+            self.list_cari.grid()
+        else:
+            self.list_cari.grid_remove()
+        self.cache_widget.atur(self.label_status_cari, text=f"{len(self.hasil_cari)} hasil ({durasi_ms:.1f} ms)")
+
+    def _fokus_hasil_cari(self):
+        if self.hasil_cari:
+            self.list_cari.focus_set()
+            self.list_cari.selection_clear(0, tk.END)
+            self.list_cari.selection_set(0)
+            self.list_cari.activate(0)
+
+    def _pilih_hasil_cari(self):
+        """Memuat record hasil pencarian yang dipilih ke dalam form."""
+        pilihan = self.list_cari.curselection()
+        if not pilihan:
+            return
+        nim = self.hasil_cari[pilihan[0]][0]
+        record = self.layanan.ambil(nim)
+        if record is None:
+            messagebox.showwarning("Peringatan", f"Data dengan NIM {nim} tidak ditemukan.")
+            return
+        self._isi_form(record)
+        self.var_cari.set("")
+        self.entry_nama.focus_set()
+
+    def _isi_form(self, record):
+        """Mengisi field form biodata dari sebuah record."""
+        self.var_nama.set(record.get("nama") or "")
+        self.var_nim.set(record.get("nim") or "")
+        self.autocomplete_jurusan.atur_nilai(record.get("jurusan") or "")
+        self.var_email.set(record.get("email") or "")
+        self.var_telepon.set(record.get("telepon") or "")
+        self.var_tgllahir.set(record.get("tgl_lahir") or "")
+        self.text_alamat.delete("1.0", tk.END)
+        self.text_alamat.insert("1.0", record.get("alamat") or "")
+        self.var_jk.set(record.get("jenis_kelamin") or "Pria")
+        self.validate_form()
+
+    @ukur()
     def simpan_hasil(self):
         """Simpan hasil biodata ke file dengan error handling"""
+        mulai = time.perf_counter()
+        nim = self.data_terakhir["nim"] if self.data_terakhir else None
+
         try:
-            hasil_tersimpan = self.label_hasil.cget("text")
-            if not hasil_tersimpan or "BIODATA TERSIMPAN" not in hasil_tersimpan:
+            hasil_tersimpan = self.cache_widget.baca(self.label_hasil, "text")
+            if not self.data_terakhir or not hasil_tersimpan or "BIODATA TERSIMPAN" not in hasil_tersimpan:
                 messagebox.showwarning("Peringatan", "Tidak ada data untuk disimpan. Mohon submit terlebih dahulu.")
                 return
-            
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"biodata_{self.current_user}_{timestamp}.txt"
-            # Gabungkan direktori script dengan nama file
-            full_path = os.path.join(self.script_dir, filename)
-            
-            with open(full_path, "w", encoding="utf-8") as file:
-                file.write(f"Data disimpan oleh: {self.current_user}\n")
-                file.write(f"Waktu penyimpanan: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                file.write("-" * 50 + "\n")
-                file.write(hasil_tersimpan)
-            
-            messagebox.showinfo("Info", f"Data berhasil disimpan ke file '{filename}'.")
+
+            # Persist, outbox registrar, index dan statistik selesai di sini; audit menyusul di latar
+            konteks = {"data": self.data_terakhir, "user": self.current_user}
+            hasil = self.pipeline_simpan.jalankan(konteks)
+            full_path = konteks["path"]
+            filename = os.path.basename(full_path)
+            if self.autosave_draf is not None:
+                self.autosave_draf.hapus(self._nilai_form())
+
+            self.log_event.catat("save", self.current_user, nim, mulai, status="ok", file=filename)
+            self.notifikasi.tampilkan(f"Data berhasil disimpan ke file '{filename}'.")
             logging.info(f"Data saved to {full_path} by user {self.current_user}")
+            self._pantau_pipeline(hasil, self.current_user, nim)
         except PermissionError:
             logging.error(f"Permission denied to save file for user {self.current_user}")
+            self.log_event.catat("save", self.current_user, nim, mulai, status="error", error="permission denied")
             messagebox.showerror("Error", "Tidak memiliki izin untuk menyimpan file di lokasi ini.")
         except Exception as e:
             logging.error(f"Error saving file for user {self.current_user}: {e}")
+            self.log_event.catat("save", self.current_user, nim, mulai, status="error", error=str(e))
             messagebox.showerror("Error", f"Terjadi kesalahan saat menyimpan file:\n{str(e)}")
 
 
+    @property
+    def pipeline_simpan(self):
+        """Pipeline pasca-simpan, dibuat saat pertama kali dibutuhkan."""
+        if self._pipeline_simpan is None:
+            from pipeline_simpan import PipelineSimpan
+
+            pipeline = PipelineSimpan(instrumentasi=instrumentasi.instrumentasi)
+            pipeline.tambah_tahap("persist", self._tahap_persist, wajib=True)
+            # Antre ke outbox langsung setelah commit: jika proses mati di antaranya, record tidak pernah terkirim
+            pipeline.tambah_tahap("registrar", self._tahap_registrar, wajib=True)
+            pipeline.tambah_tahap("indeks", lambda konteks: self.layanan.setelah_simpan(konteks["record"]))
+            pipeline.tambah_tahap("statistik", self._tahap_statistik)
+            pipeline.tambah_tahap("audit", self._tahap_audit, asinkron=True)
+            self._pipeline_simpan = pipeline
+        return self._pipeline_simpan
+
+    def _tahap_persist(self, konteks):
+        # File teks + record store
+        konteks["record"], konteks["path"] = self.layanan.simpan_record(konteks["data"], konteks["user"])
+
+    def _tahap_statistik(self, konteks):
+        self.laju_intake.tambah()
+        if self.jendela_data is not None and self.jendela_data.winfo_exists():
+            self.jendela_data.muat_ulang()
+
+    def _tahap_registrar(self, konteks):
+        # Hanya insert ke SQLite lokal; pengiriman ke registrar tetap di thread outbox
+        outbox = self.layanan.outbox
+        if outbox is not None:
+            outbox.tambah(konteks["record"])
+
+    def _tahap_audit(self, konteks):
+        from berkas_bersama import tambah_baris_csv
+
+        record = konteks["record"]
+        tambah_baris_csv(
+            os.path.join(self.script_dir, "audit_simpan.csv"),
+            [record["waktu"], konteks["user"], record["nim"], os.path.basename(konteks["path"] or "")],
+            header=["waktu", "user", "nim", "file"],
+        )
+
+    def _pantau_pipeline(self, hasil, user, nim):
+        """Menunggu tahap asinkron selesai (polling dari thread Tk) lalu melaporkan kegagalan."""
+        if not hasil.selesai:
+            self.after(200, self._pantau_pipeline, hasil, user, nim)
+            return
+        durasi = {f"{nama}_ms": round(d * 1000, 3) for nama, d in hasil.durasi.items()}
+        self.log_event.catat("pipeline", user, nim, None, gagal=sorted(hasil.error), **durasi)
+        if not hasil.berhasil:
+            self.notifikasi.tampilkan(
+                f"Data NIM {nim} tersimpan, tetapi proses lanjutan gagal: {', '.join(hasil.error)}. Lihat app.log.",
+                "peringatan",
+            )
+
+    @ukur()
     def submit_data(self):
         """Submit data biodata dengan validasi lengkap"""
+        mulai = time.perf_counter()
+        from layanan_biodata import GagalValidasi
+
         try:
             if self.var_setuju.get() == 0:
                 messagebox.showwarning("Peringatan", "Anda harus menyetujui pengumpulan data!")
                 return
-            
-            # Ambil data dari form
-            nama = self.var_nama.get().strip()
-            nim = self.var_nim.get().strip()
-            jurusan = self.var_jurusan.get().strip()
-            email = self.var_email.get().strip()
-            telepon = self.var_telepon.get().strip()
-            tgl_lahir = self.var_tgllahir.get().strip()
-            alamat = self.text_alamat.get("1.0", tk.END).strip()
-            jenis_kelamin = self.var_jk.get()
-
-            # Validasi field wajib
-            if not all([nama, nim, jurusan, email, telepon]):
-                messagebox.showwarning("Input Kosong", "Nama, NIM, Jurusan, Email, dan Telepon harus diisi!")
-                return
 
-            if nama.isdigit():
-                messagebox.showwarning("Format Nama Salah", "Nama tidak boleh hanya berupa angka!")
-                self.entry_nama.focus_set()
+            try:
+                record = self.layanan.submit(self._nilai_form())
+            except GagalValidasi as e:
+                messagebox.showwarning(e.judul, e.pesan)
+                entry = self._entry_field.get(e.field)
+                if entry is not None:
+                    entry.focus_set()
                 return
 
-            if not nim.isdigit() or len(nim) < 8:
-                messagebox.showwarning("Format NIM Salah", "NIM harus berupa angka minimal 8 digit!")
-                self.entry_nim.focus_set()
-                return
-            
-            # Validasi Email
-            if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
-                messagebox.showwarning("Format Email Salah", "Format email tidak valid. Contoh: nama@domain.com")
-                self.entry_email.focus_set()
-                return
+            # Samakan ejaan jurusan di form dengan bentuk kanonik dari service
+            if record["jurusan"] != self.var_jurusan.get():
+                self.autocomplete_jurusan.atur_nilai(record["jurusan"])
+
+            nim = record["nim"]
+            self.data_terakhir = record
+            self.log_event.catat("submit", self.current_user, nim, mulai, status="ok")
+            self.notifikasi.tampilkan(f"Data {record['nama']} (NIM: {nim}) tersimpan. Klik 'Simpan Hasil' untuk menyimpan ke file.")
 
-            # Validasi Telepon (Format Indonesia)
-            if not re.match(r'^(08|\+62[ ]?)\d{8,13}$', telepon):
-                messagebox.showwarning("Format Telepon Salah", "Format nomor telepon Indonesia tidak valid. Contoh: 08... atau +62...")
-                self.entry_telepon.focus_set()
-                return
-                
-            # Validasi Tanggal Lahir (opsional, tapi jika diisi, format harus benar)
-            if tgl_lahir:
-                try:
-                    datetime.datetime.strptime(tgl_lahir, '%d-%m-%Y')
-                except ValueError:
-                    messagebox.showwarning("Format Tanggal Salah", "Format tanggal lahir harus DD-MM-YYYY. Contoh: 31-12-2000")
-                    self.entry_tgllahir.focus_set()
-                    return
-
-            # Tampilkan hasil
-            hasil = (f"Nama: {nama}\nNIM: {nim}\nJurusan: {jurusan}\nEmail: {email}\n"
-                     f"Telepon: {telepon}\nTanggal Lahir: {tgl_lahir or 'Tidak diisi'}\nAlamat: {alamat or 'Tidak diisi'}\n"
-                     f"Jenis Kelamin: {jenis_kelamin}")
-            messagebox.showinfo("Data Tersimpan", hasil)
-            
             logging.info(f"Data submitted by user: {self.current_user} - NIM: {nim}")
 
-            hasil_lengkap = f"BIODATA TERSIMPAN:\nDiinput oleh: {self.current_user}\n\n{hasil}"
-            self.label_hasil.config(text=hasil_lengkap)
+            self.cache_widget.atur(self.label_hasil, text=self.layanan.format_hasil(record, self.current_user))
         except Exception as e:
             logging.error(f"Error in submit_data by {self.current_user}: {str(e)}")
+            self.log_event.catat("submit", self.current_user, None, mulai, status="error", error=str(e))
             messagebox.showerror("Error", f"Terjadi kesalahan saat memproses data:\n{str(e)}")
 
+    @ukur()
     def validate_form(self, *args):
         """Memvalidasi form secara real-time untuk mengaktifkan/menonaktifkan tombol submit."""
         nama_valid = self.var_nama.get().strip() != ""
@@ -594,24 +1171,30 @@ class AplikasiBiodata(tk.Tk):
         setuju_valid = self.var_setuju.get() == 1
 
         if all([nama_valid, nim_valid, jurusan_valid, email_valid, telepon_valid, setuju_valid]):
-            self.btn_submit.config(state=tk.NORMAL)
+            self.cache_widget.atur(self.btn_submit, state=tk.NORMAL)
         else:
-            self.btn_submit.config(state=tk.DISABLED)
+            self.cache_widget.atur(self.btn_submit, state=tk.DISABLED)
 
     def on_enter(self, event):
-        if self.btn_submit['state'] == tk.NORMAL:
-            self.btn_submit.config(bg="lightblue")
+        if self.cache_widget.baca(self.btn_submit, 'state') == tk.NORMAL:
+            self.cache_widget.atur(self.btn_submit, bg="lightblue")
 
     def on_leave(self, event):
-        self.btn_submit.config(bg="SystemButtonFace")
+        self.cache_widget.atur(self.btn_submit, bg="SystemButtonFace")
 
     def submit_shortcut(self, event=None):
-        if self.btn_submit['state'] == tk.NORMAL:
+        if self.cache_widget.baca(self.btn_submit, 'state') == tk.NORMAL:
             self.submit_data()
             
 # Blok berikut hanya akan dieksekusi jika file ini dijalankan secara langsung
 if __name__ == "__main__":
     # Membuat instance dari kelas aplikasi kita
-    app = AplikasiBiodata()
+    app = AplikasiBiodata(
+        prebuild_biodata=os.environ.get("BIODATA_PREBUILD", "") not in ("", "0"),
+        pramuat=os.environ.get("BIODATA_PRAMUAT", "1") != "0",
+    )
+    # Peluncuran berikutnya diteruskan ke instance ini
+    kunci_instans.pasang(app, app._diserahi_instans_lain)
     # Menjalankan mainloop dari instance tersebut
     app.mainloop()
+    kunci_instans.tutup()
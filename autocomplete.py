@@ -0,0 +1,104 @@
+"""Dropdown autocomplete untuk tk.Entry."""
+import tkinter as tk
+
+
+class DropdownAutocomplete:
+    """Menampilkan daftar saran di bawah sebuah Entry saat user mengetik.
+
+    `sumber` adalah fungsi teks -> list saran. Popup dibuat sekali lalu
+    disembunyikan/ditampilkan ulang (tidak dibuat ulang setiap ketikan).
+    """
+
+    def __init__(self, entry, var, sumber, batas=8):
+        self.entry = entry
+        self.var = var
+        self.sumber = sumber
+        self.batas = batas
+        self.popup = None
+        self.listbox = None
+        self.saran = []
+        self._mengisi = False
+
+        var.trace_add("write", self._on_ubah)
+        entry.bind("<Down>", self._turun, add="+")
+        entry.bind("<Escape>", lambda e: self.tutup(), add="+")
+        entry.bind("<FocusOut>", lambda e: entry.after(150, self._tutup_jika_tidak_fokus), add="+")
+
+    @property
+    def terbuka(self):
+        return bool(self.saran)
+
+    def _buat_popup(self):
+        self.popup = tk.Toplevel(self.entry)
+        self.popup.wm_overrideredirect(True)
+        self.popup.withdraw()
+        self.listbox = tk.Listbox(self.popup, height=self.batas, font=self.entry.cget("font"), exportselection=False)
+        self.listbox.pack(fill=tk.BOTH, expand=True)
+        self.listbox.bind("<ButtonRelease-1>", lambda e: self.terima())
+        self.listbox.bind("<Return>", lambda e: self.terima())
+        self.listbox.bind("<Escape>", lambda e: self.tutup())
+
+    def _on_ubah(self, *args):
+        if self._mengisi:
+            return
+        teks = self.var.get()
+        saran = self.sumber(teks) if teks.strip() else []
+        if not saran or saran == [teks]:
+            self.tutup()
+            return
+        self.tampilkan(saran)
+
+    def tampilkan(self, saran):
+        """Menampilkan daftar saran tepat di bawah entry."""
+        if self.popup is None:
+            self._buat_popup()
+        self.saran = saran[:self.batas]
+        self.listbox.delete(0, tk.END)
+        for item in self.saran:
+            self.listbox.insert(tk.END, item)
+        self.listbox.config(height=len(self.saran))
+        x = self.entry.winfo_rootx()
+        y = self.entry.winfo_rooty() + self.entry.winfo_height()
+        self.popup.geometry(f"{self.entry.winfo_width()}x{self.listbox.winfo_reqheight()}+{x}+{y}")
+        self.popup.deiconify()
+        self.popup.lift()
+
+    def tutup(self):
+        """Menyembunyikan daftar saran."""
+        self.saran = []
+        if self.popup is not None:
+            self.popup.withdraw()
+
+    def _tutup_jika_tidak_fokus(self):
+        fokus = self.entry.focus_get()
+        if fokus is not self.entry and fokus is not self.listbox:
+            self.tutup()
+
+    def _turun(self, event=None):
+        if not self.terbuka:
+            return None
+        self.listbox.focus_set()
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(0)
+        self.listbox.activate(0)
+        return "break"
+
+    def terima(self, index=None):
+        """Memasukkan saran terpilih (default: saran pertama) ke entry."""
+        if not self.saran:
+            return
+        if index is None:
+            pilihan = self.listbox.curselection()
+            index = pilihan[0] if pilihan else 0
+        self.atur_nilai(self.saran[index])
+        self.entry.focus_set()
+        self.entry.icursor(tk.END)
+
+    def atur_nilai(self, nilai):
+        """Mengisi entry tanpa memunculkan dropdown."""
+        self._mengisi = True
+        try:
+            self.var.set(nilai)
+        finally:
+            self._mengisi = False
+        self.tutup()
@@ -0,0 +1,154 @@
+"""Load generator: memutar mahasiswa sintetis lewat alur login -> submit -> save.
+
+Mode:
+    layanan  memanggil BiodataService langsung (tanpa Tk, default)
+    app      membuat AplikasiBiodata (window disembunyikan, dialog diganti no-op)
+             lalu memanggil _coba_login -> submit_data -> simpan_hasil -> _logout
+             seperti klik operator. Butuh tkinter yang bisa membuat window
+             (display asli atau xvfb-run).
+
+Semua file (database, file teks, log) ditulis ke direktori sementara kecuali
+--direktori diberikan.
+
+Pemakaian:
+    python beban_biodata.py -n 2000                 # secepat mungkin
+    python beban_biodata.py -n 600 --laju 10        # target 10 mahasiswa/detik
+    python beban_biodata.py --mode app -n 200
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from data_sintetis import mahasiswa as mahasiswa_sintetis
+from instrumentasi import Instrumentasi, Laju
+
+
+class _Pengukur:
+    def __init__(self, instrumentasi):
+        self.instrumentasi = instrumentasi
+
+    def __call__(self, tahap, fungsi, *args):
+        mulai = time.perf_counter()
+        hasil = fungsi(*args)
+        self.instrumentasi.rekam(tahap, time.perf_counter() - mulai)
+        return hasil
+
+
+class DriverLayanan:
+    """Menjalankan alur lewat BiodataService."""
+
+    def __init__(self, direktori, tulis_file=True):
+        from layanan_biodata import BiodataService
+
+        self.layanan = BiodataService(direktori, path_db=os.path.join(direktori, "biodata.db"))
+        self.tulis_file = tulis_file
+
+    def jalankan(self, data, ukur):
+        user = ukur("login", self.layanan.login, "admin", "123")
+        record = ukur("submit", self.layanan.submit, data)
+        ukur("save", self.layanan.save, record, user, self.tulis_file)
+
+    def tutup(self):
+        self.layanan.tutup()
+
+
+class DriverApp:
+    """Menjalankan alur lewat method AplikasiBiodata, seperti operator di depan layar."""
+
+    def __init__(self, direktori):
+        from tkinter import messagebox
+
+        import aplikasi_biodata_oop
+
+        # Dialog modal akan memblok; dicatat saja dan dijawab "ya"
+        self.dialog = []
+        for nama in ("showinfo", "showwarning", "showerror"):
+            setattr(messagebox, nama, lambda judul, pesan, _jenis=nama: self.dialog.append((_jenis, judul, pesan)))
+        messagebox.askyesno = messagebox.askokcancel = lambda *a, **k: True
+
+        # script_dir aplikasi diturunkan dari __file__ modul; arahkan ke direktori uji
+        aplikasi_biodata_oop.__file__ = os.path.join(direktori, "aplikasi_biodata_oop.py")
+        self.app = aplikasi_biodata_oop.AplikasiBiodata()
+        self.app.withdraw()
+
+    def jalankan(self, data, ukur):
+        app = self.app
+        app.entry_username.delete(0, "end")
+        app.entry_username.insert(0, "admin")
+        app.entry_password.delete(0, "end")
+        app.entry_password.insert(0, "123")
+        ukur("login", app._coba_login)
+        app._isi_form(data)
+        app.var_setuju.set(1)
+        jumlah_dialog = len(self.dialog)
+        ukur("submit", app.submit_data)
+        ukur("save", app.simpan_hasil)
+        ukur("logout", app._logout)
+        app.update()
+        if len(self.dialog) > jumlah_dialog:
+            raise RuntimeError(f"Dialog tak terduga: {self.dialog[-1]}")
+
+    def tutup(self):
+        self.app._hentikan_autosave()
+        if self.app._pipeline_simpan is not None:
+            self.app._pipeline_simpan.tutup()
+        if self.app._layanan is not None:
+            self.app._layanan.tutup()
+        self.app.destroy()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--jumlah", type=int, default=1000, help="jumlah mahasiswa")
+    parser.add_argument("--laju", type=float, default=0, help="target mahasiswa per detik (0 = secepat mungkin)")
+    parser.add_argument("--mode", choices=("layanan", "app"), default="layanan")
+    parser.add_argument("--tanpa-file", action="store_true", help="mode layanan: hanya tulis record store")
+    parser.add_argument("--direktori", help="direktori kerja (default: direktori sementara)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    direktori = args.direktori or tempfile.mkdtemp(prefix="beban_biodata_")
+    os.makedirs(direktori, exist_ok=True)
+    if args.mode == "app":
+        driver = DriverApp(direktori)
+    else:
+        driver = DriverLayanan(direktori, tulis_file=not args.tanpa_file)
+
+    rng = random.Random(args.seed)
+    hasil = Instrumentasi()
+    ukur = _Pengukur(hasil)
+    laju = Laju()
+    gagal = 0
+    mulai = time.perf_counter()
+    for i in range(args.jumlah):
+        if args.laju > 0:
+            # Jadwal tetap (bukan jeda tetap) agar keterlambatan tidak menumpuk
+            tunggu = mulai + i / args.laju - time.perf_counter()
+            if tunggu > 0:
+                time.sleep(tunggu)
+        data = mahasiswa_sintetis(i, rng)
+        awal = time.perf_counter()
+        try:
+            driver.jalankan(data, ukur)
+        except Exception as e:
+            gagal += 1
+            if gagal <= 5:
+                print(f"Gagal untuk NIM {data['nim']}: {e}", file=sys.stderr)
+            continue
+        hasil.rekam("total", time.perf_counter() - awal)
+        laju.tambah()
+    durasi = time.perf_counter() - mulai
+    driver.tutup()
+
+    berhasil = args.jumlah - gagal
+    print(f"Mode {args.mode}: {berhasil}/{args.jumlah} mahasiswa dalam {durasi:.2f} s ({direktori})")
+    print(f"Throughput: {berhasil * 60 / durasi:.0f} mahasiswa/menit (antar penyelesaian: {laju.per_menit():.0f}/menit)")
+    print(hasil.laporan())
+    return 1 if gagal else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
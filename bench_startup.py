@@ -0,0 +1,104 @@
+"""Benchmark cold start aplikasi berbasis `python -X importtime`, dengan budget.
+
+Pemakaian:
+    python bench_startup.py            # ukur dan tampilkan hasil
+    python bench_startup.py --check    # exit code 1 jika ada modul yang melebihi budget
+    python bench_startup.py --update   # tulis ulang startup_budget.json dari hasil saat ini
+
+Setiap pengukuran memakai proses Python baru, sehingga yang terukur adalah biaya
+import nyata saat aplikasi dijalankan (tanpa membuat window Tk).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PATH_BUDGET = os.path.join(SCRIPT_DIR, "startup_budget.json")
+MODUL = ("aplikasi_biodata_oop", "biodata_oop_2")
+# Budget baru = median saat ini x MARGIN, agar variasi antar run tidak membuat gagal
+MARGIN = 1.5
+
+
+def ukur_import(modul):
+    """Menjalankan satu proses baru; mengembalikan (cumulative_us modul, {import langsung: us})."""
+    hasil = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modul}"],
+        cwd=SCRIPT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Output -X importtime berurutan post-order: import anak dicetak sebelum induknya
+    anak = {}
+    for baris in hasil.stderr.splitlines():
+        if not baris.startswith("import time:") or "cumulative" in baris:
+            continue
+        _, kumulatif_us, nama = baris.split("|")
+        nama = nama[1:]
+        kedalaman = (len(nama) - len(nama.lstrip())) // 2
+        if kedalaman == 1:
+            anak[nama.strip()] = int(kumulatif_us)
+        elif kedalaman == 0:
+            if nama == modul:
+                return int(kumulatif_us), anak
+            anak = {}
+    raise RuntimeError(f"Modul {modul} tidak ditemukan di output importtime")
+
+
+def ukur(modul, ulangan):
+    """Median waktu import kumulatif (us) dari beberapa proses, plus 5 import langsung terberat."""
+    sampel = []
+    anak = {}
+    for _ in range(ulangan):
+        us, anak = ukur_import(modul)
+        sampel.append(us)
+    terberat = sorted(anak.items(), key=lambda x: x[1], reverse=True)[:5]
+    return statistics.median(sampel), terberat
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="gagal (exit 1) jika melebihi budget")
+    parser.add_argument("--update", action="store_true", help="perbarui file budget")
+    parser.add_argument("-n", "--ulangan", type=int, default=7, help="jumlah proses per modul")
+    args = parser.parse_args(argv)
+
+    budget = {}
+    if os.path.exists(PATH_BUDGET):
+        with open(PATH_BUDGET, encoding="utf-8") as f:
+            budget = json.load(f)
+
+    gagal = []
+    hasil = {}
+    for modul in MODUL:
+        median_us, terberat = ukur(modul, args.ulangan)
+        hasil[modul] = median_us
+        batas = budget.get(modul)
+        status = ""
+        if batas is not None:
+            status = "OK" if median_us <= batas else "MELEBIHI BUDGET"
+            if median_us > batas:
+                gagal.append(modul)
+        batas_teks = f"{batas / 1000:.1f} ms" if batas is not None else "-"
+        print(f"{modul:<24} import {median_us / 1000:7.1f} ms  budget {batas_teks:>9}  {status}")
+        for nama, us in terberat:
+            print(f"    {nama:<28} {us / 1000:7.1f} ms")
+
+    if args.update:
+        budget = {modul: int(us * MARGIN) for modul, us in hasil.items()}
+        with open(PATH_BUDGET, "w", encoding="utf-8") as f:
+            json.dump(budget, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Budget diperbarui: {PATH_BUDGET}")
+
+    if args.check and gagal:
+        print(f"Startup regression: {', '.join(gagal)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,273 @@
+"""Benchmark lintas varian aplikasi biodata (file root dan workspace 231060500xx-*).
+
+Setiap varian dijalankan di proses Python baru dengan direktori kerja sementara
+(salinan file varian diimport dari sana lewat importlib), sehingga file yang
+ditulis varian dan state modul tidak saling bercampur. Di setiap proses:
+
+    1. import modul varian (mainloop dinonaktifkan, dialog messagebox diganti no-op)
+    2. buat instance kelas tk.Tk di modul (atau pakai widget global untuk varian
+       prosedural), sembunyikan window, login jika varian punya layar login
+    3. ulangi N kali: isi form -> validate_form -> submit_data -> simpan
+    4. ulangi lagi dengan tracemalloc untuk mengukur alokasi
+
+Varian yang gagal diimport/dibuat dilewati dan alasannya dicetak.
+Butuh tkinter yang bisa membuat window (display asli atau xvfb-run).
+
+Pemakaian:
+    python bench_varian.py              # semua varian, 200 iterasi
+    python bench_varian.py -n 500 --filter 0500
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_DILEWATI = {"__pycache__", ".git"}
+
+# Nama atribut yang dicoba untuk setiap field form (var_* lebih dulu, lalu entry_*)
+_FIELD = {
+    "nama": ("var_nama", "entry_nama"),
+    "nim": ("var_nim", "entry_nim"),
+    "jurusan": ("var_jurusan", "entry_jurusan"),
+    "email": ("var_email", "entry_email"),
+    "telepon": ("var_telepon", "var_telp", "entry_telepon", "entry_telp"),
+    "tgl_lahir": ("var_tgllahir", "var_tgl_lahir", "entry_tgllahir", "entry_tgl_lahir"),
+    "alamat": ("var_alamat", "text_alamat", "entry_alamat"),
+}
+_SIMPAN = ("simpan_hasil", "_simpan_hasil", "simpan_data")
+
+
+def cari_varian():
+    """File varian: .py (atau file tanpa ekstensi) yang berisi GUI tkinter dengan submit_data."""
+    hasil = []
+    for akar, folder, files in os.walk(SCRIPT_DIR):
+        folder[:] = sorted(f for f in folder if f not in _DILEWATI)
+        for nama in sorted(files):
+            path = os.path.join(akar, nama)
+            if not (nama.endswith(".py") or "." not in nama) or path == os.path.abspath(__file__):
+                continue
+            try:
+                with open(path, encoding="utf-8") as f:
+                    isi = f.read()
+            except (OSError, UnicodeDecodeError):
+                continue
+            if "tkinter" in isi and "def submit_data" in isi:
+                hasil.append(os.path.relpath(path, SCRIPT_DIR))
+    return hasil
+
+
+# --- Proses anak ---
+
+def _atur_field(ns, kandidat, nilai):
+    import tkinter as tk
+
+    for atribut in kandidat:
+        widget = getattr(ns, atribut, None)
+        if widget is None:
+            continue
+        if isinstance(widget, tk.Variable):
+            widget.set(nilai)
+        elif isinstance(widget, tk.Text):
+            widget.delete("1.0", tk.END)
+            widget.insert("1.0", nilai)
+        elif isinstance(widget, tk.Entry):
+            widget.delete(0, tk.END)
+            widget.insert(0, nilai)
+        else:
+            continue
+        return True
+    return False
+
+
+def _isi_form(ns, data):
+    for field, kandidat in _FIELD.items():
+        _atur_field(ns, kandidat, data[field])
+    _atur_field(ns, ("var_jk",), data["jenis_kelamin"])
+    _atur_field(ns, ("var_setuju",), 1)
+
+
+def _login(ns):
+    if not hasattr(ns, "_coba_login") or not hasattr(ns, "entry_username"):
+        return False
+    users = getattr(ns, "users_db", None)
+    if not users and hasattr(ns, "layanan"):
+        users = ns.layanan.users
+    username, password = next(iter((users or {"admin": "123"}).items()))
+    _atur_field(ns, ("entry_username",), username)
+    _atur_field(ns, ("entry_password",), password)
+    ns._coba_login()
+    return getattr(ns, "current_user", username) == username
+
+
+def _jalankan_anak(path, iterasi, iterasi_alokasi):
+    import importlib.machinery
+    import importlib.util
+    import tracemalloc
+    import tkinter as tk
+    from tkinter import messagebox
+
+    # Modul pendamping varian (folder asalnya) dan modul root tetap bisa diimport dari salinan
+    sys.path[:0] = [os.path.dirname(os.path.abspath(path)), SCRIPT_DIR]
+    from data_sintetis import mahasiswa as mahasiswa_sintetis
+
+    dialog = []
+    for nama in ("showinfo", "showwarning", "showerror"):
+        setattr(messagebox, nama, lambda *a, _jenis=nama, **k: dialog.append(_jenis))
+    for nama in ("askyesno", "askokcancel", "askquestion"):
+        setattr(messagebox, nama, lambda *a, **k: True)
+    tk.Misc.mainloop = lambda self, n=0: None
+
+    # Salinan di direktori kerja: file yang ditulis relatif terhadap __file__ atau cwd tetap terisolasi
+    nama_modul = "varian_biodata"
+    salinan = os.path.join(os.getcwd(), nama_modul + ".py")
+    shutil.copyfile(path, salinan)
+    loader = importlib.machinery.SourceFileLoader(nama_modul, salinan)
+    spec = importlib.util.spec_from_loader(nama_modul, loader)
+    modul = importlib.util.module_from_spec(spec)
+    sys.modules[nama_modul] = modul
+
+    hasil = {"varian": os.path.relpath(path, SCRIPT_DIR)}
+    mulai = time.perf_counter()
+    loader.exec_module(modul)
+    hasil["import_ms"] = (time.perf_counter() - mulai) * 1000
+
+    kelas = [k for k in vars(modul).values()
+             if isinstance(k, type) and issubclass(k, tk.Tk) and k.__module__ == nama_modul]
+    mulai = time.perf_counter()
+    if kelas:
+        ns = kelas[0]()
+        root = ns
+    else:
+        # Varian prosedural: widget dibuat sebagai variabel global saat import
+        ns = modul
+        root = next((v for v in vars(modul).values() if isinstance(v, tk.Tk)), None)
+    hasil["init_ms"] = (time.perf_counter() - mulai) * 1000
+    if root is not None:
+        root.withdraw()
+    hasil["login"] = _login(ns)
+
+    operasi = [("validate", getattr(ns, "validate_form", None)), ("submit", getattr(ns, "submit_data", None))]
+    simpan = next((getattr(ns, n) for n in _SIMPAN if hasattr(ns, n)), None)
+    operasi.append(("save", simpan))
+    operasi = [(nama, fungsi) for nama, fungsi in operasi if fungsi is not None]
+
+    import random
+
+    rng = random.Random(1)
+    sampel = {nama: [] for nama, _ in operasi}
+    gagal = {nama: 0 for nama, _ in operasi}
+
+    def satu_putaran(i, catat):
+        _isi_form(ns, mahasiswa_sintetis(i, rng))
+        for nama, fungsi in operasi:
+            t0 = time.perf_counter()
+            try:
+                fungsi()
+            except Exception:
+                gagal[nama] += 1
+            if catat:
+                sampel[nama].append(time.perf_counter() - t0)
+        if root is not None:
+            root.update()
+
+    for i in range(iterasi):
+        satu_putaran(i, True)
+    jumlah_dialog = len(dialog)
+
+    tracemalloc.start()
+    awal, _ = tracemalloc.get_traced_memory()
+    for i in range(iterasi, iterasi + iterasi_alokasi):
+        satu_putaran(i, False)
+    akhir, puncak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    for nama, nilai in sampel.items():
+        nilai.sort()
+        hasil[nama] = {
+            "p50_ms": statistics.median(nilai) * 1000,
+            "p99_ms": nilai[min(len(nilai) - 1, int(len(nilai) * 0.99))] * 1000,
+            "gagal": gagal[nama],
+        }
+    hasil["dialog_per_iterasi"] = jumlah_dialog / iterasi
+    hasil["alokasi_puncak_kb"] = (puncak - awal) / 1024
+    hasil["sisa_per_iterasi_b"] = (akhir - awal) / iterasi_alokasi
+    print("HASIL " + json.dumps(hasil))
+
+
+# --- Proses induk ---
+
+def _ukur_varian(path, args):
+    kerja = tempfile.mkdtemp(prefix="bench_varian_")
+    try:
+        proses = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--anak", os.path.join(SCRIPT_DIR, path),
+             "-n", str(args.iterasi), "--alokasi", str(args.alokasi)],
+            cwd=kerja, capture_output=True, text=True, timeout=args.timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return None, f"timeout {args.timeout} s"
+    finally:
+        shutil.rmtree(kerja, ignore_errors=True)
+    for baris in proses.stdout.splitlines():
+        if baris.startswith("HASIL "):
+            return json.loads(baris[6:]), None
+    error = [b for b in proses.stderr.strip().splitlines() if b.strip()]
+    return None, error[-1] if error else f"exit code {proses.returncode}"
+
+
+def _ms(hasil, operasi):
+    data = hasil.get(operasi)
+    if data is None:
+        return "-"
+    teks = f"{data['p50_ms']:.2f}"
+    return teks + "!" if data["gagal"] else teks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--iterasi", type=int, default=200)
+    parser.add_argument("--alokasi", type=int, default=50, help="iterasi untuk pengukuran tracemalloc")
+    parser.add_argument("--filter", help="hanya varian yang path-nya mengandung teks ini")
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--json", help="simpan hasil mentah ke file JSON")
+    parser.add_argument("--anak", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.anak:
+        _jalankan_anak(args.anak, args.iterasi, args.alokasi)
+        return 0
+
+    varian = [v for v in cari_varian() if not args.filter or args.filter in v]
+    hasil_semua = []
+    dilewati = []
+    for path in varian:
+        hasil, alasan = _ukur_varian(path, args)
+        if hasil is None:
+            dilewati.append((path, alasan))
+        else:
+            hasil_semua.append(hasil)
+
+    hasil_semua.sort(key=lambda h: h["import_ms"] + h["init_ms"])
+    print(f"{'varian':<58}{'start ms':>9}{'valid':>8}{'submit':>8}{'save':>8}{'dlg/it':>7}{'puncak KB':>10}{'sisa B/it':>10}")
+    for h in hasil_semua:
+        print(f"{h['varian'][:57]:<58}{h['import_ms'] + h['init_ms']:>9.1f}{_ms(h, 'validate'):>8}"
+              f"{_ms(h, 'submit'):>8}{_ms(h, 'save'):>8}{h['dialog_per_iterasi']:>7.1f}"
+              f"{h['alokasi_puncak_kb']:>10.1f}{h['sisa_per_iterasi_b']:>10.0f}")
+    print("(latensi = p50 ms; '!' = ada panggilan yang melempar exception; start = import + init)")
+    for path, alasan in dilewati:
+        print(f"DILEWATI {path}: {alasan}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"hasil": hasil_semua, "dilewati": dilewati}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
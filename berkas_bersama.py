@@ -0,0 +1,58 @@
+"""Append record ke file yang dipakai bersama beberapa proses (mis. folder bersama antar meja).
+
+Setiap penulisan mengambil advisory lock `fcntl.flock` pada file, lalu menulis
+seluruh record (satu atau satu batch) dengan satu `os.write` pada file yang dibuka
+O_APPEND. Lock hanya ditahan selama write tersebut, sehingga record dari proses
+lain tidak bisa terselip di tengah atau tertimpa. Header CSV ditulis hanya jika
+file masih kosong, dan pengecekannya dilakukan di dalam lock.
+
+Di platform tanpa fcntl (Windows) penulisan tetap satu write O_APPEND tanpa lock.
+"""
+import csv
+import io
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+def baris_csv(row):
+    """Satu baris CSV (dengan line terminator) sebagai string."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(row)
+    return buffer.getvalue()
+
+
+def tambah_ke_berkas(path, potongan, header=None):
+    """Menambahkan string/list string ke akhir file dalam satu penulisan ber-lock.
+
+    List berisi beberapa record ditulis sebagai satu batch (satu lock untuk semuanya).
+    `header` ditulis lebih dulu jika file masih kosong.
+    """
+    if isinstance(potongan, str):
+        potongan = [potongan]
+    data = "".join(potongan).encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            if header is not None and os.fstat(fd).st_size == 0:
+                data = header.encode("utf-8") + data
+            tampilan = memoryview(data)
+            while tampilan:
+                tertulis = os.write(fd, tampilan)
+                tampilan = tampilan[tertulis:]
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def tambah_baris_csv(path, row, header=None):
+    """Menambahkan satu baris CSV; `header` (list kolom) ditulis jika file masih kosong."""
+    tambah_ke_berkas(path, baris_csv(row), baris_csv(header) if header else None)
+
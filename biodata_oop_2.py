@@ -1,19 +1,9 @@
+# layanan_biodata dan configparser di-import di dalam method yang memakainya, dan
+# logging baru dikonfigurasi saat script dijalankan, agar import modul ini murah.
 import tkinter as tk
 from tkinter import messagebox
-import datetime
-from tkinter.font import Font
 import logging
-import configparser
 import os
-import re
-
-# Setup logging
-logging.basicConfig(
-    filename='aplikasi_biodata.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 
 # Membuat kelas utama aplikasi yang mewarisi dari tk.Tk
 class AplikasiBiodata(tk.Tk):
@@ -34,6 +24,9 @@ class AplikasiBiodata(tk.Tk):
         # Status login
         self.current_user = None
         self.config_file = "config.ini"
+        # Login, validasi dan penyimpanan ada di BiodataService (lihat property layanan)
+        self._layanan = None
+        self.data_terakhir = None
 
         # Atribut untuk manajemen frame
         self.frame_aktif = None
@@ -49,6 +42,16 @@ class AplikasiBiodata(tk.Tk):
         self.var_setuju = tk.IntVar()
         self.var_remember_me = tk.BooleanVar()
         self.var_show_password = tk.BooleanVar()
+        # Field form -> variabel, dengan kunci yang sama dengan record BiodataService
+        self.var_form = {
+            "nama": self.var_nama,
+            "nim": self.var_nim,
+            "jurusan": self.var_jurusan,
+            "email": self.var_email,
+            "telepon": self.var_telepon,
+            "tgl_lahir": self.var_tgl_lahir,
+            "jenis_kelamin": self.var_jk,
+        }
 
         # Buat tampilan
         self._buat_tampilan_login()
@@ -61,60 +64,54 @@ class AplikasiBiodata(tk.Tk):
         self._pindah_ke(self.frame_login)
         logging.info("Aplikasi dimulai")
     
+    @property
+    def layanan(self):
+        """BiodataService aplikasi, dibuat saat pertama kali dibutuhkan."""
+        if self._layanan is None:
+            from layanan_biodata import BiodataService
+
+            self._layanan = BiodataService(os.getcwd(), users=self.users_db)
+        return self._layanan
+
+    def _nilai_form(self):
+        """State field form biodata sebagai dict (kunci sama dengan kolom record)."""
+        nilai = {field: var.get() for field, var in self.var_form.items()}
+        nilai["alamat"] = self.text_alamat.get("1.0", "end-1c")
+        return nilai
+
     def submit_data(self):
+        from layanan_biodata import GagalValidasi
+
         try:
             # Cek checkbox
             if self.var_setuju.get() == 0:
                 messagebox.showwarning("Peringatan", "Anda harus menyetujui pengumpulan data!")
                 return
 
-            # Ambil data dari form
-            nama = self.entry_nama.get()
-            nim = self.entry_nim.get()
-            jurusan = self.entry_jurusan.get()
-            email = self.entry_email.get()
-            telepon = self.entry_telepon.get()
-            tgl_lahir = self.entry_tgl_lahir.get()
-            alamat = self.text_alamat.get("1.0", tk.END).strip()
-            jenis_kelamin = self.var_jk.get()
-
-            # Cek field kosong
-            if not nama or not nim or not jurusan or not email or not telepon or not tgl_lahir:
-                messagebox.showwarning("Input Kosong", "Semua field harus diisi!")
-                return
-            
-            # Validasi format NIM (harus angka dan minimal 8 digit)
-            if not nim.isdigit() or len(nim) < 8:
-                messagebox.showwarning("Format NIM Salah", "NIM harus berupa angka minimal 8 digit!")
-                self.entry_nim.focus_set()
-                return
-
-            # Validasi nama (tidak boleh hanya angka)
-            if nama.isdigit():
-                messagebox.showwarning("Format Nama Salah", "Nama tidak boleh hanya berupa angka!")
-                self.entry_nama.focus_set()
-                return
-
-            # Validasi format email
-            if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
-                messagebox.showwarning("Format Email Salah", "Format email tidak valid!")
-                self.entry_email.focus_set()
-                return
-            
-            # Validasi format telepon Indonesia (dimulai dengan 08, 10-13 digit)
-            if not re.match(r"^08[0-9]{8,11}$", telepon):
-                messagebox.showwarning("Format Telepon Salah", "Nomor telepon harus dimulai dengan '08' dan memiliki 10-13 digit.")
-                self.entry_telepon.focus_set()
+            # Validasi (field kosong, format NIM, nama, email, telepon, tanggal) oleh service
+            try:
+                record = self.layanan.submit(self._nilai_form())
+            except GagalValidasi as e:
+                messagebox.showwarning(e.judul, e.pesan)
+                entry = {
+                    "nama": self.entry_nama,
+                    "nim": self.entry_nim,
+                    "jurusan": self.entry_jurusan,
+                    "email": self.entry_email,
+                    "telepon": self.entry_telepon,
+                    "tgl_lahir": self.entry_tgl_lahir,
+                }.get(e.field)
+                if entry is not None:
+                    entry.focus_set()
                 return
 
-            # Tampilkan hasil
-            hasil = f"Nama: {nama}\nNIM: {nim}\nJurusan: {jurusan}\nEmail: {email}\nTelepon: {telepon}\nTanggal Lahir: {tgl_lahir}\nAlamat: {alamat}\nJenis Kelamin: {jenis_kelamin}"
-            messagebox.showinfo("Data Tersimpan", hasil)
-
             # Tampilkan hasil di label dengan info user
-            hasil_lengkap = f"BIODATA TERSIMPAN:\nDiinput oleh: {self.current_user}\n\n{hasil}"
+            hasil_lengkap = self.layanan.format_hasil(record, self.current_user)
+            messagebox.showinfo("Data Tersimpan", hasil_lengkap.split("\n\n", 1)[1])
+            self.data_terakhir = record
             self.label_hasil.config(text=hasil_lengkap)
-            logging.info(f"Data submitted by user: {self.current_user} - NIM: {nim}, Email: {email}, Telepon: {telepon}")
+            logging.info(f"Data submitted by user: {self.current_user} - NIM: {record['nim']}, "
+                         f"Email: {record['email']}, Telepon: {record['telepon']}")
 
         except Exception as e:
             logging.error(f"Error in submit_data by {self.current_user}: {str(e)}")
@@ -123,23 +120,13 @@ class AplikasiBiodata(tk.Tk):
     def simpan_hasil(self):
         """Simpan hasil biodata ke file dengan error handling"""
         try:
-            hasil_tersimpan = self.label_hasil.cget("text")
-
-            if not hasil_tersimpan or "BIODATA TERSIMPAN" not in hasil_tersimpan:
+            if self.data_terakhir is None:
                 messagebox.showwarning("Peringatan", "Tidak ada data untuk disimpan. Mohon submit terlebih dahulu.")
                 return
 
-            # Buat nama file dengan timestamp
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"biodata_{self.current_user}_{timestamp}.txt"
-
-            with open(filename, "w", encoding="utf-8") as file:
-                file.write(f"Data disimpan oleh: {self.current_user}\n")
-                file.write(f"Waktu penyimpanan: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                file.write("-" * 50 + "\n")
-                file.write(hasil_tersimpan)
-
-            messagebox.showinfo("Info", f"Data berhasil disimpan ke file '{filename}'.")
+            # File teks bertimestamp dan record store ditulis oleh service
+            full_path = self.layanan.save(self.data_terakhir, self.current_user)
+            messagebox.showinfo("Info", f"Data berhasil disimpan ke file '{os.path.basename(full_path)}'.")
 
         except PermissionError:
             messagebox.showerror("Error", "Tidak memiliki izin untuk menyimpan file di lokasi ini.")
@@ -147,15 +134,12 @@ class AplikasiBiodata(tk.Tk):
             messagebox.showerror("Error", f"Terjadi kesalahan saat menyimpan file:\n{str(e)}")
             
     def validate_form(self, *args):
-        nama_valid = self.var_nama.get().strip() != ""
-        nim_valid = self.var_nim.get().strip() != ""
-        jurusan_valid = self.var_jurusan.get().strip() != ""
-        email_valid = self.var_email.get().strip() != ""
-        telepon_valid = self.var_telepon.get().strip() != ""
-        tgl_lahir_valid = self.var_tgl_lahir.get().strip() != ""
+        from layanan_biodata import FIELD_WAJIB
+
+        wajib_valid = all(self.var_form[f].get().strip() for f in FIELD_WAJIB)
         setuju_valid = self.var_setuju.get() == 1
 
-        if nama_valid and nim_valid and jurusan_valid and email_valid and telepon_valid and tgl_lahir_valid and setuju_valid:
+        if wajib_valid and setuju_valid:
             self.btn_submit.config(state=tk.NORMAL)
         else:
             self.btn_submit.config(state=tk.DISABLED)
@@ -516,41 +500,37 @@ class AplikasiBiodata(tk.Tk):
         # Log attempt login
         logging.info(f"Login attempt for username: {username}")
 
-        # Validasi input kosong
-        if not username or not password:
-            logging.warning(f"Empty credentials attempt for username: {username}")
-            messagebox.showwarning("Login Gagal", "Username dan Password tidak boleh kosong.")
-            self.entry_username.focus_set()
-            return
+        from layanan_biodata import GagalLogin, GagalValidasi
 
-        # Validasi panjang minimum
-        if len(username) < 3:
-            logging.warning(f"Username too short: {username}")
-            messagebox.showwarning("Login Gagal", "Username minimal 3 karakter.")
+        # Validasi input dan cek kredensial oleh service
+        try:
+            self.layanan.login(username, password)
+        except GagalValidasi as e:
+            logging.warning(f"Invalid login input for username {username}: {e.pesan}")
+            messagebox.showwarning(e.judul, e.pesan)
             self.entry_username.focus_set()
             return
-
-        # Cek kredensial di database
-        if username in self.users_db and self.users_db[username] == password:
-            self.current_user = username
-            logging.info(f"Successful login for user: {username}")
-            messagebox.showinfo("Login Berhasil", f"Selamat Datang, {username}!")
-            self._reset_form_biodata()
-            self._update_title_with_user()
-            self._buat_menu()
-            self._pindah_ke(self.frame_biodata)
-            # Simpan username jika "Remember Me" dicentang
-            if self.var_remember_me.get():
-                self._simpan_username(username)
-            else:
-                self._hapus_username()
-            self.entry_username.delete(0, tk.END)
-            self.entry_password.delete(0, tk.END)
-        else:
+        except GagalLogin as e:
             logging.warning(f"Failed login attempt for username: {username}")
-            messagebox.showerror("Login Gagal", "Username atau Password salah.")
+            messagebox.showerror(e.judul, e.pesan)
             self.entry_password.delete(0, tk.END)
             self.entry_username.focus_set()
+            return
+
+        self.current_user = username
+        logging.info(f"Successful login for user: {username}")
+        messagebox.showinfo("Login Berhasil", f"Selamat Datang, {username}!")
+        self._reset_form_biodata()
+        self._update_title_with_user()
+        self._buat_menu()
+        self._pindah_ke(self.frame_biodata)
+        # Simpan username jika "Remember Me" dicentang
+        if self.var_remember_me.get():
+            self._simpan_username(username)
+        else:
+            self._hapus_username()
+        self.entry_username.delete(0, tk.END)
+        self.entry_password.delete(0, tk.END)
 
     def _reset_form_biodata(self):
         """Reset semua field di form biodata"""
@@ -564,6 +544,7 @@ class AplikasiBiodata(tk.Tk):
         self.var_jk.set("Pria")
         self.var_setuju.set(0)
         self.label_hasil.config(text="")
+        self.data_terakhir = None
         # Disable tombol submit setelah direset
         self.validate_form()
 
@@ -595,6 +576,8 @@ class AplikasiBiodata(tk.Tk):
     
     def _simpan_username(self, username):
         """Simpan username ke file konfigurasi."""
+        import configparser
+
         config = configparser.ConfigParser()
         if not config.has_section('Login'):
             config.add_section('Login')
@@ -604,8 +587,10 @@ class AplikasiBiodata(tk.Tk):
 
     def _muat_username(self):
         """Muat username dari file konfigurasi jika ada."""
-        config = configparser.ConfigParser()
         if os.path.exists(self.config_file):
+            import configparser
+
+            config = configparser.ConfigParser()
             config.read(self.config_file)
             if config.has_section('Login') and 'username' in config['Login']:
                 self.entry_username.insert(0, config['Login']['username'])
@@ -613,8 +598,10 @@ class AplikasiBiodata(tk.Tk):
 
     def _hapus_username(self):
         """Hapus username dari file konfigurasi."""
-        config = configparser.ConfigParser()
         if os.path.exists(self.config_file):
+            import configparser
+
+            config = configparser.ConfigParser()
             config.read(self.config_file)
             if config.has_section('Login'):
                 config.remove_section('Login')
@@ -651,10 +638,19 @@ class AplikasiBiodata(tk.Tk):
         """Keluar dari aplikasi dengan konfirmasi"""
         if messagebox.askokcancel("Keluar", "Apakah Anda yakin ingin keluar dari aplikasi?"):
             logging.info(f"Application closed by user: {self.current_user}")
+            if self._layanan is not None:
+                self._layanan.tutup()
             self.destroy()
 
 # Blok berikut hanya akan dieksekusi jika file ini dijalankan secara langsung
 if __name__ == "__main__":
+    # Setup logging
+    logging.basicConfig(
+        filename='aplikasi_biodata.log',
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
     # Membuat instance dari kelas aplikasi kita
     app = AplikasiBiodata()
     # Menjalankan mainloop dari instance tersebut
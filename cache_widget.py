@@ -0,0 +1,50 @@
+"""Cache state widget: `config()` hanya dikirim ke Tcl jika nilainya berubah."""
+
+
+class CacheWidget:
+    """Menyimpan nilai opsi widget terakhir yang diterapkan.
+
+    Setiap `widget.config(...)` / `widget[...]` adalah satu round trip ke Tcl.
+    Handler yang sering dipanggil (trace validasi, hover) cukup memanggil
+    `atur()`; jika nilainya sama dengan yang terakhir, panggilan Tcl dilewati.
+    Semua perubahan opsi yang di-cache harus lewat objek ini agar tetap sinkron.
+    """
+
+    def __init__(self):
+        self._nilai = {}
+        self.dikirim = 0
+        self.dihemat = 0
+
+    def daftarkan(self, widget, **opsi):
+        """Mencatat nilai awal opsi (mis. yang diberikan saat widget dibuat)."""
+        self._nilai.setdefault(str(widget), {}).update(opsi)
+
+    def atur(self, widget, **opsi):
+        """Menerapkan opsi yang berubah saja. Mengembalikan True jika ada config()."""
+        tersimpan = self._nilai.setdefault(str(widget), {})
+        berubah = {k: v for k, v in opsi.items() if tersimpan.get(k, self) != v}
+        if not berubah:
+            self.dihemat += 1
+            return False
+        widget.config(**berubah)
+        tersimpan.update(berubah)
+        self.dikirim += 1
+        return True
+
+    def baca(self, widget, opsi):
+        """Membaca nilai opsi dari cache; fallback ke cget() jika belum dikenal."""
+        tersimpan = self._nilai.setdefault(str(widget), {})
+        if opsi not in tersimpan:
+            tersimpan[opsi] = widget.cget(opsi)
+        return tersimpan[opsi]
+
+    def lupakan(self, widget):
+        """Menghapus cache untuk widget (mis. setelah widget di-destroy)."""
+        self._nilai.pop(str(widget), None)
+
+    def reset_statistik(self):
+        self.dikirim = 0
+        self.dihemat = 0
+
+    def ringkasan(self):
+        return f"Widget cache: {self.dikirim} config calls sent, {self.dihemat} Tcl calls saved"
@@ -0,0 +1,182 @@
+"""Pemeriksaan outbox registrar terhadap registrar tiruan lokal (http.server).
+
+Registrar tiruan men-dedup record berdasarkan idempotency_key, menolak (422)
+record tanpa nama, dan bisa diberi gangguan: sebagian request dijawab 503 atau
+koneksinya diputus sebelum/sesudah record diterima (respons hilang).
+
+Skenario:
+    1. registrar mati: record masuk outbox, worker berhenti, outbox dibuka ulang
+       dan record masih ada (tahan restart)
+    2. registrar hidup dengan gangguan: outbox harus kosong, setiap NIM diterima
+       dengan versi terbaru, record tanpa nama ditandai ditolak, dan koneksi HTTP
+       dipakai ulang (jumlah koneksi jauh lebih kecil dari jumlah request)
+
+Pemakaian:
+    python cek_outbox.py                 # 2000 record, 30% request bermasalah
+    python cek_outbox.py -n 10000 --gangguan 0.5
+Exit code 1 jika ada yang salah.
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from data_sintetis import mahasiswa
+from outbox_registrar import OutboxRegistrar
+
+
+class RegistrarTiruan(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, gangguan=0.0, seed=1):
+        self.gangguan = gangguan
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.diterima = {}
+        self.jumlah_kiriman = {}
+        self.jumlah_request = 0
+        self.koneksi = set()
+        super().__init__(("127.0.0.1", 0), _Handler)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/api/biodata"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with server.lock:
+            server.jumlah_request += 1
+            server.koneksi.add(self.client_address)
+            # 0 = 503, 1 = putus sebelum diproses, 2 = respons hilang, None = normal
+            gangguan = server.rng.randrange(3) if server.rng.random() < server.gangguan else None
+        if gangguan == 0:
+            self._kirim(503, {"error": "sedang pemeliharaan"})
+            return
+        if gangguan == 1:
+            # Koneksi putus sebelum record diproses
+            self.close_connection = True
+            self.connection.shutdown(socket.SHUT_RDWR)
+            return
+
+        records = json.loads(body)["records"]
+        if any(not r.get("nama") for r in records):
+            self._kirim(422, {"error": "nama wajib diisi"})
+            return
+        with server.lock:
+            for r in records:
+                server.diterima[r["idempotency_key"]] = r
+                server.jumlah_kiriman[r["idempotency_key"]] = server.jumlah_kiriman.get(r["idempotency_key"], 0) + 1
+        if gangguan == 2:
+            # Record sudah diterima tetapi respons hilang: klien akan mengirim ulang
+            self.close_connection = True
+            self.connection.shutdown(socket.SHUT_RDWR)
+            return
+        self._kirim(200, {"diterima": len(records)})
+
+    def _kirim(self, status, isi):
+        data = json.dumps(isi).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def _tunggu(kondisi, timeout):
+    batas = time.monotonic() + timeout
+    while time.monotonic() < batas:
+        if kondisi():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--jumlah", type=int, default=2000)
+    parser.add_argument("--gangguan", type=float, default=0.3, help="fraksi request yang bermasalah (0-1)")
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.ERROR, format='%(levelname)s - %(message)s')
+
+    rng = random.Random(1)
+    records = [mahasiswa(i, rng) for i in range(args.jumlah)]
+    # Sebagian NIM disimpan ulang (koreksi data): registrar harus menerima versi terakhir
+    koreksi = [dict(r, nama=r["nama"] + " (koreksi)") for r in records[::10]]
+    ditolak = dict(records[-1], nim="99999999999", nama="")
+    terakhir = {r["nim"]: r for r in records + koreksi}
+
+    path = os.path.join(tempfile.mkdtemp(prefix="cek_outbox_"), "outbox.db")
+    masalah = []
+
+    # 1. Registrar mati: record harus bertahan di outbox melewati restart
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port_mati = s.getsockname()[1]
+    outbox = OutboxRegistrar(path, f"http://127.0.0.1:{port_mati}/api/biodata", backoff_awal=0.05)
+    outbox.mulai()
+    outbox.tambah_banyak(records[: len(records) // 2])
+    time.sleep(0.2)
+    outbox.berhenti()
+    outbox = OutboxRegistrar(path, f"http://127.0.0.1:{port_mati}/api/biodata")
+    tertunda = outbox.jumlah_tertunda()
+    outbox.berhenti()
+    print(f"Registrar mati: {tertunda} record tertunda setelah restart")
+    if tertunda != len(records) // 2:
+        masalah.append(f"record hilang saat registrar mati: {tertunda} dari {len(records) // 2}")
+
+    # 2. Registrar hidup dengan gangguan
+    server = RegistrarTiruan(gangguan=args.gangguan)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    outbox = OutboxRegistrar(path, server.url, backoff_awal=0.01, backoff_maks=0.2)
+    mulai = time.perf_counter()
+    outbox.mulai()
+    outbox.tambah_banyak(records[len(records) // 2:])
+    outbox.tambah(ditolak)
+    outbox.tambah_banyak(koreksi)
+    selesai = _tunggu(lambda: outbox.jumlah_tertunda() == 0, args.timeout)
+    durasi = time.perf_counter() - mulai
+    jumlah_ditolak = outbox.jumlah_ditolak()
+    outbox.berhenti()
+    server.shutdown()
+
+    ganda = sum(n - 1 for n in server.jumlah_kiriman.values())
+    print(f"Registrar dengan gangguan {args.gangguan:.0%}: {len(server.diterima)} NIM diterima dalam {durasi:.2f} s, "
+          f"{server.jumlah_request} request lewat {len(server.koneksi)} koneksi, {ganda} kiriman ganda (at-least-once)")
+    if not selesai:
+        masalah.append(f"outbox belum kosong setelah {args.timeout} s")
+    hilang = [nim for nim in terakhir if nim not in server.diterima]
+    if hilang:
+        masalah.append(f"{len(hilang)} NIM tidak sampai ke registrar, mis. {hilang[:3]}")
+    usang = [nim for nim, r in terakhir.items() if nim in server.diterima and server.diterima[nim]["nama"] != r["nama"]]
+    if usang:
+        masalah.append(f"{len(usang)} NIM diterima dengan versi lama, mis. {usang[:3]}")
+    if ditolak["nim"] in server.diterima or jumlah_ditolak != 1:
+        masalah.append(f"record tanpa nama tidak ditandai ditolak (ditolak: {jumlah_ditolak})")
+    if len(server.koneksi) * 2 > server.jumlah_request:
+        masalah.append("koneksi HTTP tidak dipakai ulang")
+
+    for m in masalah:
+        print(f"GAGAL: {m}")
+    if not masalah:
+        print("OK")
+    return 1 if masalah else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
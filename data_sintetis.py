@@ -0,0 +1,200 @@
+"""Generator data mahasiswa sintetis (bukan data asli) untuk uji skala.
+
+Record dibuat per potongan (chunk) dengan seed turunan dari --seed dan nomor
+potongan, sehingga hasilnya sama persis berapa pun jumlah proses yang dipakai.
+Setiap proses memformat potongannya sendiri (CSV/JSONL) dan proses utama hanya
+menulis hasilnya berurutan.
+
+Format data mengikuti form biodata:
+    NIM        23 + kode 106050.. + urut 3 digit (1000 record pertama: 23106050000-23106050999)
+    telepon    08... atau +62...
+    tgl_lahir  DD-MM-YYYY
+    alamat     "jln. ... no. .. gg. ..., kota"
+
+Sebagian record (--invalid) sengaja dibuat tidak valid menurut aturan
+BiodataService.validate (field kosong, NIM pendek, email/telepon/tanggal salah).
+
+Pemakaian:
+    python data_sintetis.py -n 1000000 -o mahasiswa.csv
+    python data_sintetis.py -n 200000 -f jsonl -o - --invalid 0.05 --label
+    python data_sintetis.py -n 1000000 -f db -o biodata.db -p 8
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+from layanan_biodata import FIELD_FORM
+
+NAMA_PRIA = ("Budi", "Agus", "Rizky", "Andi", "Fajar", "Dimas", "Bayu", "Eko", "Hendra", "Ilham", "Joko",
+             "Muhammad", "Reza", "Yoga", "Arif", "Teguh", "Wahyu", "Fikri", "Galih", "Rangga")
+NAMA_WANITA = ("Siti", "Dewi", "Putri", "Nur", "Ayu", "Rina", "Indah", "Lestari", "Fitri", "Nabila", "Aisyah",
+               "Annisa", "Wulan", "Dian", "Ratna", "Sri", "Intan", "Salsabila", "Maya", "Rahma")
+NAMA_BELAKANG = ("Santoso", "Rahmawati", "Pratama", "Lestari", "Hidayat", "Wibowo", "Saputra", "Kusuma",
+                 "Nugroho", "Setiawan", "Permata", "Utami", "Purnomo", "Maharani", "Hakim", "Ramadhan",
+                 "Susanto", "Kurniawan", "Anggraini", "Firmansyah", "Syahputra", "Wijaya")
+JURUSAN = ("Informatika", "Sistem Informasi", "Teknik Elektro", "Teknik Industri", "Matematika", "Fisika",
+           "Kimia", "Biologi", "Pendidikan Matematika", "Ilmu Komunikasi", "Psikologi", "Hukum Keluarga")
+JALAN = ("Kaliurang", "Malioboro", "Magelang", "Solo", "Wonosari", "Parangtritis", "Godean", "Gejayan",
+         "Timoho", "Laksda Adisucipto", "Imogiri", "Bantul", "Palagan", "Monjali", "Kusumanegara")
+GANG = ("Melati", "Mawar", "Kenanga", "Anggrek", "Cempaka", "Flamboyan", "Dahlia", "Sawo", "Nangka", "Jambu")
+KOTA = ("Yogyakarta", "Sleman", "Bantul", "Kulon Progo", "Gunungkidul", "Klaten", "Magelang", "Surakarta")
+DOMAIN_EMAIL = ("student.uin-suka.ac.id", "gmail.com", "yahoo.co.id")
+
+UKURAN_POTONGAN = 10000
+FORMAT = ("csv", "jsonl", "db")
+
+
+def nim(i):
+    """NIM unik ke-i dengan bentuk 11 digit seperti 23106050012."""
+    blok, urut = divmod(i, 1000)
+    return f"23{106050 + blok:06d}{urut:03d}"
+
+
+def mahasiswa(i, rng):
+    """Satu record form yang valid untuk mahasiswa ke-i."""
+    jenis_kelamin = rng.choice(("Pria", "Wanita"))
+    depan = rng.choice(NAMA_PRIA if jenis_kelamin == "Pria" else NAMA_WANITA)
+    belakang = rng.choice(NAMA_BELAKANG)
+    nomor = nim(i)
+    if rng.random() < 0.7:
+        telepon = f"08{rng.randrange(10 ** 8, 10 ** 11)}"
+    else:
+        telepon = f"+628{rng.randrange(10 ** 8, 10 ** 11)}"
+    return {
+        "nama": f"{depan} {belakang}",
+        "nim": nomor,
+        "jurusan": JURUSAN[(i // 1000) % len(JURUSAN)],
+        "email": f"{depan.lower()}.{belakang.lower()}{nomor[-5:]}@{rng.choice(DOMAIN_EMAIL)}",
+        "telepon": telepon,
+        "tgl_lahir": f"{rng.randint(1, 28):02d}-{rng.randint(1, 12):02d}-{rng.randint(1998, 2007)}",
+        "alamat": f"jln. {rng.choice(JALAN)} no. {rng.randint(1, 150)} gg. {rng.choice(GANG)}, {rng.choice(KOTA)}",
+        "jenis_kelamin": jenis_kelamin,
+    }
+
+
+def rusak(record, rng):
+    """Mengubah satu field sehingga record ditolak oleh validasi form."""
+    jenis = rng.randrange(6)
+    if jenis == 0:
+        record[rng.choice(("nama", "nim", "jurusan", "email", "telepon"))] = ""
+    elif jenis == 1:
+        record["nama"] = str(rng.randrange(10 ** 5, 10 ** 9))
+    elif jenis == 2:
+        record["nim"] = rng.choice((record["nim"][:6], record["nim"][:-1] + "X"))
+    elif jenis == 3:
+        record["email"] = record["email"].replace("@", rng.choice(("", " at ", "@@")))
+    elif jenis == 4:
+        record["telepon"] = rng.choice(("07" + record["telepon"][-9:], record["telepon"][:7], "0812-3456-789"))
+    else:
+        tanggal = record["tgl_lahir"]
+        record["tgl_lahir"] = rng.choice((f"31-02-{tanggal[-4:]}", f"{tanggal[-4:]}-{tanggal[3:5]}-{tanggal[:2]}"))
+    return record
+
+
+def potongan_record(nomor, awal, akhir, seed, fraksi_invalid):
+    """Record ke-awal..akhir-1 beserta status validnya; hasil hanya bergantung pada seed dan nomor potongan."""
+    rng = random.Random(seed * 1_000_003 + nomor)
+    hasil = []
+    for i in range(awal, akhir):
+        record = mahasiswa(i, rng)
+        valid = rng.random() >= fraksi_invalid
+        hasil.append((record if valid else rusak(record, rng), valid))
+    return hasil
+
+
+def _kerjakan(tugas):
+    """Worker: membuat satu potongan lalu memformatnya sesuai format output."""
+    nomor, awal, akhir, seed, fraksi_invalid, format_, label = tugas
+    records = potongan_record(nomor, awal, akhir, seed, fraksi_invalid)
+    if format_ == "db":
+        return [record for record, valid in records]
+    buffer = io.StringIO()
+    if format_ == "csv":
+        writer = csv.writer(buffer, lineterminator="\n")
+        for record, valid in records:
+            row = [record[f] for f in FIELD_FORM]
+            writer.writerow(row + [int(valid)] if label else row)
+    else:
+        for record, valid in records:
+            if label:
+                record["valid"] = valid
+            buffer.write(json.dumps(record, ensure_ascii=False))
+            buffer.write("\n")
+    return buffer.getvalue()
+
+
+def _tugas(args):
+    for nomor, awal in enumerate(range(0, args.jumlah, UKURAN_POTONGAN)):
+        akhir = min(awal + UKURAN_POTONGAN, args.jumlah)
+        yield nomor, awal, akhir, args.seed, args.invalid, args.format, args.label
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--jumlah", type=int, default=100000, help="jumlah record")
+    parser.add_argument("-o", "--output", required=True, help="file output ('-' untuk stdout pada csv/jsonl)")
+    parser.add_argument("-f", "--format", choices=FORMAT, help="default: ditebak dari ekstensi output")
+    parser.add_argument("-p", "--proses", type=int, default=os.cpu_count() or 1, help="jumlah proses worker")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--invalid", type=float, default=0.0, help="fraksi record yang sengaja tidak valid (0-1)")
+    parser.add_argument("--label", action="store_true", help="tambahkan kolom 'valid' pada csv/jsonl")
+    args = parser.parse_args(argv)
+
+    if args.format is None:
+        ekstensi = os.path.splitext(args.output)[1].lstrip(".").lower()
+        args.format = {"json": "jsonl", "sqlite": "db"}.get(ekstensi, ekstensi)
+        if args.format not in FORMAT:
+            parser.error("format tidak bisa ditebak dari nama file; gunakan -f")
+    if not 0 <= args.invalid <= 1:
+        parser.error("--invalid harus di antara 0 dan 1")
+    if args.format == "db" and (args.invalid or args.output == "-"):
+        parser.error("format db hanya menerima data valid ke file database (--invalid 0)")
+
+    mulai = time.perf_counter()
+    tugas = _tugas(args)
+    with multiprocessing.Pool(args.proses) if args.proses > 1 else contextlib.nullcontext() as pool:
+        # imap menjaga urutan potongan; potongan berikutnya sudah dibuat worker selama menulis
+        hasil = pool.imap(_kerjakan, tugas) if pool is not None else map(_kerjakan, tugas)
+        if args.format == "db":
+            _tulis_db(args.output, hasil)
+        else:
+            _tulis_teks(args.output, args.format, args.label, hasil)
+    durasi = time.perf_counter() - mulai
+    print(f"{args.jumlah} record ({args.format}) ke {args.output} dalam {durasi:.2f} s "
+          f"({args.jumlah / durasi:.0f} record/detik, {args.proses} proses)", file=sys.stderr)
+    return 0
+
+
+def _tulis_teks(output, format_, label, potongan):
+    file = sys.stdout if output == "-" else open(output, "w", encoding="utf-8", newline="")
+    try:
+        if format_ == "csv":
+            file.write(",".join(FIELD_FORM + (("valid",) if label else ())) + "\n")
+        for teks in potongan:
+            file.write(teks)
+    finally:
+        if file is not sys.stdout:
+            file.close()
+
+
+def _tulis_db(output, potongan):
+    from penyimpanan import PenyimpananBiodata
+
+    store = PenyimpananBiodata(output)
+    waktu = time.strftime('%Y-%m-%d %H:%M:%S')
+    try:
+        for records in potongan:
+            store.simpan_banyak([dict(r, diinput_oleh="generator", waktu=waktu) for r in records])
+    finally:
+        store.tutup()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
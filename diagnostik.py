@@ -0,0 +1,319 @@
+"""Alat diagnostik runtime untuk Aplikasi Biodata (profiling, lag event loop, memori).
+
+Semua laporan ditulis ke direktori diagnostik, default `diagnostik/` di samping
+script aplikasi, atau ke path pada environment variable BIODATA_DIAGNOSTIK_DIR.
+
+Modul berat (cProfile, pstats, tracemalloc, traceback) baru di-import saat fitur
+yang membutuhkannya dipakai, agar modul ini murah di-import saat startup.
+"""
+import collections
+import logging
+import math
+import os
+import sys
+import threading
+import time
+
+from instrumentasi import Histogram
+
+
+def direktori_diagnostik(script_dir):
+    """Mengembalikan (dan membuat bila perlu) direktori untuk laporan diagnostik."""
+    path = os.environ.get("BIODATA_DIAGNOSTIK_DIR") or os.path.join(script_dir, "diagnostik")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _cap_waktu():
+    return time.strftime("%Y%m%d_%H%M%S")
+
+
+def _label_frame(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def stack_terlipat(frame):
+    """Mengubah stack frame menjadi satu baris format collapsed-stack (root;...;leaf)."""
+    bagian = []
+    while frame is not None:
+        bagian.append(_label_frame(frame))
+        frame = frame.f_back
+    bagian.reverse()
+    return ";".join(bagian)
+
+
+class _SamplerStack(threading.Thread):
+    """Thread yang mengambil sampel stack sebuah thread lain secara berkala."""
+
+    def __init__(self, thread_id, interval=0.005):
+        super().__init__(name="biodata-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.hitungan = collections.Counter()
+        self._berhenti = threading.Event()
+
+    def run(self):
+        current_frames = sys._current_frames
+        while not self._berhenti.wait(self.interval):
+            frame = current_frames().get(self.thread_id)
+            if frame is not None:
+                self.hitungan[stack_terlipat(frame)] += 1
+
+    def hentikan(self):
+        self._berhenti.set()
+        self.join()
+
+
+class Profiler:
+    """Profiler yang bisa dinyalakan/dimatikan saat event loop Tk sedang berjalan.
+
+    cProfile menghasilkan file .pstats, sedangkan sampler stack menghasilkan file
+    .collapsed yang bisa langsung dibaca flamegraph.pl / speedscope.
+    """
+
+    def __init__(self, direktori, interval_sampel=0.005):
+        self.direktori = direktori
+        self.interval_sampel = interval_sampel
+        self._profile = None
+        self._sampler = None
+        self._mulai = None
+
+    @property
+    def aktif(self):
+        return self._profile is not None
+
+    def mulai(self):
+        """Mulai profiling thread pemanggil (thread Tk)."""
+        if self.aktif:
+            return
+        import cProfile
+
+        self._mulai = _cap_waktu()
+        self._sampler = _SamplerStack(threading.get_ident(), self.interval_sampel)
+        self._sampler.start()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        logging.info("Profiling started")
+
+    def berhenti(self):
+        """Menghentikan profiling dan menulis laporan. Mengembalikan path file .pstats."""
+        if not self.aktif:
+            return None
+        import pstats
+
+        self._profile.disable()
+        self._sampler.hentikan()
+
+        basis = os.path.join(self.direktori, f"profil_{self._mulai}")
+        path_pstats = basis + ".pstats"
+        self._profile.dump_stats(path_pstats)
+        with open(basis + ".txt", "w", encoding="utf-8") as f:
+            stats = pstats.Stats(self._profile, stream=f)
+            stats.sort_stats("cumulative").print_stats(50)
+        with open(basis + ".collapsed", "w", encoding="utf-8") as f:
+            for stack, jumlah in self._sampler.hitungan.most_common():
+                f.write(f"{stack} {jumlah}\n")
+
+        self._profile = None
+        self._sampler = None
+        logging.info(f"Profiling stopped, report written to {basis}.*")
+        return path_pstats
+
+
+def ambang_pemantau_lag():
+    """Membaca BIODATA_PEMANTAU_LAG: None jika nonaktif, selain itu ambang lag dalam detik."""
+    nilai = os.environ.get("BIODATA_PEMANTAU_LAG", "").strip()
+    if not nilai or nilai == "0":
+        return None
+    if nilai == "1":
+        return 0.2
+    try:
+        ambang = float(nilai) / 1000.0
+    except ValueError:
+        ambang = 0.0
+    if not math.isfinite(ambang) or ambang <= 0:
+        # Ambang <= 0 membuat watchdog berputar tanpa jeda dan setiap tick tercatat freeze
+        logging.warning(f"Invalid BIODATA_PEMANTAU_LAG={nilai!r} (expected ms > 0), lag monitor disabled")
+        return None
+    return ambang
+
+
+class PemantauLag:
+    """Watchdog event loop Tk berbasis `after()`.
+
+    Setiap tick dijadwalkan `interval` detik ke depan; selisih antara waktu tick
+    benar-benar berjalan dan waktu yang diharapkan adalah lag event loop. Thread
+    watchdog terpisah mengambil sampel stack thread Tk *selama* freeze berlangsung,
+    sehingga penyebabnya (mis. simpan_hasil atau submit_data) ikut tercatat.
+    """
+
+    def __init__(self, widget, direktori, interval=0.1, ambang=0.2):
+        self.widget = widget
+        self.direktori = direktori
+        self.interval = interval
+        self.ambang = ambang
+        self.histogram = Histogram()
+        self.jumlah_freeze = 0
+        self._thread_tk = threading.get_ident()
+        self._diharapkan = None
+        self._sudah_disampel = False
+        self._after_id = None
+        self._berhenti = threading.Event()
+        self._watchdog = threading.Thread(target=self._awasi, name="biodata-pemantau-lag", daemon=True)
+
+    def mulai(self):
+        """Mulai memantau; harus dipanggil dari thread Tk."""
+        self._jadwalkan()
+        self._watchdog.start()
+        logging.info(f"Event loop lag monitor started (threshold {self.ambang * 1000:.0f} ms)")
+
+    def _jadwalkan(self):
+        self._sudah_disampel = False
+        self._diharapkan = time.perf_counter() + self.interval
+        self._after_id = self.widget.after(int(self.interval * 1000), self._tick)
+
+    def _tick(self):
+        lag = max(0.0, time.perf_counter() - self._diharapkan)
+        self.histogram.tambah(lag)
+        if lag >= self.ambang:
+            self.jumlah_freeze += 1
+            logging.warning(f"Event loop lag {lag * 1000:.0f} ms")
+        self._jadwalkan()
+
+    def _awasi(self):
+        import traceback
+
+        current_frames = sys._current_frames
+        while not self._berhenti.wait(self.ambang / 2):
+            diharapkan = self._diharapkan
+            if self._sudah_disampel or diharapkan is None:
+                continue
+            telat = time.perf_counter() - diharapkan
+            if telat < self.ambang:
+                continue
+            frame = current_frames().get(self._thread_tk)
+            if frame is None:
+                continue
+            self._sudah_disampel = True
+            stack = "".join(traceback.format_stack(frame))
+            logging.warning(f"Event loop blocked for {telat * 1000:.0f} ms, Tk thread stack:\n{stack}")
+            path = os.path.join(self.direktori, f"lag_{time.strftime('%Y%m%d')}.log")
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(f"--- {time.strftime('%Y-%m-%d %H:%M:%S')} blocked {telat * 1000:.0f} ms\n")
+                f.write(stack)
+                f.write(f"collapsed: {stack_terlipat(frame)}\n")
+
+    def laporan(self):
+        """Ringkasan persentil lag (ms)."""
+        h = self.histogram
+        return (
+            f"Event loop lag: ticks={h.jumlah} freezes={self.jumlah_freeze} "
+            f"p50={h.persentil(50) * 1000:.1f} p90={h.persentil(90) * 1000:.1f} "
+            f"p99={h.persentil(99) * 1000:.1f} max={h.maksimum * 1000:.1f} ms"
+        )
+
+    def berhenti(self):
+        """Menghentikan pemantau dan mencatat ringkasan ke log."""
+        self._berhenti.set()
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        logging.info(self.laporan())
+
+
+def interval_pelacak_memori():
+    """Membaca BIODATA_PELACAK_MEMORI: None jika nonaktif, selain itu interval snapshot (detik)."""
+    nilai = os.environ.get("BIODATA_PELACAK_MEMORI", "").strip()
+    if not nilai or nilai == "0":
+        return None
+    if nilai == "1":
+        return 300.0
+    try:
+        interval = float(nilai)
+    except ValueError:
+        interval = 0.0
+    if interval <= 0:
+        # after(0) berulang akan mengambil snapshot terus-menerus
+        logging.warning(f"Invalid BIODATA_PELACAK_MEMORI={nilai!r} (expected seconds > 0), memory tracker disabled")
+        return None
+    return interval
+
+
+class PelacakMemori:
+    """Mengambil snapshot tracemalloc secara berkala dan di setiap batas sesi login.
+
+    Setiap snapshot dibandingkan dengan snapshot sebelumnya dan dengan snapshot
+    login pertama, sehingga pertumbuhan memori yang menumpuk di siklus
+    login/logout (mis. objek tk.Menu atau teks label_hasil) terlihat jelas.
+    """
+
+    def __init__(self, widget, direktori, interval=300.0, jumlah_teratas=25, kedalaman=10):
+        import tracemalloc
+
+        self._tracemalloc = tracemalloc
+        self.widget = widget
+        self.direktori = direktori
+        self.interval = interval
+        self.jumlah_teratas = jumlah_teratas
+        self.kedalaman = kedalaman
+        self.path_laporan = os.path.join(direktori, f"memori_{_cap_waktu()}.log")
+        self._awal = None
+        self._sebelumnya = None
+        self._after_id = None
+        self._filter = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            # Abaikan alokasi milik pelacak ini sendiri (linecache, format laporan)
+            tracemalloc.Filter(False, __file__, all_frames=True),
+        )
+
+    def mulai(self):
+        """Mulai tracemalloc dan penjadwalan snapshot periodik."""
+        if not self._tracemalloc.is_tracing():
+            self._tracemalloc.start(self.kedalaman)
+        self.snapshot("start")
+        self._jadwalkan()
+        logging.info(f"Memory tracker started, report: {self.path_laporan}")
+
+    def _jadwalkan(self):
+        self._after_id = self.widget.after(int(self.interval * 1000), self._periodik)
+
+    def _periodik(self):
+        self.snapshot("periodic")
+        self._jadwalkan()
+
+    def snapshot(self, label):
+        """Mengambil satu snapshot dan menulis diff allocator teratas ke laporan."""
+        snap = self._tracemalloc.take_snapshot().filter_traces(self._filter)
+        sekarang, puncak = self._tracemalloc.get_traced_memory()
+        with open(self.path_laporan, "a", encoding="utf-8") as f:
+            f.write(f"=== {time.strftime('%Y-%m-%d %H:%M:%S')} {label} "
+                    f"traced={sekarang / 1024:.1f} KiB peak={puncak / 1024:.1f} KiB\n")
+            if self._sebelumnya is not None:
+                f.write("-- top diff vs previous snapshot\n")
+                for stat in snap.compare_to(self._sebelumnya, "lineno")[:self.jumlah_teratas]:
+                    f.write(f"{stat}\n")
+            if self._awal is not None:
+                f.write("-- top diff vs first login\n")
+                for stat in snap.compare_to(self._awal, "traceback")[:5]:
+                    f.write(f"{stat}\n")
+                    for baris in stat.traceback.format(limit=self.kedalaman):
+                        f.write(f"    {baris}\n")
+        if label == "login" and self._awal is None:
+            self._awal = snap
+        self._sebelumnya = snap
+
+    def berhenti(self):
+        """Snapshot terakhir lalu menghentikan tracemalloc."""
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        self.snapshot("exit")
+        self._tracemalloc.stop()
@@ -0,0 +1,132 @@
+"""Autosave draf form biodata ke jurnal per user, untuk pemulihan setelah crash.
+
+Jurnal berupa file JSONL: setiap baris {"ts": ..., "ubah": {field: nilai}} hanya
+berisi field yang berubah sejak penulisan sebelumnya. Draf dipulihkan dengan
+memutar ulang semua baris. Jika jurnal sudah terlalu panjang, isinya dipadatkan
+menjadi satu baris berisi state lengkap.
+
+Penulisan dilakukan di thread latar; perubahan yang datang sebelum thread sempat
+menulis digabung menjadi satu baris.
+"""
+import json
+import logging
+import os
+import threading
+import time
+
+# Form dibandingkan dengan state terakhir setiap INTERVAL_MS
+INTERVAL_MS = 3000
+MAKS_BARIS = 200
+
+
+def path_draf(direktori, user):
+    """Path jurnal draf untuk seorang user."""
+    aman = "".join(c if c.isalnum() or c in "-_" else "_" for c in user)
+    return os.path.join(direktori, f"draf_{aman}.jsonl")
+
+
+def muat_draf(path):
+    """Memutar ulang jurnal; mengembalikan (state dict, jumlah baris).
+
+    Jika ada baris rusak, jumlah baris dikembalikan 0 agar penulisan berikutnya
+    menulis ulang jurnal dengan state lengkap (tidak menyambung ke baris rusak).
+    """
+    state = {}
+    jumlah = 0
+    try:
+        with open(path, encoding="utf-8") as f:
+            for baris in f:
+                try:
+                    state.update(json.loads(baris)["ubah"])
+                except (ValueError, KeyError, TypeError):
+                    # Baris terakhir bisa terpotong jika proses mati saat menulis
+                    return state, 0
+                jumlah += 1
+    except OSError:
+        pass
+    return state, jumlah
+
+
+class AutosaveDraf:
+    """Menulis perubahan field form ke jurnal draf di thread latar."""
+
+    def __init__(self, path, awal=None, jumlah_baris=0):
+        self.path = path
+        # State yang sudah diserahkan ke thread penulis (dipakai dari thread UI)
+        self._terakhir = dict(awal or {})
+        # State yang tercermin di file (dipakai dari thread penulis)
+        self._disk = dict(self._terakhir)
+        self._baris = jumlah_baris
+        self._tertunda = {}
+        self._hapus = False
+        self._berhenti = False
+        self._lock = threading.Lock()
+        self._ada_kerja = threading.Event()
+        self.jumlah_tulis = 0
+        self._thread = threading.Thread(target=self._jalan, name="biodata-draf", daemon=True)
+        self._thread.start()
+
+    def perbarui(self, nilai):
+        """Dipanggil timer UI dengan state form lengkap; hanya field yang berubah dikirim."""
+        ubah = {k: v for k, v in nilai.items() if self._terakhir.get(k, "") != v}
+        if not ubah:
+            return False
+        self._terakhir.update(ubah)
+        with self._lock:
+            self._tertunda.update(ubah)
+        self._ada_kerja.set()
+        return True
+
+    def hapus(self, nilai):
+        """Menghapus jurnal (mis. setelah data disimpan); `nilai` menjadi state dasar baru."""
+        self._terakhir = dict(nilai)
+        with self._lock:
+            self._tertunda = {}
+            self._hapus = dict(nilai)
+        self._ada_kerja.set()
+
+    def berhenti(self, timeout=2.0):
+        """Menulis sisa perubahan lalu menghentikan thread penulis."""
+        with self._lock:
+            self._berhenti = True
+        self._ada_kerja.set()
+        self._thread.join(timeout)
+
+    def _jalan(self):
+        while True:
+            self._ada_kerja.wait()
+            with self._lock:
+                self._ada_kerja.clear()
+                ubah, self._tertunda = self._tertunda, {}
+                hapus, self._hapus = self._hapus, False
+                berhenti = self._berhenti
+            try:
+                if hapus is not False:
+                    self._hapus_file(hapus)
+                if ubah:
+                    self._tulis(ubah)
+            except OSError as e:
+                logging.error(f"Failed to write draft journal {self.path}: {e}")
+            if berhenti:
+                return
+
+    def _hapus_file(self, dasar):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._disk = dasar
+        self._baris = 0
+
+    def _tulis(self, ubah):
+        self._disk.update(ubah)
+        if self._baris == 0 or self._baris >= MAKS_BARIS:
+            # File baru atau jurnal terlalu panjang: tulis state lengkap dalam satu baris
+            sementara = self.path + ".tmp"
+            with open(sementara, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"ts": time.time(), "ubah": self._disk}) + "\n")
+            os.replace(sementara, self.path)
+            self._baris = 1
+        else:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"ts": time.time(), "ubah": ubah}) + "\n")
+            self._baris += 1
+        self.jumlah_tulis += 1
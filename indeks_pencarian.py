@@ -0,0 +1,205 @@
+"""Index trigram di memori untuk pencarian mahasiswa tersimpan (search-as-you-type).
+
+Field yang diindex: nama, NIM, email dan alamat. Setiap record mendapat id dokumen
+berurutan; posting list per trigram berupa array('I') id dokumen yang naik, jadi
+penambahan record baru cukup append. Record dengan NIM yang sama menggantikan
+record lama (id lama ditandai terhapus).
+
+Format file (tidak memakai pickle, karena file ini berada di folder bersama dan
+tidak boleh bisa menjalankan kode saat dimuat):
+
+    BIODATA-IDX <versi>\n
+    <panjang header JSON, 8 byte little-endian><header JSON utf-8>
+    <semua posting list sebagai uint32 little-endian, berurutan sesuai header["gram"]>
+
+File yang rusak atau formatnya lain dianggap tidak ada, sehingga index dibangun ulang.
+"""
+import array
+import json
+import os
+import sys
+
+FIELD_INDEX = ("nama", "nim", "email", "alamat")
+MIN_QUERY = 3
+_VERSI_FORMAT = 2
+_MAGIC = b"BIODATA-IDX %d\n" % _VERSI_FORMAT
+_SEP = "\x00"
+
+
+def _normalisasi(teks):
+    return " ".join(teks.lower().split())
+
+
+def _trigram(teks):
+    return {teks[i:i + 3] for i in range(len(teks) - 2)}
+
+
+class IndeksPencarian:
+    """Index trigram dengan update inkremental dan penyimpanan ke disk."""
+
+    def __init__(self):
+        self.postings = {}
+        # id dokumen -> teks ternormalisasi (None jika terhapus) dan data tampilan
+        self.teks = []
+        self.tampil = []
+        self.id_nim = {}
+        self.jumlah_terhapus = 0
+        # Tanda versi record store saat index terakhir sinkron (lihat PenyimpananBiodata.tanda_versi)
+        self.versi_store = None
+
+    def __len__(self):
+        return len(self.id_nim)
+
+    def tambah(self, record):
+        """Menambah/mengganti satu record (dict dengan kunci FIELD_INDEX dan jurusan)."""
+        nim = record["nim"]
+        lama = self.id_nim.get(nim)
+        if lama is not None:
+            self.teks[lama] = None
+            self.tampil[lama] = None
+            self.jumlah_terhapus += 1
+
+        fields = [_normalisasi(record.get(k) or "") for k in FIELD_INDEX]
+        doc_id = len(self.teks)
+        self.teks.append(_SEP.join(fields))
+        self.tampil.append((nim, record.get("nama") or "", record.get("jurusan") or ""))
+        self.id_nim[nim] = doc_id
+
+        grams = set()
+        for field in fields:
+            grams |= _trigram(field)
+        postings = self.postings
+        for gram in grams:
+            daftar = postings.get(gram)
+            if daftar is None:
+                daftar = postings[gram] = array.array("I")
+            daftar.append(doc_id)
+
+    def cari(self, query, batas=10):
+        """Mengembalikan hingga `batas` tuple (nim, nama, jurusan) yang cocok dengan query.
+
+        Kandidat diambil dari posting list trigram terpendek (terbaru dulu), lalu
+        diverifikasi dengan pencarian substring. Hasil yang cocok di awal sebuah
+        field (mis. awalan nama atau NIM) diurutkan lebih dulu.
+        """
+        q = _normalisasi(query)
+        if len(q) < MIN_QUERY:
+            return []
+        grams = _trigram(q)
+        daftar = []
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if posting is None:
+                return []
+            daftar.append(posting)
+        kandidat = min(daftar, key=len)
+
+        teks = self.teks
+        awalan = _SEP + q
+        cocok = []
+        maks_kandidat = batas * 5
+        for i in range(len(kandidat) - 1, -1, -1):
+            doc_id = kandidat[i]
+            t = teks[doc_id]
+            if t is None:
+                continue
+            posisi = t.find(q)
+            if posisi < 0:
+                continue
+            di_awal = posisi == 0 or (_SEP + t).find(awalan) >= 0
+            cocok.append((not di_awal, posisi, -doc_id))
+            if len(cocok) >= maks_kandidat:
+                break
+        cocok.sort()
+        return [self.tampil[-neg_id] for _, _, neg_id in cocok[:batas]]
+
+    @classmethod
+    def dari_store(cls, store):
+        """Membangun index lengkap dari record store."""
+        indeks = cls()
+        # Versi diambil sebelum membaca: jika ada penulisan selama build, versi
+        # tidak akan cocok lagi dan index dibangun ulang pada pemuatan berikutnya.
+        indeks.versi_store = store.tanda_versi()
+        kolom = FIELD_INDEX + ("jurusan",)
+        for row in store.semua(kolom):
+            indeks.tambah(dict(zip(kolom, row)))
+        return indeks
+
+    def simpan(self, path):
+        """Menyimpan index ke disk (ditulis ke file sementara lalu di-rename)."""
+        gram = list(self.postings)
+        header = {
+            "versi_store": self.versi_store,
+            "teks": self.teks,
+            "tampil": self.tampil,
+            "jumlah_terhapus": self.jumlah_terhapus,
+            "gram": gram,
+            "panjang": [len(self.postings[g]) for g in gram],
+        }
+        mentah = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        sementara = path + ".tmp"
+        with open(sementara, "wb") as f:
+            f.write(_MAGIC)
+            f.write(len(mentah).to_bytes(8, "little"))
+            f.write(mentah)
+            for g in gram:
+                daftar = self.postings[g]
+                if sys.byteorder != "little":
+                    daftar = array.array("I", daftar)
+                    daftar.byteswap()
+                f.write(daftar.tobytes())
+        os.replace(sementara, path)
+
+    @classmethod
+    def muat(cls, path):
+        """Memuat index dari disk; None jika file tidak ada, rusak, atau formatnya lain."""
+        try:
+            with open(path, "rb") as f:
+                if f.readline() != _MAGIC:
+                    return None
+                header = json.loads(f.read(int.from_bytes(f.read(8), "little")).decode("utf-8"))
+                semua = array.array("I")
+                if semua.itemsize != 4:
+                    return None
+                semua.frombytes(f.read())
+            if sys.byteorder != "little":
+                semua.byteswap()
+            return cls._dari_header(header, semua)
+        except (OSError, ValueError, KeyError, TypeError, IndexError):
+            # ValueError juga mencakup JSON/UTF-8 rusak dan panjang blob yang bukan kelipatan 4
+            return None
+
+    @classmethod
+    def _dari_header(cls, header, semua):
+        indeks = cls()
+        teks = header["teks"]
+        tampil = [tuple(t) if t is not None else None for t in header["tampil"]]
+        gram = header["gram"]
+        panjang = header["panjang"]
+        if len(teks) != len(tampil) or len(gram) != len(panjang) or sum(panjang) != len(semua):
+            raise ValueError("index tidak konsisten")
+        versi_store = header["versi_store"]
+        indeks.versi_store = tuple(versi_store) if versi_store is not None else None
+        indeks.teks = teks
+        indeks.tampil = tampil
+        indeks.jumlah_terhapus = int(header["jumlah_terhapus"])
+        indeks.id_nim = {t[0]: i for i, t in enumerate(tampil) if t is not None}
+        posisi = 0
+        for g, n in zip(gram, panjang):
+            daftar = semua[posisi:posisi + n]
+            # Posting list naik, jadi cukup elemen terakhir yang diperiksa
+            if not n or daftar[-1] >= len(teks):
+                raise ValueError("posting list tidak valid")
+            indeks.postings[g] = daftar
+            posisi += n
+        return indeks
+
+    @classmethod
+    def muat_atau_bangun(cls, path, store):
+        """Memuat index dari disk jika masih sinkron dengan store, jika tidak dibangun ulang."""
+        indeks = cls.muat(path)
+        if indeks is not None and indeks.versi_store == store.tanda_versi():
+            return indeks
+        indeks = cls.dari_store(store)
+        indeks.simpan(path)
+        return indeks
@@ -0,0 +1,191 @@
+"""Mode satu instance: peluncuran kedua menyerahkan argumennya ke aplikasi yang sudah berjalan.
+
+Instance pertama mengikat Unix domain socket per user dan per folder aplikasi.
+Di Linux dipakai abstract namespace, sehingga socket hilang sendiri saat proses
+mati. Di Unix lain dipakai file socket di direktori runtime, dan file basi
+dibersihkan di bawah flock. Peluncuran berikutnya cukup connect, mengirim argumennya
+lalu keluar. Pemeriksaan ini dilakukan sebelum tkinter di-import,
+jadi peluncuran kedua selesai dalam hitungan milidetik. Instance pertama
+kemudian menaikkan window-nya.
+
+Nonaktifkan dengan BIODATA_MULTI_INSTANS=1 (mis. untuk menjalankan dua sesi uji).
+"""
+import os
+import socket
+import sys
+import zlib
+
+# Peluncuran kedua hanya butuh modul di atas; modul untuk instance pertama
+# (threading, queue, logging, ...) di-import di dalam fungsi yang memakainya.
+
+# Batas waktu peluncuran kedua menunggu konfirmasi dari instance pertama
+TIMEOUT_SERAH = 2.0
+INTERVAL_POLL_MS = 250
+MAKS_PESAN = 64 * 1024
+
+
+def _alamat(script_dir):
+    kunci = zlib.crc32(os.path.abspath(script_dir).encode("utf-8"))
+    nama = f"biodata-{os.getuid()}-{kunci:08x}"
+    if sys.platform.startswith("linux"):
+        return "\0" + nama
+    import tempfile
+
+    direktori = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(direktori, nama + ".sock")
+
+
+def _serahkan(alamat, argv):
+    """Mengirim argv ke instance yang berjalan; False jika belum ada instance."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(TIMEOUT_SERAH)
+            s.connect(alamat)
+            # Argumen dipisah NUL; akhir pesan ditandai dengan menutup sisi tulis
+            s.sendall("\0".join(argv).encode("utf-8"))
+            s.shutdown(socket.SHUT_WR)
+            s.recv(16)
+        return True
+    except socket.timeout:
+        # Instance pertama ada tapi sedang sibuk; tetap jangan membuat instance kedua
+        print("Aplikasi Biodata sudah berjalan tetapi tidak merespons.", file=sys.stderr)
+        return True
+    except OSError:
+        # Belum ada instance (ConnectionRefused/FileNotFound), atau socket basi milik
+        # user lain (PermissionError) / peer yang putus (ConnectionReset, BrokenPipe):
+        # jalan seperti biasa
+        return False
+
+
+class _TanpaKunci:
+    """Pengganti KunciInstans saat mode satu instance nonaktif atau tidak didukung."""
+
+    def pasang(self, root, saat_diserahi):
+        pass
+
+    def tutup(self):
+        pass
+
+
+class KunciInstans:
+    """Socket milik instance pertama; menerima argumen dari peluncuran berikutnya."""
+
+    def __init__(self, sock, alamat):
+        import queue
+
+        self.sock = sock
+        self.alamat = alamat
+        self._masuk = queue.Queue()
+        self._root = None
+        self._saat_diserahi = None
+        self._after_id = None
+
+    def _terima(self):
+        while True:
+            try:
+                koneksi, _ = self.sock.accept()
+            except OSError:
+                return  # socket ditutup
+            with koneksi:
+                try:
+                    koneksi.settimeout(TIMEOUT_SERAH)
+                    data = b""
+                    while len(data) < MAKS_PESAN:
+                        potongan = koneksi.recv(4096)
+                        if not potongan:
+                            break
+                        data += potongan
+                    teks = data.decode("utf-8")
+                    self._masuk.put(teks.split("\0") if teks else [])
+                    koneksi.sendall(b"ok\n")
+                except (OSError, UnicodeDecodeError) as e:
+                    import logging
+
+                    logging.warning(f"Invalid single-instance handoff: {e}")
+
+    def pasang(self, root, saat_diserahi):
+        """Mulai menerima serah terima; `saat_diserahi(argv)` dipanggil di thread Tk."""
+        self._root = root
+        self._saat_diserahi = saat_diserahi
+        import threading
+
+        threading.Thread(target=self._terima, name="biodata-instans", daemon=True).start()
+        self._after_id = root.after(INTERVAL_POLL_MS, self._periksa)
+
+    def _periksa(self):
+        # Thread Tk satu-satunya pengambil antrian, jadi empty() lalu get_nowait() aman
+        try:
+            while not self._masuk.empty():
+                argv = self._masuk.get_nowait()
+                try:
+                    self._saat_diserahi(argv)
+                except Exception:
+                    import logging
+
+                    logging.exception(f"Single-instance handoff callback failed for {argv}")
+        finally:
+            self._after_id = self._root.after(INTERVAL_POLL_MS, self._periksa)
+
+    def tutup(self):
+        if self._after_id is not None:
+            try:
+                self._root.after_cancel(self._after_id)
+            except Exception:
+                pass  # root sudah di-destroy
+            self._after_id = None
+        self.sock.close()
+        if not self.alamat.startswith("\0"):
+            try:
+                os.unlink(self.alamat)
+            except FileNotFoundError:
+                pass
+
+
+def klaim_instans(script_dir, argv):
+    """Menjadi instance pertama, atau menyerahkan `argv` ke instance yang sudah berjalan.
+
+    Mengembalikan objek kunci (panggil `pasang` setelah window dibuat dan `tutup`
+    saat keluar), atau None jika argumen sudah diserahkan dan proses ini harus keluar.
+    """
+    if os.environ.get("BIODATA_MULTI_INSTANS", "").strip() not in ("", "0"):
+        return _TanpaKunci()
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "getuid"):
+        return _TanpaKunci()
+    alamat = _alamat(script_dir)
+    if _serahkan(alamat, argv):
+        return None
+
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        fcntl = None
+    berkas_kunci = None
+    if not alamat.startswith("\0") and fcntl is not None:
+        # Dua peluncuran bersamaan tidak boleh saling menghapus file socket
+        berkas_kunci = open(alamat + ".lock", "w")
+        fcntl.flock(berkas_kunci, fcntl.LOCK_EX)
+    try:
+        if berkas_kunci is not None:
+            if _serahkan(alamat, argv):
+                return None
+            try:
+                os.unlink(alamat)  # file socket basi dari instance yang crash
+            except FileNotFoundError:
+                pass
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(alamat)
+        except OSError:
+            # Peluncuran lain baru saja menjadi instance pertama (abstract namespace)
+            sock.close()
+            if _serahkan(alamat, argv):
+                return None
+            import logging
+
+            logging.warning("Single-instance socket unavailable, starting without it")
+            return _TanpaKunci()
+        sock.listen(8)
+        return KunciInstans(sock, alamat)
+    finally:
+        if berkas_kunci is not None:
+            berkas_kunci.close()
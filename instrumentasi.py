@@ -0,0 +1,175 @@
+"""Instrumentasi waktu eksekusi (jumlah panggilan dan histogram latensi).
+
+Aktifkan dengan environment variable BIODATA_INSTRUMENTASI=1. Jika tidak aktif,
+dekorator `ukur` mengembalikan fungsi aslinya tanpa pembungkus sehingga tidak ada
+biaya tambahan sama sekali di hot path.
+"""
+import atexit
+import bisect
+import contextlib
+import functools
+import logging
+import math
+import os
+import sys
+import threading
+import time
+
+AKTIF = os.environ.get("BIODATA_INSTRUMENTASI", "").strip() not in ("", "0")
+
+# Batas atas tiap bucket histogram dalam detik: 1 us sampai ~56 s,
+# naik dengan faktor 2**0.25 (~19%) sehingga galat persentil maksimal ~19%.
+_BATAS = tuple(1e-6 * 2 ** (i / 4) for i in range(104))
+
+
+class Histogram:
+    """Histogram latensi dengan bucket logaritmik."""
+
+    __slots__ = ("jumlah", "total", "minimum", "maksimum", "bucket")
+
+    def __init__(self):
+        self.jumlah = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maksimum = 0.0
+        self.bucket = [0] * (len(_BATAS) + 1)
+
+    def tambah(self, durasi):
+        """Menambahkan satu sampel durasi (detik)."""
+        self.jumlah += 1
+        self.total += durasi
+        if durasi < self.minimum:
+            self.minimum = durasi
+        if durasi > self.maksimum:
+            self.maksimum = durasi
+        self.bucket[bisect.bisect_left(_BATAS, durasi)] += 1
+
+    def persentil(self, p):
+        """Perkiraan persentil ke-p (0-100) dalam detik."""
+        if self.jumlah == 0:
+            return 0.0
+        target = max(1, math.ceil(self.jumlah * p / 100.0))
+        kumulatif = 0
+        for i, n in enumerate(self.bucket):
+            kumulatif += n
+            if kumulatif >= target:
+                batas = _BATAS[i] if i < len(_BATAS) else self.maksimum
+                return min(batas, self.maksimum)
+        return self.maksimum
+
+    def rata_rata(self):
+        return self.total / self.jumlah if self.jumlah else 0.0
+
+
+class Instrumentasi:
+    """Registry histogram per nama operasi."""
+
+    def __init__(self):
+        self.histogram = {}
+        self._lock = threading.Lock()
+
+    def rekam(self, nama, durasi):
+        """Merekam satu durasi (detik) untuk operasi `nama`."""
+        with self._lock:
+            hist = self.histogram.get(nama)
+            if hist is None:
+                hist = self.histogram[nama] = Histogram()
+            hist.tambah(durasi)
+
+    def reset(self):
+        with self._lock:
+            self.histogram.clear()
+
+    def laporan(self):
+        """Membuat tabel ringkasan (ms) untuk semua operasi yang terekam."""
+        with self._lock:
+            items = sorted(self.histogram.items())
+            baris = [f"{'operasi':<20}{'n':>8}{'mean':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}"]
+            for nama, h in items:
+                baris.append(
+                    f"{nama:<20}{h.jumlah:>8}"
+                    f"{h.rata_rata() * 1000:>10.2f}{h.persentil(50) * 1000:>10.2f}"
+                    f"{h.persentil(90) * 1000:>10.2f}{h.persentil(99) * 1000:>10.2f}"
+                    f"{h.maksimum * 1000:>10.2f}"
+                )
+        return "\n".join(baris)
+
+
+instrumentasi = Instrumentasi()
+
+
+class Laju:
+    """Penghitung laju kejadian per menit (mis. mahasiswa yang selesai diinput)."""
+
+    def __init__(self):
+        self.jumlah = 0
+        self.pertama = None
+        self.terakhir = None
+
+    def tambah(self, n=1):
+        sekarang = time.perf_counter()
+        if self.pertama is None:
+            self.pertama = sekarang
+        self.terakhir = sekarang
+        self.jumlah += n
+
+    def per_menit(self):
+        """Laju rata-rata antara kejadian pertama dan terakhir."""
+        if self.jumlah < 2 or self.terakhir == self.pertama:
+            return 0.0
+        return (self.jumlah - 1) * 60.0 / (self.terakhir - self.pertama)
+
+
+def ukur(nama=None):
+    """Dekorator untuk merekam latensi fungsi. No-op jika instrumentasi tidak aktif."""
+    def dekorator(func):
+        if not AKTIF:
+            return func
+        label = nama or func.__name__
+        rekam = instrumentasi.rekam
+        perf = time.perf_counter
+
+        @functools.wraps(func)
+        def pembungkus(*args, **kwargs):
+            mulai = perf()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                rekam(label, perf() - mulai)
+        return pembungkus
+    return dekorator
+
+
+_BLOK_NONAKTIF = contextlib.nullcontext()
+
+
+@contextlib.contextmanager
+def _blok_aktif(nama):
+    mulai = time.perf_counter()
+    try:
+        yield
+    finally:
+        instrumentasi.rekam(nama, time.perf_counter() - mulai)
+
+
+def blok(nama):
+    """Context manager untuk merekam latensi satu blok kode."""
+    if not AKTIF:
+        return _BLOK_NONAKTIF
+    return _blok_aktif(nama)
+
+
+def laporan():
+    """Laporan persentil on-demand."""
+    return instrumentasi.laporan()
+
+
+def _laporan_saat_keluar():
+    if instrumentasi.histogram:
+        teks = instrumentasi.laporan()
+        logging.info("Laporan instrumentasi:\n%s", teks)
+        print(teks, file=sys.stderr)
+
+
+if AKTIF:
+    atexit.register(_laporan_saat_keluar)
@@ -0,0 +1,141 @@
+"""Jendela "Data Tersimpan": tabel record tersimpan yang hanya memuat baris terlihat."""
+import collections
+import tkinter as tk
+from tkinter import ttk
+
+from penyimpanan import KOLOM_URUT
+
+# (kolom, judul, lebar)
+KOLOM_TAMPIL = (
+    ("nim", "NIM", 110),
+    ("nama", "Nama", 200),
+    ("jurusan", "Jurusan", 150),
+    ("email", "Email", 190),
+    ("telepon", "Telepon", 120),
+)
+
+
+class JendelaDataTersimpan(tk.Toplevel):
+    """Browser record tersimpan di atas ttk.Treeview yang divirtualisasi.
+
+    Treeview hanya berisi `baris` item (yang sedang terlihat). Scrollbar mewakili
+    seluruh isi store; saat digeser, halaman yang dibutuhkan diambil dari store
+    per blok dan disimpan di cache LRU kecil.
+    """
+
+    UKURAN_BLOK = 200
+    MAKS_BLOK_CACHE = 32
+
+    def __init__(self, master, store, baris=25):
+        super().__init__(master)
+        self.title("Data Tersimpan")
+        self.store = store
+        self.baris = baris
+        self.urut = "nim"
+        self.turun = False
+        self.posisi = 0
+        self.total = 0
+        self._cache = collections.OrderedDict()
+        self._kolom = tuple(k for k, _, _ in KOLOM_TAMPIL)
+
+        frame = tk.Frame(self, padx=10, pady=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+        frame.columnconfigure(0, weight=1)
+
+        self.tree = ttk.Treeview(frame, columns=self._kolom, show="headings", height=baris, selectmode="browse")
+        for kolom, judul, lebar in KOLOM_TAMPIL:
+            if kolom in KOLOM_URUT:
+                self.tree.heading(kolom, text=judul, command=lambda k=kolom: self.urutkan(k))
+            else:
+                self.tree.heading(kolom, text=judul)
+            self.tree.column(kolom, width=lebar, anchor=tk.W)
+        self.tree.grid(row=0, column=0, sticky="NSEW")
+
+        self.scrollbar = tk.Scrollbar(frame, orient=tk.VERTICAL, command=self._on_scroll)
+        self.scrollbar.grid(row=0, column=1, sticky="NS")
+
+        self.label_status = tk.Label(frame, text="", anchor=tk.W)
+        self.label_status.grid(row=1, column=0, columnspan=2, sticky="EW", pady=(5, 0))
+
+        # Scroll dengan mouse dan keyboard
+        self.tree.bind("<MouseWheel>", lambda e: self.geser(-1 if e.delta > 0 else 1, "units", 3))
+        self.tree.bind("<Button-4>", lambda e: self.geser(-1, "units", 3))
+        self.tree.bind("<Button-5>", lambda e: self.geser(1, "units", 3))
+        self.bind("<Prior>", lambda e: self.geser(-1, "pages"))
+        self.bind("<Next>", lambda e: self.geser(1, "pages"))
+        self.bind("<Home>", lambda e: self.ke_posisi(0))
+        self.bind("<End>", lambda e: self.ke_posisi(self.total))
+
+        self.muat_ulang()
+
+    def muat_ulang(self):
+        """Membaca ulang jumlah record dan mengosongkan cache (mis. setelah simpan baru)."""
+        self._cache.clear()
+        self.total = self.store.jumlah()
+        self._tampilkan()
+
+    def _blok(self, nomor):
+        kunci = (self.urut, self.turun, nomor)
+        rows = self._cache.get(kunci)
+        if rows is None:
+            rows = self.store.halaman(nomor * self.UKURAN_BLOK, self.UKURAN_BLOK, self.urut, self.turun, self._kolom)
+            self._cache[kunci] = rows
+            if len(self._cache) > self.MAKS_BLOK_CACHE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(kunci)
+        return rows
+
+    def _ambil(self, posisi, jumlah):
+        hasil = []
+        while jumlah > 0:
+            nomor, sisa = divmod(posisi, self.UKURAN_BLOK)
+            rows = self._blok(nomor)[sisa:sisa + jumlah]
+            if not rows:
+                break
+            hasil.extend(rows)
+            posisi += len(rows)
+            jumlah -= len(rows)
+        return hasil
+
+    def _tampilkan(self):
+        self.posisi = max(0, min(self.posisi, self.total - self.baris))
+        rows = self._ambil(self.posisi, self.baris)
+        self.tree.delete(*self.tree.get_children())
+        for row in rows:
+            self.tree.insert("", tk.END, values=row)
+        if self.total:
+            self.scrollbar.set(self.posisi / self.total, (self.posisi + len(rows)) / self.total)
+            self.label_status.config(
+                text=f"Baris {self.posisi + 1}-{self.posisi + len(rows)} dari {self.total} record"
+            )
+        else:
+            self.scrollbar.set(0.0, 1.0)
+            self.label_status.config(text="Belum ada data tersimpan")
+
+    def _on_scroll(self, aksi, nilai, unit=None):
+        if aksi == tk.MOVETO:
+            self.ke_posisi(int(float(nilai) * self.total))
+        elif aksi == tk.SCROLL:
+            self.geser(int(nilai), unit)
+
+    def geser(self, arah, unit="units", jumlah=1):
+        """Menggeser tampilan per baris (units) atau per halaman (pages)."""
+        langkah = self.baris if unit == tk.PAGES else jumlah
+        self.ke_posisi(self.posisi + arah * langkah)
+
+    def ke_posisi(self, posisi):
+        """Menampilkan record mulai dari posisi tertentu."""
+        self.posisi = posisi
+        self._tampilkan()
+
+    def urutkan(self, kolom):
+        """Mengurutkan berdasarkan kolom (klik kedua membalik arah); dikerjakan oleh store."""
+        self.turun = not self.turun if kolom == self.urut else False
+        self.urut = kolom
+        for k, judul, _ in KOLOM_TAMPIL:
+            if k in KOLOM_URUT:
+                panah = (" ▼" if self.turun else " ▲") if k == kolom else ""
+                self.tree.heading(k, text=judul + panah)
+        self.posisi = 0
+        self._tampilkan()
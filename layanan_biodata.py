@@ -0,0 +1,386 @@
+"""Logika bisnis biodata mahasiswa tanpa Tk.
+
+`BiodataService` bekerja dengan data biasa (dict string), sehingga bisa dipakai
+dari GUI, skrip batch, server, maupun benchmark tanpa display. GUI cukup
+membaca nilai widget, memanggil service, lalu menampilkan hasil/kesalahannya.
+
+Adapter Tk di atas service: aplikasi_biodata_oop.py, biodata_oop_2.py dan
+tugas_oop_ppde.py (login, validasi, submit dan save). Salinan workspace mahasiswa
+(231060500xx-*) sengaja tidak memakai service: form-nya tidak punya field wajib
+email/telepon, dan setiap folder dijalankan berdiri sendiri tanpa modul root.
+"""
+import datetime
+import logging
+import os
+import re
+import threading
+import time
+
+from penyimpanan import PenyimpananBiodata, path_default
+
+# Database user sederhana (dalam aplikasi nyata, ini akan di database)
+USER_DEFAULT = {
+    "admin": "123",
+    "user1": "password1",
+    "mahasiswa": "123456",
+    "23106050061": "faisal123",
+}
+
+# Field form biodata (kunci sama dengan kolom record di penyimpanan)
+FIELD_FORM = ("nama", "nim", "jurusan", "email", "telepon", "tgl_lahir", "alamat", "jenis_kelamin")
+FIELD_WAJIB = ("nama", "nim", "jurusan", "email", "telepon")
+
+_POLA_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Format nomor telepon Indonesia
+_POLA_TELEPON = re.compile(r'^(08|\+62[ ]?)\d{8,13}$')
+
+
+class GagalValidasi(ValueError):
+    """Input tidak valid; `field` menunjuk field yang perlu diperbaiki."""
+
+    def __init__(self, field, judul, pesan):
+        super().__init__(pesan)
+        self.field = field
+        self.judul = judul
+        self.pesan = pesan
+
+
+class GagalLogin(Exception):
+    """Username atau password salah."""
+
+    def __init__(self, pesan="Username atau Password salah."):
+        super().__init__(pesan)
+        self.judul = "Login Gagal"
+        self.pesan = pesan
+
+
+def normalisasi(data):
+    """Mengambil field form dari `data` sebagai string yang sudah di-strip."""
+    hasil = {f: str(data.get(f) or "").strip() for f in FIELD_FORM}
+    hasil["jenis_kelamin"] = hasil["jenis_kelamin"] or "Pria"
+    return hasil
+
+
+class BiodataService:
+    """Login, validasi, submit dan save biodata di atas record store."""
+
+    def __init__(self, direktori, path_db=None, users=None):
+        self.direktori = direktori
+        self.path_db = path_db or path_default(direktori)
+        self.users = dict(USER_DEFAULT if users is None else users)
+        self.store = None
+        self.trie = None
+        self.indeks_cari = None
+        self.indeks_berubah = False
+        self._thread_indeks = None
+        self._hasil_indeks = {}
+        self._tertunda_indeks = []
+        self._thread_pramuat = None
+        self._hasil_pramuat = {}
+        # (urutan commit atau None, jurusan) yang disimpan selama trie dibangun di thread pramuat
+        self._tertunda_trie = []
+        # Urutan commit simpan_record; nim -> urutan selama pramuat belum selesai
+        self._urutan_simpan = 0
+        self._urutan_nim = {}
+        self._lock_store = threading.Lock()
+        self.outbox = None
+
+    # --- Login ---
+
+    def login(self, username, password):
+        """Memeriksa kredensial; mengembalikan username, atau raise GagalValidasi/GagalLogin."""
+        username = (username or "").strip()
+        if not username or not password:
+            raise GagalValidasi("username", "Login Gagal", "Username dan Password tidak boleh kosong.")
+        if len(username) < 3:
+            raise GagalValidasi("username", "Login Gagal", "Username minimal 3 karakter.")
+        if self.users.get(username) != password:
+            raise GagalLogin()
+        return username
+
+    # --- Validasi dan submit ---
+
+    def validate(self, data):
+        """Mengembalikan list GagalValidasi (kosong jika data valid), berurutan seperti form."""
+        data = normalisasi(data)
+        if not all(data[f] for f in FIELD_WAJIB):
+            return [GagalValidasi(next(f for f in FIELD_WAJIB if not data[f]), "Input Kosong",
+                                  "Nama, NIM, Jurusan, Email, dan Telepon harus diisi!")]
+        kesalahan = []
+        if data["nama"].isdigit():
+            kesalahan.append(GagalValidasi("nama", "Format Nama Salah", "Nama tidak boleh hanya berupa angka!"))
+        if not data["nim"].isdigit() or len(data["nim"]) < 8:
+            kesalahan.append(GagalValidasi("nim", "Format NIM Salah", "NIM harus berupa angka minimal 8 digit!"))
+        if not _POLA_EMAIL.match(data["email"]):
+            kesalahan.append(GagalValidasi("email", "Format Email Salah",
+                                           "Format email tidak valid. Contoh: nama@domain.com"))
+        if not _POLA_TELEPON.match(data["telepon"]):
+            kesalahan.append(GagalValidasi("telepon", "Format Telepon Salah",
+                                           "Format nomor telepon Indonesia tidak valid. Contoh: 08... atau +62..."))
+        # Tanggal lahir opsional, tapi jika diisi formatnya harus benar
+        if data["tgl_lahir"]:
+            try:
+                datetime.datetime.strptime(data["tgl_lahir"], '%d-%m-%Y')
+            except ValueError:
+                kesalahan.append(GagalValidasi("tgl_lahir", "Format Tanggal Salah",
+                                               "Format tanggal lahir harus DD-MM-YYYY. Contoh: 31-12-2000"))
+        return kesalahan
+
+    def submit(self, data):
+        """Memvalidasi data form; mengembalikan record ternormalisasi atau raise GagalValidasi pertama.
+
+        Ejaan jurusan disamakan dengan bentuk yang sudah dikenal (mis. "informatika" -> "Informatika").
+        """
+        kesalahan = self.validate(data)
+        if kesalahan:
+            raise kesalahan[0]
+        record = normalisasi(data)
+        record["jurusan"] = self.trie_jurusan().kanonikkan(record["jurusan"])
+        return record
+
+    @staticmethod
+    def format_hasil(record, user):
+        """Teks ringkasan biodata yang ditampilkan dan disimpan ke file."""
+        hasil = (f"Nama: {record['nama']}\nNIM: {record['nim']}\nJurusan: {record['jurusan']}\nEmail: {record['email']}\n"
+                 f"Telepon: {record['telepon']}\nTanggal Lahir: {record['tgl_lahir'] or 'Tidak diisi'}\n"
+                 f"Alamat: {record['alamat'] or 'Tidak diisi'}\n"
+                 f"Jenis Kelamin: {record['jenis_kelamin']}")
+        return f"BIODATA TERSIMPAN:\nDiinput oleh: {user}\n\n{hasil}"
+
+    # --- Save ---
+
+    def save(self, record, user, tulis_file=True):
+        """Menyimpan record hasil submit ke record store (dan file teks); mengembalikan path file.
+
+        Record juga dimasukkan ke outbox registrar (jika aktif), dan index turunan
+        (pencarian, autocomplete jurusan) ikut diperbarui secara inkremental.
+        Dengan tulis_file=False hanya record store yang ditulis dan hasilnya None.
+        """
+        record, full_path = self.simpan_record(record, user, tulis_file)
+        if self.outbox is not None:
+            self.outbox.tambah(record)
+        self.setelah_simpan(record)
+        return full_path
+
+    def simpan_record(self, record, user, tulis_file=True):
+        """Hanya menulis file teks dan record store; mengembalikan (record tersimpan, path file).
+
+        Langkah lanjutan (outbox, index) diserahkan ke pemanggil, mis. pipeline pasca-simpan aplikasi.
+        """
+        sekarang = datetime.datetime.now()
+        record = self.siapkan_record(record, user, sekarang)
+        full_path = None
+        if tulis_file:
+            full_path, file = self._buka_file_baru(f"biodata_{user}_{sekarang.strftime('%Y%m%d_%H%M%S')}")
+            with file:
+                file.write(f"Data disimpan oleh: {user}\n")
+                file.write(f"Waktu penyimpanan: {record['waktu']}\n")
+                file.write("-" * 50 + "\n")
+                file.write(self.format_hasil(record, user))
+
+        store = self.penyimpanan()
+        with self._lock_store:
+            store.simpan(record)
+            self._urutan_simpan += 1
+            if self.trie is None and self._thread_pramuat is not None:
+                # Dipakai setelah_simpan untuk tahu apakah commit ini sudah ikut
+                # terhitung di frekuensi jurusan yang dibaca thread pramuat
+                self._urutan_nim[record["nim"]] = self._urutan_simpan
+        return record, full_path
+
+    def _buka_file_baru(self, dasar):
+        """Membuka file teks baru tanpa menimpa file lain (mis. dua meja, user dan detik yang sama)."""
+        nomor = 0
+        while True:
+            akhiran = f"_{nomor}" if nomor else ""
+            full_path = os.path.join(self.direktori, f"{dasar}{akhiran}.txt")
+            try:
+                return full_path, open(full_path, "x", encoding="utf-8")
+            except FileExistsError:
+                nomor += 1
+
+    @staticmethod
+    def siapkan_record(record, user, sekarang=None):
+        """Record yang siap ditulis ke store: ditambah penginput dan waktu penyimpanan."""
+        sekarang = sekarang or datetime.datetime.now()
+        return dict(record, diinput_oleh=user, waktu=sekarang.strftime('%Y-%m-%d %H:%M:%S'))
+
+    def setelah_simpan(self, record):
+        """Update inkremental index turunan setelah record tersimpan di store.
+
+        Dipisah dari `save` agar pemanggil yang menulis store dari thread lain
+        (mis. server) tetap memperbarui index dari satu thread saja.
+        """
+        self._indeks_record(record)
+        if self.trie is not None:
+            self.trie.tambah(record["jurusan"])
+        elif self._thread_pramuat is not None:
+            self._tertunda_trie.append((self._urutan_nim.pop(record["nim"], None), record["jurusan"]))
+
+    # --- Record store dan index turunan ---
+
+    def penyimpanan(self):
+        """Record store SQLite, dibuka saat pertama dibutuhkan (boleh dari thread pramuat)."""
+        if self.store is None:
+            with self._lock_store:
+                if self.store is None:
+                    self.store = PenyimpananBiodata(self.path_db)
+        return self.store
+
+    def ambil(self, nim):
+        return self.penyimpanan().ambil(nim)
+
+    def path_indeks(self, akhiran):
+        """Path file index turunan yang disimpan di samping database."""
+        return os.path.splitext(self.path_db)[0] + akhiran
+
+    def trie_jurusan(self):
+        """Trie autocomplete jurusan, dibangun dari frekuensi jurusan di store saat pertama dipakai."""
+        if self.trie is None:
+            # Dibaca sekarang, setelah semua record tertunda ter-commit: tidak ada yang perlu diulang
+            self._tertunda_trie = []
+            self._bangun_trie(self.penyimpanan().frekuensi_jurusan())
+        return self.trie
+
+    def _bangun_trie(self, frekuensi, urutan_baca=None):
+        """Membangun trie dari frekuensi, lalu menambah record tertunda yang di-commit setelah `urutan_baca`."""
+        from trie_jurusan import TrieJurusan
+
+        mulai = time.perf_counter()
+        self.trie = TrieJurusan.dari_frekuensi(frekuensi)
+        for urutan, jurusan in self._tertunda_trie:
+            # Urutan None: record ditulis tanpa simpan_record (mis. server), dianggap belum terhitung
+            if urutan is None or urutan_baca is None or urutan > urutan_baca:
+                self.trie.tambah(jurusan)
+        self._tertunda_trie = []
+        self._urutan_nim.clear()
+        logging.info(f"Jurusan trie built: {len(self.trie)} jurusan in {(time.perf_counter() - mulai) * 1000:.1f} ms")
+
+    def saran_jurusan(self, teks, batas=8):
+        return self.trie_jurusan().saran(teks, batas)
+
+    def mulai_pramuat(self):
+        """Membuka record store dan membaca frekuensi jurusan di thread latar; mengembalikan thread-nya.
+
+        Dipakai untuk warm start: setelah thread selesai, pemilik service memanggil
+        `pasang_pramuat()` dari thread-nya sendiri agar trie jurusan siap pakai.
+        """
+        if self._thread_pramuat is None:
+            def kerja():
+                store = self.penyimpanan()
+                # Sekalian menghangatkan cache halaman SQLite
+                store.jumlah()
+                # Dibaca di bawah lock yang sama dengan commit simpan_record, sehingga
+                # urutan ini memisahkan record yang sudah terhitung dari yang belum
+                with self._lock_store:
+                    self._hasil_pramuat["frekuensi"] = (store.frekuensi_jurusan(), self._urutan_simpan)
+
+            self._thread_pramuat = threading.Thread(target=kerja, name="biodata-pramuat", daemon=True)
+            self._thread_pramuat.start()
+        return self._thread_pramuat
+
+    def pasang_pramuat(self):
+        """Membangun trie jurusan dari hasil thread pramuat (jika belum dibangun)."""
+        hasil = self._hasil_pramuat.pop("frekuensi", None)
+        if hasil is not None and self.trie is None:
+            frekuensi, urutan_baca = hasil
+            self._bangun_trie(frekuensi, urutan_baca)
+        return self.trie
+
+    @property
+    def pemuatan_indeks_dimulai(self):
+        return self._thread_indeks is not None
+
+    def mulai_muat_indeks_cari(self):
+        """Memuat (atau membangun) index pencarian di thread latar; mengembalikan thread-nya.
+
+        Setelah thread selesai, pemilik service memanggil `pasang_indeks_cari()` dari
+        thread-nya sendiri. Record yang disimpan selama pemuatan ditampung dulu.
+        """
+        if self._thread_indeks is None:
+            from indeks_pencarian import IndeksPencarian
+
+            path = self.path_indeks("_cari.idx")
+            store = self.penyimpanan()
+
+            def kerja():
+                try:
+                    indeks = IndeksPencarian.muat_atau_bangun(path, store)
+                except Exception as e:
+                    # Mis. file index tidak bisa ditulis: index tetap bisa dibangun dan dipakai dari memori
+                    logging.warning(f"Loading search index from {path} failed ({e}), rebuilding from the store")
+                    try:
+                        indeks = IndeksPencarian.dari_store(store)
+                    except Exception:
+                        logging.exception("Failed to build search index")
+                        return
+                self._hasil_indeks["indeks"] = indeks
+
+            self._thread_indeks = threading.Thread(target=kerja, name="biodata-indeks-cari", daemon=True)
+            self._thread_indeks.start()
+        return self._thread_indeks
+
+    def pasang_indeks_cari(self):
+        """Memasang index hasil thread pemuat; None jika pemuatan gagal.
+
+        Setelah gagal, `mulai_muat_indeks_cari()` boleh dipanggil lagi untuk mencoba ulang.
+        """
+        indeks = self._hasil_indeks.pop("indeks", None)
+        if indeks is None:
+            if self.indeks_cari is None and self._thread_indeks is not None and not self._thread_indeks.is_alive():
+                # Record tertunda sudah ada di store, jadi ikut terbaca saat pemuatan diulang
+                self._thread_indeks = None
+                self._tertunda_indeks = []
+            return self.indeks_cari
+        for record in self._tertunda_indeks:
+            indeks.tambah(record)
+        self.indeks_berubah = bool(self._tertunda_indeks)
+        self._tertunda_indeks = []
+        self.indeks_cari = indeks
+        logging.info(f"Search index ready: {len(indeks)} records")
+        return indeks
+
+    def _indeks_record(self, record):
+        if self.indeks_cari is not None:
+            self.indeks_cari.tambah(record)
+            self.indeks_berubah = True
+        elif self._thread_indeks is not None:
+            self._tertunda_indeks.append(record)
+
+    def cari(self, query, batas=20):
+        """Pencarian search-as-you-type; list kosong jika index belum dimuat."""
+        if self.indeks_cari is None:
+            return []
+        return self.indeks_cari.cari(query, batas=batas)
+
+    def simpan_indeks(self):
+        """Menyimpan index pencarian ke disk jika ada perubahan sejak dimuat."""
+        if self.indeks_cari is None or not self.indeks_berubah:
+            return
+        try:
+            self.indeks_cari.versi_store = self.penyimpanan().tanda_versi()
+            self.indeks_cari.simpan(self.path_indeks("_cari.idx"))
+            self.indeks_berubah = False
+        except Exception as e:
+            logging.error(f"Failed to save search index: {e}")
+
+    # --- Sinkronisasi ke registrar ---
+
+    def mulai_outbox(self, url):
+        """Mengaktifkan outbox: record yang disimpan setelah ini ikut dikirim ke registrar di `url`."""
+        if self.outbox is None:
+            from outbox_registrar import OutboxRegistrar
+
+            self.outbox = OutboxRegistrar(self.path_indeks("_outbox.db"), url)
+            self.outbox.mulai()
+            logging.info(f"Registrar outbox started: {self.outbox.jumlah_tertunda()} records pending")
+        return self.outbox
+
+    def tutup(self):
+        self.simpan_indeks()
+        if self.outbox is not None:
+            self.outbox.berhenti()
+            self.outbox = None
+        if self.store is not None:
+            self.store.tutup()
+            self.store = None
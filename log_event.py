@@ -0,0 +1,76 @@
+"""Log event terstruktur (satu objek JSON per baris) untuk Aplikasi Biodata.
+
+Aktifkan dengan environment variable BIODATA_EVENT_LOG:
+  BIODATA_EVENT_LOG=1            -> ditulis ke events.jsonl di direktori aplikasi
+  BIODATA_EVENT_LOG=/path/x.jsonl -> ditulis ke path tersebut
+"""
+import atexit
+import os
+import threading
+import time
+
+_now = time.time
+_perf = time.perf_counter
+
+
+class LogEvent:
+    """Menulis event aplikasi ke file JSON Lines."""
+
+    def __init__(self, path):
+        # json baru di-import saat log event benar-benar diaktifkan. Encoder dibuat
+        # sekali dan method encode-nya di-bind, sehingga setiap event cukup memanggil
+        # satu fungsi tanpa membuat encoder baru.
+        import json
+
+        self._encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        self.path = path
+        # buffering=1 -> line buffered, setiap event langsung sampai ke file
+        self._file = open(path, "a", encoding="utf-8", buffering=1)
+        self._write = self._file.write
+        self._lock = threading.Lock()
+        atexit.register(self.tutup)
+
+    def catat(self, event, user=None, key=None, mulai=None, **data):
+        """Mencatat satu event. `mulai` adalah nilai time.perf_counter() saat operasi dimulai."""
+        record = {
+            "ts": round(_now(), 6),
+            "event": event,
+            "user": user,
+            "key": key,
+            "duration_ms": round((_perf() - mulai) * 1000.0, 3) if mulai is not None else None,
+        }
+        if data:
+            record.update(data)
+        line = self._encode(record) + "\n"
+        with self._lock:
+            self._write(line)
+
+    def tutup(self):
+        """Menutup file log event."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class _LogEventNonaktif:
+    """Pengganti LogEvent saat fitur tidak diaktifkan (semua method no-op)."""
+
+    path = None
+
+    def catat(self, event, user=None, key=None, mulai=None, **data):
+        pass
+
+    def tutup(self):
+        pass
+
+
+LOG_NONAKTIF = _LogEventNonaktif()
+
+
+def buat_log_event(direktori):
+    """Membuat LogEvent sesuai BIODATA_EVENT_LOG, atau LOG_NONAKTIF jika tidak di-set."""
+    nilai = os.environ.get("BIODATA_EVENT_LOG", "").strip()
+    if not nilai or nilai == "0":
+        return LOG_NONAKTIF
+    path = os.path.join(direktori, "events.jsonl") if nilai == "1" else nilai
+    return LogEvent(path)
@@ -0,0 +1,70 @@
+"""Notifikasi non-modal (toast) dengan antrian dan auto-dismiss.
+
+Dipakai untuk pesan sukses di hot path (login, submit, simpan) sehingga operator
+tidak perlu menutup dialog modal untuk setiap mahasiswa. Dialog modal tetap
+dipakai untuk error dan peringatan.
+"""
+import collections
+import tkinter as tk
+
+WARNA = {
+    "info": "#2e7d32",
+    "peringatan": "#ef6c00",
+    "error": "#c62828",
+}
+
+
+class Notifikasi:
+    """Toast di bagian bawah window yang hilang sendiri setelah `durasi_ms`."""
+
+    def __init__(self, root, durasi_ms=2500, maks_antrian=20):
+        self.root = root
+        self.durasi_ms = durasi_ms
+        # Jika antrian penuh, pesan tertua dibuang (deque maxlen)
+        self.antrian = collections.deque(maxlen=maks_antrian)
+        self.jumlah_ditampilkan = 0
+        self._after_id = None
+        self.label = tk.Label(
+            root,
+            text="",
+            font=("Arial", 11),
+            fg="white",
+            bg=WARNA["info"],
+            padx=12,
+            pady=6,
+            wraplength=500,
+            justify=tk.LEFT,
+        )
+        # Klik toast untuk langsung menutupnya
+        self.label.bind("<Button-1>", lambda e: self._berikutnya())
+
+    @property
+    def aktif(self):
+        return self._after_id is not None
+
+    def tampilkan(self, pesan, jenis="info"):
+        """Memasukkan pesan ke antrian; langsung tampil jika tidak ada toast aktif."""
+        self.antrian.append((pesan, jenis))
+        if not self.aktif:
+            self._berikutnya()
+
+    def _berikutnya(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        if not self.antrian:
+            self.label.place_forget()
+            return
+        pesan, jenis = self.antrian.popleft()
+        self.label.config(text=pesan, bg=WARNA.get(jenis, WARNA["info"]))
+        self.label.place(relx=0.5, rely=1.0, y=-12, anchor="s")
+        self.label.lift()
+        self.jumlah_ditampilkan += 1
+        # Jika masih ada antrian, tampilkan lebih singkat agar tidak menumpuk
+        durasi = self.durasi_ms if not self.antrian else max(500, self.durasi_ms // 2)
+        self._after_id = self.root.after(durasi, self._berikutnya)
+
+    def tutup_semua(self):
+        """Mengosongkan antrian dan menyembunyikan toast."""
+        self.antrian.clear()
+        self._berikutnya()
@@ -0,0 +1,236 @@
+"""Outbox lokal untuk mengirim record biodata ke sistem akademik pusat (registrar).
+
+Record yang tersimpan dimasukkan ke tabel SQLite lokal dulu, sehingga tetap aman
+saat jaringan meja intake putus atau aplikasi ditutup. Thread latar mengirimnya
+per batch lewat satu koneksi HTTP yang dipakai ulang (keep-alive):
+
+    POST <url>   {"records": [{"idempotency_key": <nim>, ...record}, ...]}
+
+Respons 2xx berarti seluruh batch diterima dan batch dihapus dari outbox.
+Gangguan jaringan, 5xx, 408 dan 429 diulang dengan exponential backoff (+jitter);
+status 4xx lain berarti ada data yang ditolak: batch dikirim ulang per record dan
+hanya record yang ditolak yang ditandai, agar antrian tidak macet.
+Pengiriman bersifat at-least-once: batch yang sudah diterima bisa terkirim lagi
+jika respons hilang, jadi registrar men-dedup berdasarkan idempotency_key (NIM).
+Jika NIM yang sama disimpan ulang sebelum terkirim, hanya versi terbaru yang dikirim.
+
+Aktifkan dengan environment variable BIODATA_REGISTRAR_URL (mis. http://host:8000/api/biodata).
+"""
+import hashlib
+import http.client
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit
+
+_SKEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    nim TEXT NOT NULL UNIQUE,
+    payload TEXT NOT NULL,
+    dibuat REAL NOT NULL,
+    percobaan INTEGER NOT NULL DEFAULT 0,
+    ditolak TEXT
+);
+"""
+
+# Status HTTP yang layak diulang; 4xx lain berarti data ditolak registrar
+_STATUS_ULANG = {408, 425, 429}
+
+
+def url_registrar():
+    """Membaca BIODATA_REGISTRAR_URL: None jika outbox nonaktif."""
+    return os.environ.get("BIODATA_REGISTRAR_URL", "").strip() or None
+
+
+class GagalKirim(Exception):
+    """Batch gagal dikirim; `ulang` False jika registrar menolak datanya."""
+
+    def __init__(self, pesan, ulang=True):
+        super().__init__(pesan)
+        self.ulang = ulang
+
+
+class OutboxRegistrar:
+    """Antrian record yang tahan restart plus worker pengirim di thread latar."""
+
+    def __init__(self, path, url, ukuran_batch=50, timeout=10.0, backoff_awal=1.0, backoff_maks=300.0):
+        self.path = path
+        self.url = urlsplit(url)
+        if self.url.scheme not in ("http", "https"):
+            raise ValueError(f"URL registrar harus http/https: {url}")
+        self.ukuran_batch = ukuran_batch
+        self.timeout = timeout
+        self.backoff_awal = backoff_awal
+        self.backoff_maks = backoff_maks
+        self.jumlah_terkirim = 0
+        self.gagal_beruntun = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SKEMA)
+        self._http = None
+        self._bangun = threading.Event()
+        self._berhenti = threading.Event()
+        self._thread = None
+
+    # --- Antrian ---
+
+    def tambah(self, record):
+        self.tambah_banyak([record])
+
+    def tambah_banyak(self, records):
+        """Memasukkan record ke outbox (satu transaksi); record lama dengan NIM sama diganti."""
+        sekarang = time.time()
+        baris = [(r["nim"], json.dumps(r, ensure_ascii=False), sekarang) for r in records]
+        with self._lock, self._conn:
+            # REPLACE memberi id baru, sehingga batch yang sedang dikirim tidak menghapus versi terbaru
+            self._conn.executemany("INSERT OR REPLACE INTO outbox (nim, payload, dibuat) VALUES (?, ?, ?)", baris)
+        self._bangun.set()
+
+    def jumlah_tertunda(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM outbox WHERE ditolak IS NULL").fetchone()[0]
+
+    def jumlah_ditolak(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM outbox WHERE ditolak IS NOT NULL").fetchone()[0]
+
+    def _ambil_batch(self):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, nim, payload FROM outbox WHERE ditolak IS NULL ORDER BY id LIMIT ?",
+                (self.ukuran_batch,),
+            ).fetchall()
+
+    def _selesai(self, batch):
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM outbox WHERE id = ?", [(id_,) for id_, _, _ in batch])
+
+    def _tandai(self, batch, ditolak=None):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE outbox SET percobaan = percobaan + 1, ditolak = ? WHERE id = ?",
+                [(ditolak, id_) for id_, _, _ in batch],
+            )
+
+    # --- Pengiriman ---
+
+    def _koneksi(self):
+        if self._http is None:
+            kelas = http.client.HTTPSConnection if self.url.scheme == "https" else http.client.HTTPConnection
+            self._http = kelas(self.url.hostname, self.url.port, timeout=self.timeout)
+        return self._http
+
+    def _tutup_koneksi(self):
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def _kirim(self, batch):
+        isi = []
+        for _, nim, payload in batch:
+            record = json.loads(payload)
+            record["idempotency_key"] = nim
+            isi.append(record)
+        body = json.dumps({"records": isi}, ensure_ascii=False).encode("utf-8")
+        # Kunci batch stabil selama isi batch sama, untuk registrar yang men-dedup per request
+        kunci = hashlib.sha1(",".join(f"{nim}:{id_}" for id_, nim, _ in batch).encode("utf-8")).hexdigest()
+        header = {"Content-Type": "application/json; charset=utf-8", "Idempotency-Key": kunci}
+        try:
+            koneksi = self._koneksi()
+            koneksi.request("POST", self.url.path or "/", body=body, headers=header)
+            respons = koneksi.getresponse()
+            # Body dibaca habis agar koneksi bisa dipakai ulang
+            pesan = respons.read()[:200].decode("utf-8", "replace")
+        except (OSError, http.client.HTTPException) as e:
+            self._tutup_koneksi()
+            raise GagalKirim(f"{type(e).__name__}: {e}")
+        if respons.will_close:
+            self._tutup_koneksi()
+        if 200 <= respons.status < 300:
+            return
+        ulang = respons.status >= 500 or respons.status in _STATUS_ULANG
+        raise GagalKirim(f"HTTP {respons.status}: {pesan}", ulang=ulang)
+
+    def kirim_sekali(self):
+        """Mengirim satu batch; mengembalikan jumlah record terkirim (0 jika outbox kosong).
+
+        Raise GagalKirim jika batch perlu diulang nanti.
+        """
+        batch = self._ambil_batch()
+        if not batch:
+            return 0
+        return self._kirim_batch(batch)
+
+    def _kirim_batch(self, batch):
+        try:
+            self._kirim(batch)
+        except GagalKirim as e:
+            if e.ulang:
+                self._tandai(batch)
+                raise
+            if len(batch) > 1:
+                # Satu record buruk tidak boleh ikut menahan record lain: kirim satu per satu
+                return sum(self._kirim_batch([item]) for item in batch)
+            logging.error(f"Registrar rejected record NIM {batch[0][1]}: {e}")
+            self._tandai(batch, ditolak=str(e))
+            return 0
+        self._selesai(batch)
+        self.jumlah_terkirim += len(batch)
+        return len(batch)
+
+    def _tunda_backoff(self):
+        tunda = min(self.backoff_maks, self.backoff_awal * 2 ** (self.gagal_beruntun - 1))
+        # Jitter agar banyak meja yang online bersamaan tidak menyerbu registrar serentak
+        return tunda * random.uniform(0.5, 1.0)
+
+    def _jalankan(self):
+        while not self._berhenti.is_set():
+            self._bangun.clear()
+            try:
+                terkirim = self.kirim_sekali()
+            except GagalKirim as e:
+                self.gagal_beruntun += 1
+                tunda = self._tunda_backoff()
+                logging.warning(f"Registrar sync failed ({self.gagal_beruntun}x), retry in {tunda:.1f} s: {e}")
+                self._berhenti.wait(tunda)
+                continue
+            except Exception:
+                logging.exception("Registrar outbox worker error")
+                self._berhenti.wait(self.backoff_maks)
+                continue
+            if self.gagal_beruntun:
+                logging.info("Registrar sync recovered")
+                self.gagal_beruntun = 0
+            if not terkirim and not self._ada_tertunda():
+                self._bangun.wait()
+
+    def _ada_tertunda(self):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM outbox WHERE ditolak IS NULL LIMIT 1").fetchone() is not None
+
+    def mulai(self):
+        """Menjalankan worker; record yang tertinggal dari sesi sebelumnya ikut dikirim."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._jalankan, name="biodata-outbox", daemon=True)
+            self._thread.start()
+        return self._thread
+
+    def berhenti(self, timeout=5.0):
+        """Menghentikan worker (record yang belum terkirim tetap di outbox) lalu menutup database."""
+        self._berhenti.set()
+        self._bangun.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                # Worker masih menunggu respons HTTP; database dibiarkan terbuka untuknya
+                return
+        self._tutup_koneksi()
+        with self._lock:
+            self._conn.close()
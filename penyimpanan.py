@@ -0,0 +1,144 @@
+"""Penyimpanan record biodata mahasiswa berbasis SQLite.
+
+Satu record per NIM. Pengurutan dan paging dilakukan di database (memakai index),
+sehingga tampilan hanya perlu mengambil baris yang sedang terlihat.
+"""
+import os
+import sqlite3
+import threading
+import uuid
+
+KOLOM = ("nim", "nama", "jurusan", "email", "telepon", "tgl_lahir", "alamat", "jenis_kelamin", "diinput_oleh", "waktu")
+
+# Kolom yang boleh dipakai untuk ORDER BY (masing-masing punya index)
+KOLOM_URUT = ("nim", "nama", "jurusan")
+
+_SKEMA = """
+CREATE TABLE IF NOT EXISTS biodata (
+    nim TEXT PRIMARY KEY,
+    nama TEXT NOT NULL,
+    jurusan TEXT NOT NULL,
+    email TEXT NOT NULL,
+    telepon TEXT NOT NULL,
+    tgl_lahir TEXT NOT NULL DEFAULT '',
+    alamat TEXT NOT NULL DEFAULT '',
+    jenis_kelamin TEXT NOT NULL DEFAULT '',
+    diinput_oleh TEXT,
+    waktu TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_biodata_nama ON biodata (nama, nim);
+CREATE INDEX IF NOT EXISTS idx_biodata_jurusan ON biodata (jurusan, nim);
+
+-- Penghitung penulisan untuk tanda_versi, dinaikkan di transaksi yang sama dengan penulisannya
+CREATE TABLE IF NOT EXISTS versi_store (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    token TEXT NOT NULL,
+    penulisan INTEGER NOT NULL
+);
+"""
+
+_SQL_SIMPAN = (
+    f"INSERT OR REPLACE INTO biodata ({', '.join(KOLOM)}) "
+    f"VALUES ({', '.join('?' * len(KOLOM))})"
+)
+
+
+def path_default(script_dir):
+    """Path database default: BIODATA_DB atau biodata.db di samping script."""
+    return os.environ.get("BIODATA_DB") or os.path.join(script_dir, "biodata.db")
+
+
+class PenyimpananBiodata:
+    """Record store biodata (aman dipakai dari beberapa thread dalam satu proses)."""
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._jumlah = None
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SKEMA)
+            # Token acak per database: file index milik database lain (mis. yang dibuat ulang) tidak cocok
+            with self._conn:
+                self._conn.execute("INSERT OR IGNORE INTO versi_store VALUES (1, ?, 0)", (uuid.uuid4().hex,))
+
+    @staticmethod
+    def _baris(record):
+        return tuple(record.get(k) or "" for k in KOLOM)
+
+    def simpan(self, record):
+        """Menyimpan (atau mengganti) satu record berdasarkan NIM."""
+        self.simpan_banyak((record,))
+
+    def simpan_banyak(self, records):
+        """Menyimpan banyak record dalam satu transaksi."""
+        baris = [self._baris(r) for r in records]
+        with self._lock, self._conn:
+            self._conn.executemany(_SQL_SIMPAN, baris)
+            self._conn.execute("UPDATE versi_store SET penulisan = penulisan + 1")
+            self._jumlah = None
+
+    def ambil(self, nim):
+        """Mengambil satu record berdasarkan NIM, atau None."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM biodata WHERE nim = ?", (nim,)).fetchone()
+        return dict(row) if row else None
+
+    def jumlah(self):
+        """Jumlah record (di-cache sampai ada penulisan berikutnya)."""
+        with self._lock:
+            if self._jumlah is None:
+                self._jumlah = self._conn.execute("SELECT count(*) FROM biodata").fetchone()[0]
+            return self._jumlah
+
+    def tanda_versi(self):
+        """(token database, jumlah transaksi tulis): berubah setiap ada simpan/simpan_banyak.
+
+        Dipakai index turunan (pencarian, autocomplete) yang disimpan ke disk untuk
+        mengetahui apakah mereka masih sinkron dengan isi store.
+        """
+        with self._lock:
+            return tuple(self._conn.execute("SELECT token, penulisan FROM versi_store").fetchone())
+
+    def frekuensi_jurusan(self):
+        """List (jurusan, jumlah record) — dihitung dari index jurusan."""
+        with self._lock:
+            return self._conn.execute("SELECT jurusan, count(*) FROM biodata GROUP BY jurusan").fetchall()
+
+    def halaman(self, offset, limit, urut="nim", turun=False, kolom=KOLOM):
+        """Mengambil `limit` record mulai posisi `offset` dalam urutan `urut`.
+
+        Offset diselesaikan lewat index (subquery hanya membaca rowid dari index
+        yang sesuai), lalu baris lengkap diambil untuk halaman tersebut saja.
+        """
+        if urut not in KOLOM_URUT:
+            raise ValueError(f"Kolom urut tidak dikenal: {urut}")
+        arah = "DESC" if turun else "ASC"
+        urutan = f"{urut} {arah}" if urut == "nim" else f"{urut} {arah}, nim {arah}"
+        sql = (
+            f"SELECT {', '.join(kolom)} FROM biodata WHERE rowid IN ("
+            f"SELECT rowid FROM biodata ORDER BY {urutan} LIMIT ? OFFSET ?"
+            f") ORDER BY {urutan}"
+        )
+        with self._lock:
+            return [tuple(r) for r in self._conn.execute(sql, (limit, offset))]
+
+    def semua(self, kolom=KOLOM, ukuran_batch=10000):
+        """Iterasi semua record (untuk membangun index di memori)."""
+        sql = f"SELECT rowid, {', '.join(kolom)} FROM biodata WHERE rowid > ? ORDER BY rowid LIMIT ?"
+        terakhir = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(sql, (terakhir, ukuran_batch)).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield tuple(row)[1:]
+            terakhir = rows[-1][0]
+
+    def tutup(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,120 @@
+"""Pipeline pasca-simpan: tahap-tahap berurutan yang dijalankan setelah sebuah record disimpan.
+
+Setiap tahap adalah fungsi `fungsi(konteks)` yang menerima dict konteks bersama
+(record, user, dan hasil tahap sebelumnya). Tahap sinkron dijalankan langsung di
+thread pemanggil, berurutan, sebelum `jalankan` kembali. Jadi hasilnya (mis. path
+file) bisa langsung dikonfirmasi ke operator. Tahap asinkron kemudian dijalankan
+berurutan di thread pool, sementara pemanggil sudah lanjut.
+
+Kegagalan diisolasi per tahap: tahap yang gagal dicatat di hasil dan log, dan
+tahap berikutnya tetap berjalan. Pengecualiannya tahap sinkron `wajib` (mis.
+persist): jika gagal, exception-nya diteruskan ke pemanggil dan tahap berikutnya
+tidak dijalankan. Durasi setiap tahap direkam ke registry Instrumentasi.
+
+Semua tahap sinkron selalu berjalan sebelum tahap asinkron pertama, apa pun
+urutan pendaftarannya. Urutan di dalam masing-masing kelompok tetap dijaga.
+Dengan workers=1 (default), tahap asinkron antar record juga berjalan sesuai
+urutan simpan (mis. baris audit tetap kronologis).
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from instrumentasi import Instrumentasi
+
+
+class Tahap:
+    __slots__ = ("nama", "fungsi", "asinkron", "wajib")
+
+    def __init__(self, nama, fungsi, asinkron=False, wajib=False):
+        if asinkron and wajib:
+            raise ValueError(f"Tahap '{nama}': tahap wajib harus sinkron")
+        self.nama = nama
+        self.fungsi = fungsi
+        self.asinkron = asinkron
+        self.wajib = wajib
+
+
+class HasilPipeline:
+    """Durasi (detik) dan error per tahap untuk satu kali jalan."""
+
+    def __init__(self):
+        self.durasi = {}
+        self.error = {}
+        self._selesai = threading.Event()
+
+    @property
+    def selesai(self):
+        """True jika semua tahap (termasuk yang asinkron) sudah selesai."""
+        return self._selesai.is_set()
+
+    def tunggu(self, timeout=None):
+        return self._selesai.wait(timeout)
+
+    @property
+    def berhasil(self):
+        return not self.error
+
+
+class PipelineSimpan:
+    """Daftar tahap berurutan plus thread pool untuk tahap asinkron."""
+
+    def __init__(self, workers=1, instrumentasi=None):
+        self.tahap = []
+        self.workers = workers
+        self.instrumentasi = instrumentasi if instrumentasi is not None else Instrumentasi()
+        self._pool = None
+
+    def tambah_tahap(self, nama, fungsi, asinkron=False, wajib=False):
+        self.tahap.append(Tahap(nama, fungsi, asinkron=asinkron, wajib=wajib))
+        return self
+
+    def _jalankan_tahap(self, tahap, konteks, hasil):
+        mulai = time.perf_counter()
+        try:
+            tahap.fungsi(konteks)
+        except Exception as e:
+            hasil.error[tahap.nama] = e
+            if tahap.wajib:
+                raise
+            logging.exception(f"Post-save stage '{tahap.nama}' failed")
+        finally:
+            durasi = time.perf_counter() - mulai
+            hasil.durasi[tahap.nama] = durasi
+            self.instrumentasi.rekam(f"tahap:{tahap.nama}", durasi)
+
+    def _jalankan_asinkron(self, tahap_asinkron, konteks, hasil):
+        try:
+            for tahap in tahap_asinkron:
+                self._jalankan_tahap(tahap, konteks, hasil)
+        finally:
+            hasil._selesai.set()
+
+    def jalankan(self, konteks):
+        """Menjalankan tahap sinkron sekarang lalu menjadwalkan tahap asinkron; mengembalikan HasilPipeline.
+
+        Tahap asinkron melihat konteks setelah semua tahap sinkron selesai.
+        """
+        hasil = HasilPipeline()
+        sinkron = [t for t in self.tahap if not t.asinkron]
+        asinkron = [t for t in self.tahap if t.asinkron]
+        try:
+            for tahap in sinkron:
+                self._jalankan_tahap(tahap, konteks, hasil)
+        except Exception:
+            hasil._selesai.set()
+            raise
+        if not asinkron:
+            hasil._selesai.set()
+            return hasil
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="biodata-pipeline")
+        self._pool.submit(self._jalankan_asinkron, asinkron, konteks, hasil)
+        return hasil
+
+    def tutup(self, tunggu=True):
+        """Menunggu tahap asinkron yang masih berjalan (jika `tunggu`) lalu mematikan thread pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=tunggu)
+            self._pool = None
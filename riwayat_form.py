@@ -0,0 +1,94 @@
+"""Riwayat undo/redo form biodata berbasis snapshot immutable.
+
+Setiap snapshot adalah tuple nilai field. Field yang tidak berubah memakai ulang
+objek string dari snapshot sebelumnya, jadi satu snapshot baru hanya menambah
+satu tuple kecil plus nilai field yang benar-benar berubah. Tumpukan undo/redo
+berupa linked list persistent (pasangan (snapshot, sisa)), sehingga push/pop
+tidak pernah menyalin riwayat.
+"""
+
+
+class RiwayatForm:
+    """Tumpukan undo/redo untuk state form (dict field -> nilai)."""
+
+    def __init__(self, field, nilai_awal, maks=200):
+        self.field = tuple(field)
+        self.maks = maks
+        self.mulai_ulang(nilai_awal)
+
+    def mulai_ulang(self, nilai):
+        """Mengosongkan riwayat; `nilai` menjadi state awal."""
+        self.sekarang = tuple(nilai.get(f, "") for f in self.field)
+        self._undo = None
+        self._redo = None
+        self.jumlah_undo = 0
+        self.jumlah_redo = 0
+
+    def _snapshot(self, nilai):
+        baru = []
+        sama = True
+        for f, lama in zip(self.field, self.sekarang):
+            v = nilai.get(f, "")
+            if v == lama:
+                baru.append(lama)
+            else:
+                baru.append(v)
+                sama = False
+        return None if sama else tuple(baru)
+
+    def catat(self, nilai):
+        """Mencatat state form; False jika tidak ada yang berubah sejak snapshot terakhir."""
+        snapshot = self._snapshot(nilai)
+        if snapshot is None:
+            return False
+        self._undo = (self.sekarang, self._undo)
+        self.jumlah_undo += 1
+        self.sekarang = snapshot
+        self._redo = None
+        self.jumlah_redo = 0
+        if self.jumlah_undo > 2 * self.maks:
+            self._pangkas()
+        return True
+
+    def _pangkas(self):
+        # Dijalankan sekali setiap `maks` snapshot: simpan `maks` snapshot terbaru saja
+        simpan = []
+        node = self._undo
+        while node is not None and len(simpan) < self.maks:
+            simpan.append(node[0])
+            node = node[1]
+        self._undo = None
+        for snapshot in reversed(simpan):
+            self._undo = (snapshot, self._undo)
+        self.jumlah_undo = len(simpan)
+
+    def _sebagai_dict(self):
+        return dict(zip(self.field, self.sekarang))
+
+    @property
+    def bisa_undo(self):
+        return self._undo is not None
+
+    @property
+    def bisa_redo(self):
+        return self._redo is not None
+
+    def undo(self):
+        """Kembali ke snapshot sebelumnya; mengembalikan state (dict) atau None."""
+        if self._undo is None:
+            return None
+        self._redo = (self.sekarang, self._redo)
+        self.jumlah_redo += 1
+        self.sekarang, self._undo = self._undo
+        self.jumlah_undo -= 1
+        return self._sebagai_dict()
+
+    def redo(self):
+        """Maju ke snapshot yang di-undo terakhir; mengembalikan state (dict) atau None."""
+        if self._redo is None:
+            return None
+        self._undo = (self.sekarang, self._undo)
+        self.jumlah_undo += 1
+        self.sekarang, self._redo = self._redo
+        self.jumlah_redo -= 1
+        return self._sebagai_dict()
@@ -0,0 +1,340 @@
+"""Server HTTP/JSON untuk biodata mahasiswa (asyncio, hanya standard library).
+
+Server dan aplikasi Tk memakai logika yang sama lewat BiodataService.
+
+Endpoint:
+    POST /validate            body: field form -> {"valid": ..., "kesalahan": [...]}
+    POST /submit              body: field form -> validasi lalu simpan ke record store
+    GET  /mahasiswa/<nim>     record tersimpan
+    GET  /cari?q=...&batas=N  pencarian nama/NIM/email/alamat (1 <= N, maksimal 100 hasil)
+
+Koneksi keep-alive dan request pipelining didukung: request dari satu koneksi
+dibaca berurutan dan responsnya ditulis sesuai urutan yang sama. Panggilan store
+yang blocking dijalankan di thread pool berukuran tetap (jumlah tugas yang
+menunggu juga dibatasi), dan penulisan dari banyak request digabung menjadi satu
+transaksi per batch. Index pencarian dan trie jurusan hanya disentuh dari thread
+event loop.
+
+Server ini TIDAK memakai autentikasi: siapa pun yang bisa connect dapat membaca dan
+menambah record. Karena itu defaultnya hanya bind ke localhost (127.0.0.1);
+--host lain hanya untuk jaringan yang sudah dibatasi (mis. di belakang reverse
+proxy yang mengautentikasi). Record dari server selalu dicatat dengan penginput
+USER_SERVER; field "user" di body diabaikan agar klien tidak bisa mengatasnamakan operator.
+
+Pemakaian:
+    python server_biodata.py --port 8080 [--db biodata.db] [--workers 4] [--registrar URL]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from layanan_biodata import BiodataService, GagalValidasi
+from outbox_registrar import url_registrar
+
+MAKS_HEADER = 16 * 1024
+MAKS_BODY = 1024 * 1024
+# Maksimum record per transaksi penulisan
+MAKS_BATCH = 256
+# Penginput (diinput_oleh) untuk semua record yang masuk lewat server
+USER_SERVER = "web"
+
+_STATUS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class KesalahanHttp(Exception):
+    def __init__(self, status, pesan, **data):
+        super().__init__(pesan)
+        self.status = status
+        self.isi = dict(error=pesan, **data)
+
+
+def _json(obj):
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _gagalkan(selesai):
+    """Menandai submit yang tidak akan pernah ditulis karena server berhenti."""
+    if not selesai.done():
+        selesai.set_exception(KesalahanHttp(503, "Server sedang berhenti, data tidak disimpan"))
+
+
+def _respons(status, isi, tetap_hidup):
+    koneksi = b"keep-alive" if tetap_hidup else b"close"
+    return b"".join((
+        f"HTTP/1.1 {status} {_STATUS[status]}\r\n".encode("ascii"),
+        b"Content-Type: application/json; charset=utf-8\r\n",
+        f"Content-Length: {len(isi)}\r\n".encode("ascii"),
+        b"Connection: ", koneksi, b"\r\n\r\n",
+        isi,
+    ))
+
+
+class ServerBiodata:
+    """Server asyncio di atas satu BiodataService."""
+
+    def __init__(self, layanan, workers=4):
+        self.layanan = layanan
+        self.workers = workers
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="biodata-http")
+        self.jumlah_request = 0
+        self._slot = None
+        self._antrian_simpan = None
+        self._tugas_penulis = None
+        self._server = None
+
+    async def _blocking(self, fungsi, *args):
+        """Menjalankan panggilan blocking di thread pool (maksimal workers x 4 antre)."""
+        async with self._slot:
+            return await asyncio.get_running_loop().run_in_executor(self.pool, fungsi, *args)
+
+    async def mulai(self, host="127.0.0.1", port=8080):
+        self._slot = asyncio.Semaphore(self.workers * 4)
+        self._antrian_simpan = asyncio.Queue()
+
+        # Trie jurusan dan index pencarian disiapkan sebelum menerima koneksi
+        await self._blocking(self.layanan.trie_jurusan)
+        thread = self.layanan.mulai_muat_indeks_cari()
+        await self._blocking(thread.join)
+        self.layanan.pasang_indeks_cari()
+
+        self._tugas_penulis = asyncio.create_task(self._penulis())
+        self._server = await asyncio.start_server(self._koneksi, host, port, limit=MAKS_HEADER)
+        alamat = ", ".join(str(s.getsockname()) for s in self._server.sockets)
+        logging.info(f"Biodata HTTP server listening on {alamat}")
+        return self._server
+
+    async def berhenti(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._tugas_penulis is not None:
+            self._tugas_penulis.cancel()
+            try:
+                await self._tugas_penulis
+            except asyncio.CancelledError:
+                pass
+        # Submit yang masih antre tidak akan ditulis lagi: klien diberi error, bukan dibiarkan menunggu
+        while self._antrian_simpan is not None and not self._antrian_simpan.empty():
+            _, selesai = self._antrian_simpan.get_nowait()
+            _gagalkan(selesai)
+        self.pool.shutdown(wait=True)
+        self.layanan.tutup()
+
+    # --- Penulisan (group commit) ---
+
+    async def _penulis(self):
+        store = self.layanan.penyimpanan()
+        antrian = self._antrian_simpan
+        batch = []
+        try:
+            while True:
+                batch = [await antrian.get()]
+                while len(batch) < MAKS_BATCH and not antrian.empty():
+                    batch.append(antrian.get_nowait())
+                records = [record for record, _ in batch]
+                try:
+                    await self._blocking(store.simpan_banyak, records)
+                except Exception as e:
+                    logging.error(f"Failed to write batch of {len(batch)} records: {e}")
+                    for _, selesai in batch:
+                        if not selesai.done():
+                            selesai.set_exception(e)
+                    continue
+                # Record sudah di-commit: kegagalan outbox tidak boleh membuat klien
+                # mengulang submit (duplikat) atau membuat index melewatkan record ini
+                if self.layanan.outbox is not None:
+                    try:
+                        await self._blocking(self.layanan.outbox.tambah_banyak, records)
+                    except Exception as e:
+                        nim = ", ".join(record["nim"] for record in records[:5])
+                        logging.error(f"Saved {len(records)} records but failed to queue them for the registrar "
+                                      f"(NIM {nim}{', ...' if len(records) > 5 else ''}): {e}")
+                for record, selesai in batch:
+                    # Satu record yang gagal di-index tidak boleh menghentikan penulis
+                    try:
+                        self.layanan.setelah_simpan(record)
+                    except Exception:
+                        logging.exception(f"Saved record NIM {record['nim']} but failed to update the indexes")
+                    if not selesai.done():
+                        selesai.set_result(None)
+        finally:
+            # Dibatalkan di tengah batch (server berhenti): jangan biarkan klien menunggu selamanya
+            for _, selesai in batch:
+                _gagalkan(selesai)
+
+    async def _simpan(self, record):
+        selesai = asyncio.get_running_loop().create_future()
+        await self._antrian_simpan.put((record, selesai))
+        await selesai
+
+    # --- Endpoint ---
+
+    async def _proses(self, metode, target, body):
+        url = urlsplit(target)
+        path = url.path.rstrip("/") or "/"
+
+        if path == "/submit" or path == "/validate":
+            if metode != "POST":
+                raise KesalahanHttp(405, "Gunakan POST")
+            data = self._baca_json(body)
+            if path == "/validate":
+                kesalahan = self.layanan.validate(data)
+                return 200, {"valid": not kesalahan, "kesalahan": [self._kesalahan(e) for e in kesalahan]}
+            try:
+                record = self.layanan.submit(data)
+            except GagalValidasi as e:
+                raise KesalahanHttp(422, e.pesan, kesalahan=[self._kesalahan(e)])
+            record = self.layanan.siapkan_record(record, USER_SERVER)
+            await self._simpan(record)
+            return 200, {"status": "ok", "record": record}
+
+        if metode != "GET":
+            raise KesalahanHttp(405, "Gunakan GET")
+        if path.startswith("/mahasiswa/"):
+            nim = unquote(path[len("/mahasiswa/"):])
+            record = await self._blocking(self.layanan.ambil, nim)
+            if record is None:
+                raise KesalahanHttp(404, f"NIM {nim} tidak ditemukan")
+            return 200, record
+        if path == "/cari":
+            query = parse_qs(url.query)
+            q = query.get("q", [""])[0]
+            try:
+                batas = int(query.get("batas", ["10"])[0])
+            except ValueError:
+                raise KesalahanHttp(400, "batas harus berupa angka")
+            if batas < 1:
+                raise KesalahanHttp(400, "batas minimal 1")
+            batas = min(batas, 100)
+            hasil = self.layanan.cari(q, batas=batas)
+            return 200, {"hasil": [{"nim": nim, "nama": nama, "jurusan": jurusan} for nim, nama, jurusan in hasil]}
+        raise KesalahanHttp(404, "Endpoint tidak dikenal")
+
+    @staticmethod
+    def _baca_json(body):
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            raise KesalahanHttp(400, "Body bukan JSON yang valid")
+        if not isinstance(data, dict):
+            raise KesalahanHttp(400, "Body harus berupa objek JSON")
+        return data
+
+    @staticmethod
+    def _kesalahan(e):
+        return {"field": e.field, "judul": e.judul, "pesan": e.pesan}
+
+    # --- Koneksi ---
+
+    async def _koneksi(self, reader, writer):
+        try:
+            while True:
+                try:
+                    kepala = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(_respons(413, _json({"error": "Header terlalu besar"}), False))
+                    break
+
+                baris = kepala.decode("latin-1").split("\r\n")
+                try:
+                    metode, target, versi = baris[0].split(" ", 2)
+                except ValueError:
+                    writer.write(_respons(400, _json({"error": "Request line tidak valid"}), False))
+                    break
+                header = {}
+                for h in baris[1:]:
+                    if ":" in h:
+                        nama, nilai = h.split(":", 1)
+                        header[nama.strip().lower()] = nilai.strip()
+
+                koneksi = header.get("connection", "").lower()
+                if versi == "HTTP/1.0":
+                    tetap_hidup = koneksi == "keep-alive"
+                else:
+                    tetap_hidup = koneksi != "close"
+
+                try:
+                    panjang = int(header.get("content-length", "0"))
+                except ValueError:
+                    panjang = -1
+                if panjang < 0 or panjang > MAKS_BODY:
+                    writer.write(_respons(413 if panjang > 0 else 400, _json({"error": "Content-Length tidak valid"}), False))
+                    break
+                body = await reader.readexactly(panjang) if panjang else b""
+
+                self.jumlah_request += 1
+                try:
+                    status, isi = await self._proses(metode, target, body)
+                except KesalahanHttp as e:
+                    status, isi = e.status, e.isi
+                except Exception as e:
+                    logging.exception(f"Error handling {metode} {target}")
+                    status, isi = 500, {"error": str(e)}
+
+                writer.write(_respons(status, _json(isi), tetap_hidup))
+                if not tetap_hidup:
+                    break
+                # Request pipelined yang sudah ada di buffer tetap dibaca tanpa menunggu;
+                # drain hanya menahan jika buffer kirim sudah penuh
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+            writer.close()
+
+
+async def _jalankan(args):
+    direktori = os.path.dirname(os.path.abspath(__file__))
+    layanan = BiodataService(direktori, path_db=args.db)
+    if args.registrar:
+        layanan.mulai_outbox(args.registrar)
+    server = ServerBiodata(layanan, workers=args.workers)
+    srv = await server.mulai(args.host, args.port)
+    try:
+        async with srv:
+            await srv.serve_forever()
+    finally:
+        await server.berhenti()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--db", help="path database (default: BIODATA_DB atau biodata.db)")
+    parser.add_argument("--workers", type=int, default=4, help="ukuran thread pool untuk panggilan store")
+    parser.add_argument("--registrar", default=url_registrar(), help="URL registrar (default: BIODATA_REGISTRAR_URL)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if args.host not in ("127.0.0.1", "localhost", "::1"):
+        logging.warning(f"Binding to {args.host}: this server has no authentication")
+    try:
+        asyncio.run(_jalankan(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""Stress test penulisan file bersama: N proses menulis ke satu file CSV sekaligus.
+
+Pemakaian:
+    python stress_berkas.py                  # 8 proses x 2000 record, batch 16
+    python stress_berkas.py -p 16 -n 5000 -b 1
+    python stress_berkas.py --naif           # pola lama (open "a" + csv.writer) sebagai pembanding
+
+Setelah semua proses selesai, file diperiksa: header tepat satu kali di baris
+pertama, jumlah record sesuai, tidak ada record yang hilang, ganda, atau terpotong
+(setiap record membawa checksum isinya). Exit code 1 jika ada yang salah.
+"""
+import argparse
+import csv
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import zlib
+
+from berkas_bersama import baris_csv, tambah_ke_berkas
+
+HEADER = ["Nama", "NIM", "Jurusan", "Alamat", "Jenis Kelamin", "Cek"]
+
+
+def _row(proses, i):
+    # Alamat sengaja panjang dan berisi koma/kutip agar record torn mudah terdeteksi
+    nama = f"Mahasiswa {proses}-{i}"
+    nim = f"{231060500000 + proses * 1000000 + i}"
+    alamat = f'jln. "Kenanga" no. {i}, gg. {proses}, ' + "x" * (i % 300)
+    isi = [nama, nim, "Informatika", alamat, "Pria" if i % 2 else "Wanita"]
+    return isi + [str(zlib.crc32("|".join(isi).encode("utf-8")))]
+
+
+def _penulis(path, proses, jumlah, batch):
+    header = baris_csv(HEADER)
+    for awal in range(0, jumlah, batch):
+        tambah_ke_berkas(path, [baris_csv(_row(proses, i)) for i in range(awal, min(awal + batch, jumlah))], header)
+
+
+def _penulis_naif(path, proses, jumlah, batch):
+    # Pola lama di 23106050012-ppde-workspace: cek header lewat tell() tanpa lock
+    for i in range(jumlah):
+        with open(path, "a", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            if file.tell() == 0:
+                writer.writerow(HEADER)
+            writer.writerow(_row(proses, i))
+
+
+def periksa(path, proses, jumlah):
+    """Mengembalikan list pesan kesalahan (kosong jika file utuh)."""
+    kesalahan = []
+    terlihat = set()
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    if not rows or rows[0] != HEADER:
+        kesalahan.append("header tidak ada di baris pertama")
+    jumlah_header = sum(1 for r in rows if r == HEADER)
+    if jumlah_header != 1:
+        kesalahan.append(f"header muncul {jumlah_header} kali")
+    for nomor, row in enumerate(rows[1:], start=2):
+        if row == HEADER:
+            continue
+        if len(row) != len(HEADER) or str(zlib.crc32("|".join(row[:-1]).encode("utf-8"))) != row[-1]:
+            kesalahan.append(f"record rusak di baris {nomor}")
+            continue
+        if row[1] in terlihat:
+            kesalahan.append(f"record ganda NIM {row[1]}")
+        terlihat.add(row[1])
+    hilang = proses * jumlah - len(terlihat)
+    if hilang:
+        kesalahan.append(f"{hilang} record hilang")
+    return kesalahan
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-p", "--proses", type=int, default=8)
+    parser.add_argument("-n", "--jumlah", type=int, default=2000, help="record per proses")
+    parser.add_argument("-b", "--batch", type=int, default=16, help="record per lock")
+    parser.add_argument("--naif", action="store_true", help="pakai pola penulisan lama tanpa lock")
+    parser.add_argument("--file", help="file tujuan (default: file sementara)")
+    args = parser.parse_args(argv)
+
+    path = args.file or os.path.join(tempfile.mkdtemp(), "stress.csv")
+    if os.path.exists(path):
+        os.remove(path)
+    target = _penulis_naif if args.naif else _penulis
+    daftar = [multiprocessing.Process(target=target, args=(path, p, args.jumlah, args.batch))
+              for p in range(args.proses)]
+    mulai = time.perf_counter()
+    for proses in daftar:
+        proses.start()
+    for proses in daftar:
+        proses.join()
+    durasi = time.perf_counter() - mulai
+
+    total = args.proses * args.jumlah
+    print(f"{args.proses} proses x {args.jumlah} record -> {path}")
+    print(f"{total} record dalam {durasi:.2f} s ({total / durasi:.0f} record/s)")
+    kesalahan = periksa(path, args.proses, args.jumlah)
+    for pesan in kesalahan[:20]:
+        print(f"  GAGAL: {pesan}")
+    if kesalahan:
+        print(f"{len(kesalahan)} kesalahan")
+        return 1
+    print("OK: tidak ada record yang hilang, ganda, atau terpotong")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
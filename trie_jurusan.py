@@ -0,0 +1,101 @@
+"""Trie prefix berperingkat frekuensi untuk autocomplete Jurusan.
+
+Nilai jurusan dinormalisasi (spasi dirapikan, casefold) sehingga "informatika" dan
+"Informatika" dihitung sebagai satu jurusan; ejaan yang paling sering dipakai
+menjadi bentuk kanonik yang disarankan. Setiap awal kata ikut diindex, jadi
+"inf" juga menyarankan "Teknik Informatika".
+
+Setiap simpul menyimpan daftar K jurusan teratas di bawahnya, sehingga query
+prefix hanya berjalan sepanjang prefix lalu mengambil daftar yang sudah jadi.
+"""
+
+
+def _rapikan(nilai):
+    return " ".join(nilai.split())
+
+
+class _Simpul:
+    __slots__ = ("anak", "teratas")
+
+    def __init__(self):
+        self.anak = {}
+        # [frekuensi, kunci] terurut menurun
+        self.teratas = []
+
+
+class TrieJurusan:
+    """Trie jurusan dengan update inkremental (frekuensi hanya bertambah)."""
+
+    def __init__(self, k=8):
+        self.k = k
+        self.akar = _Simpul()
+        self.frekuensi = {}
+        self.ejaan = {}
+        self.kanonik = {}
+
+    def __len__(self):
+        return len(self.frekuensi)
+
+    @classmethod
+    def dari_frekuensi(cls, pasangan, k=8):
+        """Membangun trie dari iterable (jurusan, jumlah)."""
+        trie = cls(k)
+        for nilai, jumlah in pasangan:
+            trie.tambah(nilai, jumlah)
+        return trie
+
+    def tambah(self, nilai, n=1):
+        """Menambah `n` kemunculan sebuah jurusan."""
+        nilai = _rapikan(nilai)
+        if not nilai:
+            return
+        kunci = nilai.casefold()
+
+        ejaan = self.ejaan.setdefault(kunci, {})
+        ejaan[nilai] = ejaan.get(nilai, 0) + n
+        kanonik = self.kanonik.get(kunci)
+        if kanonik is None or ejaan[nilai] > ejaan[kanonik]:
+            self.kanonik[kunci] = nilai
+
+        frek = self.frekuensi.get(kunci, 0) + n
+        self.frekuensi[kunci] = frek
+
+        awal_kata = [0] + [i + 1 for i, c in enumerate(kunci) if c == " "]
+        for awal in awal_kata:
+            simpul = self.akar
+            self._perbarui(simpul, kunci, frek)
+            for c in kunci[awal:]:
+                berikut = simpul.anak.get(c)
+                if berikut is None:
+                    berikut = simpul.anak[c] = _Simpul()
+                simpul = berikut
+                self._perbarui(simpul, kunci, frek)
+
+    def _perbarui(self, simpul, kunci, frek):
+        teratas = simpul.teratas
+        for entri in teratas:
+            if entri[1] == kunci:
+                entri[0] = frek
+                break
+        else:
+            if len(teratas) < self.k:
+                teratas.append([frek, kunci])
+            elif frek > teratas[-1][0]:
+                teratas[-1] = [frek, kunci]
+            else:
+                return
+        teratas.sort(key=lambda e: (-e[0], e[1]))
+
+    def saran(self, prefix, batas=8):
+        """Jurusan kanonik yang diawali `prefix` (atau salah satu katanya), terpopuler dulu."""
+        simpul = self.akar
+        for c in _rapikan(prefix).casefold():
+            simpul = simpul.anak.get(c)
+            if simpul is None:
+                return []
+        return [self.kanonik[kunci] for _, kunci in simpul.teratas[:batas]]
+
+    def kanonikkan(self, nilai):
+        """Bentuk kanonik sebuah jurusan jika sudah dikenal, jika tidak nilai yang dirapikan."""
+        nilai = _rapikan(nilai)
+        return self.kanonik.get(nilai.casefold(), nilai)
@@ -1,8 +1,10 @@
 import tkinter as tk
 from tkinter import messagebox
-import datetime
 import logging
-import re
+import os
+
+from berkas_bersama import tambah_ke_berkas
+from cache_widget import CacheWidget
 
 # Logging setup
 logging.basicConfig(
@@ -23,11 +25,18 @@ class appBio(tk.Tk):
 
         self.frame_aktif = None
 
+        # Cache state widget agar hover/validasi tidak mengirim config() yang sama berulang
+        self.cache_widget = CacheWidget()
+
         # Temporary Database
         self.users_db = {
             "admin": "123",
             "mhs1": "12345"
         }
+        self.current_user = None
+        # Login, validasi dan penyimpanan record ada di BiodataService (lihat property layanan)
+        self._layanan = None
+        self.data_terakhir = None
 
         # Make display
         self._buat_tampilan_login()
@@ -41,99 +50,83 @@ class appBio(tk.Tk):
 
         logging.info("Aplikasi Dimulai")
 
+    @property
+    def layanan(self):
+        if self._layanan is None:
+            from layanan_biodata import BiodataService
+
+            self._layanan = BiodataService(os.getcwd(), users=self.users_db)
+        return self._layanan
+
+    def _nilai_form(self):
+        nilai = {field: var.get() for field, var in self.var_form.items()}
+        nilai["alamat"] = self.text_alamat.get("1.0", "end-1c")
+        return nilai
+
     def submit_data(self):
+        from layanan_biodata import GagalValidasi
+
         try:
             if self.var_setuju.get() == 0:
                 messagebox.showwarning("Peringatan", "Anda harus menyetujui pengumpulan data!")
                 return
 
-            # get data from form
-            nama = self.entry_nama.get()
-            nim = self.entry_nim.get()
-            jurusan = self.entry_jurusan.get()
-            alamat = self.text_alamat.get("1.0", tk.END).strip()
-            jenis_kelamin = self.var_jk.get()
-            email = self.var_email.get().strip()
-            telepon = self.var_telepon.get().strip()
-            tgl_lahir = self.var_tanggal_lahir.get().strip()
-
             # Validasi
-            if not nama or not nim or not jurusan or not alamat:
-                messagebox.showwarning("Input Kosong", "Semua field harus diisi!")
-                return
-            if not nim.isdigit() or len(nim) < 8:
-                messagebox.showwarning("Format NIM salah", "NIM harus berupa angka minimal 8")
-                self.entry_nim.focus_set()
-                return
-            if nama.isdigit():
-                messagebox.showwarning("Format Nama salah", "Nama tidak boleh hanya angka!")
-                self.entry_nama.focus_set()
-                return
-            if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
-                messagebox.showwarning("Format Email salah", "Masukkan email yang valid!")
-                self.entry_email.focus_set()
-                return
-            if not (telepon.isdigit() and telepon.startswith("08") and 10 <= len(telepon) <= 13):
-                messagebox.showwarning("Format Telepon salah", "Telepon harus angka 10-13 digit dan mulai dengan 08")
-                self.entry_telepon.focus_set()
-                return
             try:
-                datetime.datetime.strptime(tgl_lahir, "%d-%m-%Y")
-            except ValueError:
-                messagebox.showwarning("Format Tanggal salah", "Gunakan format DD-MM-YYYY untuk Tanggal Lahir")
-                self.entry_tanggal_lahir.focus_set()
+                record = self.layanan.submit(self._nilai_form())
+            except GagalValidasi as e:
+                messagebox.showwarning(e.judul, e.pesan)
+                entry = {
+                    "nama": self.entry_nama,
+                    "nim": self.entry_nim,
+                    "jurusan": self.entry_jurusan,
+                    "email": self.entry_email,
+                    "telepon": self.entry_telepon,
+                    "tgl_lahir": self.entry_tanggal_lahir,
+                }.get(e.field)
+                if entry is not None:
+                    entry.focus_set()
                 return
 
             # Hasil
-            hasil = (
-                f"Nama: {nama}\n"
-                f"NIM: {nim}\n"
-                f"Jurusan: {jurusan}\n"
-                f"Alamat: {alamat}\n"
-                f"Jenis Kelamin: {jenis_kelamin}\n"
-                f"Email: {email}\n"
-                f"Telepon: {telepon}\n"
-                f"Tanggal Lahir: {tgl_lahir}"
-            )
+            hasil = self.layanan.format_hasil(record, self.current_user)
             messagebox.showinfo("Data tersimpan", hasil)
             logging.info(f"Data submitted by user: {self.current_user}")
 
-            hasil_lengkap = (
-                f"Nama : {nama}\nNIM : {nim}\nJurusan : {jurusan}\nAlamat : {alamat}\n"
-                f"Jenis kelamin : {jenis_kelamin}\nEmail : {email}\nTelepon : {telepon}\nTanggal lahir : {tgl_lahir}"
-            )
-            self.label_hasil.config(text=f"BIODATA TERSIMPAN :\n\n{hasil_lengkap}")
+            self.data_terakhir = record
+            self.label_hasil.config(text=hasil)
             self._simpan_hasil()
         except Exception as e:
             logging.error(f"Error in submit_data by {self.current_user}: {str(e)}")
             messagebox.showerror("Error", f"Terjadi kesalahan saat memproses data:\n{str(e)}")
 
     def validate_form(self, *args):
-        nama_valid = self.var_nama.get().strip() != ""
-        nim_valid = self.var_nim.get().strip() != ""
-        jurusan_valid = self.var_jurusan.get().strip() != ""
+        from layanan_biodata import FIELD_WAJIB
+
+        wajib_valid = all(self.var_form[f].get().strip() for f in FIELD_WAJIB)
         setuju_valid = self.var_setuju.get() == 1
 
-        if nama_valid and nim_valid and jurusan_valid and setuju_valid:
-            self.btn_submit.config(state=tk.NORMAL)
+        if wajib_valid and setuju_valid:
+            self.cache_widget.atur(self.btn_submit, state=tk.NORMAL)
         else:
-            self.btn_submit.config(state=tk.DISABLED)
+            self.cache_widget.atur(self.btn_submit, state=tk.DISABLED)
 
     # Event handlers
     def on_enter(self, event):
-        if self.btn_submit['state'] == tk.NORMAL:
-            self.btn_submit.config(bg="lightblue")
+        if self.cache_widget.baca(self.btn_submit, 'state') == tk.NORMAL:
+            self.cache_widget.atur(self.btn_submit, bg="lightblue")
 
     def on_leave(self, event):
-        self.btn_submit.config(bg="SystemButtonFace")
+        self.cache_widget.atur(self.btn_submit, bg="SystemButtonFace")
 
     def submit_shortcut(self, event=None):
-        if self.btn_submit['state'] == tk.NORMAL:
+        if self.cache_widget.baca(self.btn_submit, 'state') == tk.NORMAL:
             self.submit_data()
 
     def add_hover(self, button, color_hover, color_normal):
-        button.bind("<Enter>", lambda e: button.config(bg=color_hover))
-        button.bind("<Leave>", lambda e: button.config(bg=color_normal))
+        self.cache_widget.daftarkan(button, bg=color_normal)
+        button.bind("<Enter>", lambda e: self.cache_widget.atur(button, bg=color_hover))
+        button.bind("<Leave>", lambda e: self.cache_widget.atur(button, bg=color_normal))
 
     # Widget
     def _buat_tampilan_biodata(self):
@@ -146,6 +139,16 @@ class appBio(tk.Tk):
         self.var_email = tk.StringVar()
         self.var_telepon = tk.StringVar()
         self.var_tanggal_lahir = tk.StringVar()
+        # Field form -> variabel, dengan kunci yang sama dengan record BiodataService
+        self.var_form = {
+            "nama": self.var_nama,
+            "nim": self.var_nim,
+            "jurusan": self.var_jurusan,
+            "email": self.var_email,
+            "telepon": self.var_telepon,
+            "tgl_lahir": self.var_tanggal_lahir,
+            "jenis_kelamin": self.var_jk,
+        }
 
         self.frame_biodata = tk.Frame(master=self, padx=20, pady=20, bg="oldlace")
         self.frame_biodata.columnconfigure(1, weight=1)
@@ -153,6 +156,8 @@ class appBio(tk.Tk):
         self.var_nama.trace_add("write", self.validate_form)
         self.var_nim.trace_add("write", self.validate_form)
         self.var_jurusan.trace_add("write", self.validate_form)
+        self.var_email.trace_add("write", self.validate_form)
+        self.var_telepon.trace_add("write", self.validate_form)
 
         self.label_judul = tk.Label(
             master=self.frame_biodata,
@@ -221,6 +226,7 @@ class appBio(tk.Tk):
             state=tk.DISABLED,
             bg="beige"
         )
+        self.cache_widget.daftarkan(self.btn_submit, state=tk.DISABLED)
 
         self.btn_reset = tk.Button(
             master=self.frame_biodata,
@@ -327,32 +333,34 @@ class appBio(tk.Tk):
         self.frame_aktif.pack(fill=tk.BOTH, expand=True)
 
     def _coba_login(self):
+        from layanan_biodata import GagalLogin, GagalValidasi
+
         username = self.entry_username.get().strip()
         password = self.entry_password.get()
         logging.info(f"Login attempt for username: {username}")
 
-        if not username or not password:
-            messagebox.showwarning("Login gagal!", "Username dan password tidak boleh kosong")
-            return
-        if len(username) < 3:
-            messagebox.showwarning("Login gagal!", "Username minimal 3 karakter")
+        try:
+            self.layanan.login(username, password)
+        except GagalValidasi as e:
+            messagebox.showwarning(e.judul, e.pesan)
             return
-        if username in self.users_db and self.users_db[username] == password:
-            self.current_user = username
-            messagebox.showinfo("Login berhasil", f"Selamat datang, {username}")
-            if self.var_remember.get() == 1:
-                with open("remember_me.txt", "w", encoding="utf-8") as f:
-                    f.write(username)
-            else:
-                open("remember_me.txt", "w").close()
-            self._reset_form_biodata()
-            self._update_title_with_user()
-            self._buat_menu()
-            self._pindah_ke(self.frame_biodata)
-        else:
-            messagebox.showerror("Login gagal", "Username atau password salah")
+        except GagalLogin as e:
+            messagebox.showerror(e.judul, e.pesan)
             self.entry_username.delete(0, tk.END)
             self.entry_username.focus_set()
+            return
+
+        self.current_user = username
+        messagebox.showinfo("Login berhasil", f"Selamat datang, {username}")
+        if self.var_remember.get() == 1:
+            with open("remember_me.txt", "w", encoding="utf-8") as f:
+                f.write(username)
+        else:
+            open("remember_me.txt", "w").close()
+        self._reset_form_biodata()
+        self._update_title_with_user()
+        self._buat_menu()
+        self._pindah_ke(self.frame_biodata)
 
     def _reset_form_biodata(self):
         self.var_nama.set("")
@@ -365,6 +373,7 @@ class appBio(tk.Tk):
         self.var_telepon.set("")
         self.var_tanggal_lahir.set("")
         self.label_hasil.config(text="")
+        self.data_terakhir = None
 
     def _update_title_with_user(self):
         if self.current_user:
@@ -374,6 +383,8 @@ class appBio(tk.Tk):
 
     def _logout(self):
         if messagebox.askyesno("Logout", f"Apakah {self.current_user} yakin ingin keluar?"):
+            logging.info(self.cache_widget.ringkasan())
+            self.cache_widget.reset_statistik()
             self.current_user = None
             self._hapus_menu()
             self._update_title_with_user()
@@ -395,9 +406,10 @@ class appBio(tk.Tk):
 
     def _simpan_hasil(self):
         try:
-            with open("simpan_biodata.txt", "a", encoding="utf-8") as f:
-                f.write(self.label_hasil.cget("text"))
-                f.write("\n" + "="*40 + "\n")
+            # Record ke record store lewat service, lalu salinan teksnya ke file bersama
+            self.layanan.save(self.data_terakhir, self.current_user, tulis_file=False)
+            # Satu penulisan ber-lock per record agar tidak bercampur dengan meja lain
+            tambah_ke_berkas("simpan_biodata.txt", self.label_hasil.cget("text") + "\n" + "="*40 + "\n")
             logging.info(f"Hasil biodata disimpan oleh {self.current_user}")
         except Exception as e:
             logging.error(f"Gagal menyimpan hasil oleh {self.current_user}: {str(e)}")
@@ -406,6 +418,9 @@ class appBio(tk.Tk):
     def keluar_aplikasi(self):
         if messagebox.askokcancel("Keluar", "Apakah anda yakin ingin keluar?"):
             logging.info("Aplikasi ditutup oleh user")
+            logging.info(self.cache_widget.ringkasan())
+            if self._layanan is not None:
+                self._layanan.tutup()
             self.destroy()
 
 if __name__ == "__main__":